@@ -0,0 +1,15 @@
+"""
+In-process caches
+"""
+
+from .prefs import get_investment_preferences, get_risk_parameters, prefs_cache
+from .snapshots import cached_market_summary, cached_portfolio_state, invalidate_portfolio_state
+
+__all__ = [
+    "get_investment_preferences",
+    "get_risk_parameters",
+    "prefs_cache",
+    "cached_market_summary",
+    "cached_portfolio_state",
+    "invalidate_portfolio_state",
+]
@@ -0,0 +1,100 @@
+"""
+Config Row Cache
+Caches the singleton InvestmentPreference / RiskParameter rows, which are
+read on every trading decision but change rarely
+"""
+
+import logging
+import time
+from types import SimpleNamespace
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import InvestmentPreference, RiskParameter
+
+logger = logging.getLogger(__name__)
+
+# How long a cached row is trusted; bounds staleness for writes that
+# bypass the ORM (raw SQL, another process)
+PREFS_CACHE_TTL_SECONDS = 60.0
+
+
+class PrefsCache:
+    """
+    TTL cache of config rows, keyed by model class
+
+    Rows are stored as plain column dicts (not ORM instances) so a cached
+    value never touches a closed session. Any ORM insert/update/delete of
+    a cached model clears the cache.
+    """
+
+    def __init__(self, ttl: float = PREFS_CACHE_TTL_SECONDS):
+        self.ttl = ttl
+        # model -> (column dict or None if no row exists, time.monotonic() when loaded)
+        self._entries: Dict[type, Tuple[Optional[Dict], float]] = {}
+
+    async def load(self, db: AsyncSession, model: type) -> Optional[Dict]:
+        """Return the first row of `model` as a dict, reading the DB only on a miss"""
+        entry = self._entries.get(model)
+        if entry is not None and time.monotonic() - entry[1] < self.ttl:
+            return entry[0]
+
+        result = await db.execute(select(model).limit(1))
+        row = result.scalar_one_or_none()
+        values = None
+        if row is not None:
+            values = {attr.key: getattr(row, attr.key) for attr in inspect(model).column_attrs}
+        self._entries[model] = (values, time.monotonic())
+        return values
+
+    def clear(self):
+        """Drop all cached rows"""
+        self._entries.clear()
+
+
+# Shared by all callers in this process
+prefs_cache = PrefsCache()
+
+
+def _clear_prefs_cache(mapper, connection, target):
+    prefs_cache.clear()
+
+
+for _model in (InvestmentPreference, RiskParameter):
+    for _event_name in ("after_insert", "after_update", "after_delete"):
+        event.listen(_model, _event_name, _clear_prefs_cache)
+
+
+def _as_namespace(values: Optional[Dict]) -> Optional[SimpleNamespace]:
+    # A fresh copy per call, so callers can't mutate the cached dict
+    return SimpleNamespace(**values) if values is not None else None
+
+
+async def get_investment_preferences(db: AsyncSession) -> Optional[SimpleNamespace]:
+    """
+    Get the user's investment preferences
+
+    Args:
+        db: Database session (used only on a cache miss)
+
+    Returns:
+        Snapshot with the InvestmentPreference columns as
+        attributes, or None if no preferences are saved
+    """
+    return _as_namespace(await prefs_cache.load(db, InvestmentPreference))
+
+
+async def get_risk_parameters(db: AsyncSession) -> Optional[SimpleNamespace]:
+    """
+    Get the configured risk parameters
+
+    Args:
+        db: Database session (used only on a cache miss)
+
+    Returns:
+        Snapshot with the RiskParameter columns as attributes, or None
+        if no parameters are saved
+    """
+    return _as_namespace(await prefs_cache.load(db, RiskParameter))
@@ -0,0 +1,70 @@
+"""
+Portfolio / Market Snapshot Cache
+Short-lived, process-wide cache of the portfolio state and market summary
+so consecutive chat turns don't repeat identical broker and scraper calls
+"""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+# How long each snapshot is reused
+PORTFOLIO_STATE_TTL_SECONDS = 10.0
+MARKET_SUMMARY_TTL_SECONDS = 60.0
+
+# key -> (time.monotonic() when fetched, value)
+_entries: Dict[str, Tuple[float, Dict]] = {}
+
+# One lock per key: concurrent callers share a single fetch, while the
+# portfolio and market fetches still run in parallel with each other
+_locks: Dict[str, asyncio.Lock] = {
+    'portfolio_state': asyncio.Lock(),
+    'market_summary': asyncio.Lock(),
+}
+
+
+async def _cached(key: str, ttl: float, fetch: Callable[[], Awaitable[Dict]]) -> Dict:
+    async with _locks[key]:
+        entry = _entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+
+        value = await fetch()
+        # Don't pin a failed fetch for the whole TTL
+        if 'error' not in value:
+            _entries[key] = (time.monotonic(), value)
+        return value
+
+
+async def cached_portfolio_state(portfolio) -> Dict:
+    """
+    Get the portfolio state, reusing a fetch from the last few seconds
+
+    Args:
+        portfolio: PortfolioManager used on a cache miss
+
+    Returns:
+        Portfolio state dictionary (see PortfolioManager.get_current_state)
+    """
+    return await _cached('portfolio_state', PORTFOLIO_STATE_TTL_SECONDS, portfolio.get_current_state)
+
+
+async def cached_market_summary(market_data) -> Dict:
+    """
+    Get the market summary, reusing a fetch from the last minute
+
+    Args:
+        market_data: MarketDataService used on a cache miss
+
+    Returns:
+        Market summary dictionary (see MarketDataService.get_market_summary)
+    """
+    return await _cached('market_summary', MARKET_SUMMARY_TTL_SECONDS, market_data.get_market_summary)
+
+
+def invalidate_portfolio_state():
+    """Drop the cached portfolio state (call after an order is placed)"""
+    _entries.pop('portfolio_state', None)
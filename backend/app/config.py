@@ -2,20 +2,35 @@
 Configuration Management
 """
 
-from pydantic_settings import BaseSettings
-from typing import Optional, List
+import os
+from functools import lru_cache
+from pydantic import field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from sqlalchemy.engine import make_url
+from typing import Optional, List, Union
 from pathlib import Path
 
 
-# Get project root directory (2 levels up from this file)
-PROJECT_ROOT = Path(__file__).parent.parent.parent.resolve()
+# Get project root directory (2 levels up from this file), resolved once as a plain str
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+PROJECT_ROOT = Path(_ROOT)
+ENV_FILE = os.path.join(_ROOT, ".env")
+
+# Field defaults evaluated once at import
+_DEFAULT_DB_URL = f"sqlite+aiosqlite:///{_ROOT}/data/trading_bot.db"
+_DEFAULT_CORS_ORIGINS = (
+    "http://localhost:5173",
+    "http://localhost:3000",
+    "https://stocking.daechanserver.com",
+    "http://stocking.daechanserver.com",
+)
 
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables"""
 
     # Database
-    database_url: str = f"sqlite+aiosqlite:///{PROJECT_ROOT}/data/trading_bot.db"
+    database_url: str = _DEFAULT_DB_URL
 
     # API Configuration
     korea_investment_api_key: Optional[str] = None
@@ -44,20 +59,57 @@ class Settings(BaseSettings):
     daily_loss_limit_pct: int = 20
     stop_loss_pct: int = 30
 
-    # CORS Origins (comma-separated string from env, converted to list)
+    # CORS Origins (comma-separated string from env, parsed once into a list)
     # Set to "*" to allow all origins, or specify your domain
-    cors_origins: str = "http://localhost:5173,http://localhost:3000,https://stocking.daechanserver.com,http://stocking.daechanserver.com"
+    # The str member keeps pydantic-settings from JSON-decoding the raw env value
+    cors_origins: Union[List[str], str] = list(_DEFAULT_CORS_ORIGINS)
+
+    @field_validator("cors_origins", mode="before")
+    @classmethod
+    def _parse_cors_origins(cls, value):
+        """Split a comma-separated CORS origins string into a list"""
+        if isinstance(value, str):
+            return [origin.strip() for origin in value.split(",")]
+        return value
 
     @property
-    def cors_origins_list(self) -> List[str]:
-        """Convert CORS origins string to list"""
-        return [origin.strip() for origin in self.cors_origins.split(",")]
+    def sqlite_db_path(self) -> Optional[Path]:
+        """Database file named by database_url (None when it isn't a SQLite file)"""
+        url = make_url(self.database_url)
+        if url.get_backend_name() != "sqlite" or url.database in (None, "", ":memory:"):
+            return None
+        return Path(url.database)
+
+    model_config = SettingsConfigDict(
+        env_file=ENV_FILE,
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+    )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the process-wide settings instance (built once, then cached)"""
+    return Settings()
+
+
+def reload_settings() -> Settings:
+    """
+    Re-read the environment and .env into the cached settings instance
+
+    Updated in place rather than via get_settings.cache_clear(), so services
+    and modules that already hold the instance see the new values too.
 
-    class Config:
-        env_file = str(PROJECT_ROOT / ".env")
-        env_file_encoding = "utf-8"
-        case_sensitive = False
+    Returns:
+        The (same) cached settings instance
+    """
+    current = get_settings()
+    fresh = Settings()
+    for name in Settings.model_fields:
+        setattr(current, name, getattr(fresh, name))
+    return current
 
 
 # Global settings instance
-settings = Settings()
+settings = get_settings()
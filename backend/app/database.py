@@ -2,22 +2,46 @@
 Database connection and session management
 """
 
+import asyncio
+
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
-from sqlalchemy.pool import StaticPool
-import os
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from .config import get_settings
+
+# Database URL (DATABASE_URL env var is read by Settings, defaulting to PROJECT_ROOT/data)
+DATABASE_URL = get_settings().database_url
 
-# Database URL
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./data/trading_bot.db")
+# Connections kept open in the pool (also how many are opened at startup)
+POOL_SIZE = 20
 
-# Create async engine
+# Create async engine (pooled connections so coroutines don't share one connection)
 engine = create_async_engine(
     DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
+    poolclass=AsyncAdaptedQueuePool,  # aiosqlite would otherwise default to NullPool
+    pool_size=POOL_SIZE,
+    max_overflow=10,  # burst headroom for concurrent function calls
+    pool_timeout=5,  # fail fast instead of queueing requests behind an exhausted pool
+    pool_pre_ping=True,  # drop connections that died while idle
+    pool_recycle=1800,
+    query_cache_size=1200,  # compiled SQL cache (default 500) for the many small repeated lookups
     echo=False,  # Set to True for SQL query logging
 )
 
+
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Enable WAL so readers don't block on the writer"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
+
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -39,10 +63,7 @@ async def get_db() -> AsyncSession:
         AsyncSession: Database session
     """
     async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
 
 
 async def init_db():
@@ -57,3 +78,54 @@ async def init_db():
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        if engine.dialect.name == "postgresql":
+            await _create_hypertables(conn)
+
+
+async def warm_pool(size: int = POOL_SIZE):
+    """
+    Open `size` pooled connections at startup so early requests don't pay
+    for connecting (and the per-connection PRAGMA setup)
+
+    Args:
+        size: Number of connections to open and return to the pool
+    """
+    from sqlalchemy import text
+
+    async def _open_one():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_open_one() for _ in range(size)))
+
+
+async def _create_hypertables(conn):
+    """
+    Partition time-series tables by day when TimescaleDB is installed
+
+    Queries for the latest bars only touch the newest chunk; chunks older
+    than 7 days are compressed.
+    """
+    from sqlalchemy import text
+
+    result = await conn.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'timescaledb'"))
+    if result.scalar() is None:
+        return
+
+    await conn.execute(text(
+        "SELECT create_hypertable('ohlcv', 'timestamp', "
+        "chunk_time_interval => INTERVAL '1 day', if_not_exists => TRUE, migrate_data => TRUE)"
+    ))
+    result = await conn.execute(text(
+        "SELECT compression_enabled FROM timescaledb_information.hypertables "
+        "WHERE hypertable_name = 'ohlcv'"
+    ))
+    if not result.scalar():
+        await conn.execute(text(
+            "ALTER TABLE ohlcv SET (timescaledb.compress, "
+            "timescaledb.compress_segmentby = 'ticker, timeframe', "
+            "timescaledb.compress_orderby = 'timestamp DESC')"
+        ))
+        await conn.execute(text(
+            "SELECT add_compression_policy('ohlcv', INTERVAL '7 days', if_not_exists => TRUE)"
+        ))
@@ -3,129 +3,103 @@ Dependency Injection
 FastAPI dependencies for services
 """
 
-from typing import AsyncGenerator
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from .database import AsyncSessionLocal
-from .config import Settings
-from .services.broker_service import BrokerService
-from .services.portfolio_manager import PortfolioManager
-from .services.signal_aggregator import SignalAggregator
-from .services.wsb_scraper import WSBScraper
-from .services.yahoo_finance_service import YahooFinanceService
-from .services.tipranks_service import TipRanksService
-from .services.risk_manager import RiskManager
-from .services.gemini_service import GeminiService
-from .services.trading_engine import TradingEngine
-from .services.scheduler_service import SchedulerService
-from .services.market_data_scheduler import MarketDataScheduler
-from .gemini_functions.function_handlers import FunctionHandler
-
-# Global service instances (initialized on startup)
-_broker_service = None
-_portfolio_manager = None
-_signal_aggregator = None
-_risk_manager = None
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from .database import get_db, AsyncSessionLocal
+from .config import Settings, get_settings
+
+if TYPE_CHECKING:
+    from .services.broker_service import BrokerService
+    from .services.portfolio_manager import PortfolioManager
+    from .services.signal_aggregator import SignalAggregator
+    from .services.risk_manager import RiskManager
+    from .services.gemini_service import GeminiService
+    from .services.trading_engine import TradingEngine
+    from .services.scheduler_service import SchedulerService
+    from .services.market_data_scheduler import MarketDataScheduler
+    from .services.market_data_service import MarketDataService
+    from .services.encryption_service import EncryptionService
+    from .gemini_functions.function_handlers import FunctionHandler
+
+# Placeholder service instances (require a per-request db session)
 _gemini_service = None
-_function_handler = None
 _trading_engine = None
 _scheduler_service = None
-_market_data_scheduler = None
-_settings = None
 
 
 def init_services(settings: Settings):
     """
     Initialize all services (called on app startup)
 
+    Warms the cached factories so the first request doesn't pay for construction.
+
     Args:
         settings: Application settings
     """
-    global _broker_service, _portfolio_manager, _signal_aggregator
-    global _risk_manager, _gemini_service, _function_handler
-    global _trading_engine, _scheduler_service, _settings
-
-    _settings = settings
-
-    # Initialize broker
-    _broker_service = BrokerService(settings)
-
-    # Initialize portfolio manager (without db for now)
-    _portfolio_manager = PortfolioManager(_broker_service, settings)
-
-    # Initialize signal services
-    wsb_scraper = WSBScraper(settings)
-    yahoo_service = YahooFinanceService()
-    tipranks_service = TipRanksService()
-    _signal_aggregator = SignalAggregator(wsb_scraper, yahoo_service, tipranks_service)
-
-    # Initialize risk manager
-    _risk_manager = RiskManager(_portfolio_manager, _broker_service, settings)
+    get_broker_service()
+    get_market_data_service()
+    get_encryption_service()
+    get_portfolio_manager()
+    get_signal_aggregator()
+    get_risk_manager()
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Get database session"""
-    async with AsyncSessionLocal() as session:
-        yield session
+@lru_cache(maxsize=1)
+def get_broker_service() -> "BrokerService":
+    """Get broker service instance"""
+    from .services.broker_service import BrokerService
+    return BrokerService(get_settings())
 
 
-async def get_settings() -> Settings:
-    """Get application settings"""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+@lru_cache(maxsize=1)
+def get_market_data_service() -> "MarketDataService":
+    """Get market data service instance (shared so its response cache survives requests)"""
+    from .services.market_data_service import MarketDataService
+    return MarketDataService(get_settings())
 
 
-async def get_broker_service() -> BrokerService:
-    """Get broker service instance"""
-    global _broker_service
-    if _broker_service is None:
-        settings = await get_settings()
-        _broker_service = BrokerService(settings)
-    return _broker_service
+@lru_cache(maxsize=1)
+def get_encryption_service() -> "EncryptionService":
+    """Get encryption service instance (key file is read once)"""
+    from .services.encryption_service import EncryptionService
+    return EncryptionService()
 
 
-async def get_portfolio_manager() -> PortfolioManager:
-    """Get portfolio manager instance"""
-    global _portfolio_manager
-    if _portfolio_manager is None:
-        broker = await get_broker_service()
-        settings = await get_settings()
-        _portfolio_manager = PortfolioManager(broker, settings)
-    return _portfolio_manager
+@lru_cache(maxsize=1)
+def get_portfolio_manager() -> "PortfolioManager":
+    """Get portfolio manager instance (without db)"""
+    from .services.portfolio_manager import PortfolioManager
+    return PortfolioManager(get_broker_service(), get_settings())
 
 
-async def get_signal_aggregator() -> SignalAggregator:
+@lru_cache(maxsize=1)
+def get_signal_aggregator() -> "SignalAggregator":
     """Get signal aggregator instance"""
-    global _signal_aggregator
-    if _signal_aggregator is None:
-        settings = await get_settings()
-        wsb_scraper = WSBScraper(settings)
-        yahoo_service = YahooFinanceService()
-        tipranks_service = TipRanksService()
-        _signal_aggregator = SignalAggregator(wsb_scraper, yahoo_service, tipranks_service)
-    return _signal_aggregator
+    from .services.signal_aggregator import SignalAggregator
+    from .services.wsb_scraper import WSBScraper
+    from .services.yahoo_finance_service import YahooFinanceService
+    from .services.tipranks_service import TipRanksService
+    wsb_scraper = WSBScraper(get_settings())
+    yahoo_service = YahooFinanceService()
+    tipranks_service = TipRanksService()
+    return SignalAggregator(wsb_scraper, yahoo_service, tipranks_service)
 
 
-async def get_risk_manager() -> RiskManager:
+@lru_cache(maxsize=1)
+def get_risk_manager() -> "RiskManager":
     """Get risk manager instance"""
-    global _risk_manager
-    if _risk_manager is None:
-        portfolio = await get_portfolio_manager()
-        broker = await get_broker_service()
-        settings = await get_settings()
-        _risk_manager = RiskManager(portfolio, broker, settings)
-    return _risk_manager
+    from .services.risk_manager import RiskManager
+    return RiskManager(get_portfolio_manager(), get_broker_service(), get_settings())
 
 
-def get_function_handler() -> FunctionHandler:
+def get_function_handler() -> "FunctionHandler":
     """Get function handler instance (requires db session)"""
     # This is called with db session in routes
     pass
 
 
-async def get_gemini_service() -> GeminiService:
+def get_gemini_service() -> "GeminiService":
     """Get Gemini service instance"""
     global _gemini_service
     if _gemini_service is None:
@@ -135,7 +109,7 @@ async def get_gemini_service() -> GeminiService:
     return _gemini_service
 
 
-async def get_trading_engine() -> TradingEngine:
+def get_trading_engine() -> "TradingEngine":
     """Get trading engine instance"""
     global _trading_engine
     if _trading_engine is None:
@@ -144,7 +118,7 @@ async def get_trading_engine() -> TradingEngine:
     return _trading_engine
 
 
-async def get_scheduler_service() -> SchedulerService:
+def get_scheduler_service() -> "SchedulerService":
     """Get scheduler service instance"""
     global _scheduler_service
     if _scheduler_service is None:
@@ -153,10 +127,8 @@ async def get_scheduler_service() -> SchedulerService:
     return _scheduler_service
 
 
-async def get_market_data_scheduler() -> MarketDataScheduler:
+@lru_cache(maxsize=1)
+def get_market_data_scheduler() -> "MarketDataScheduler":
     """Get market data scheduler instance"""
-    global _market_data_scheduler
-    if _market_data_scheduler is None:
-        settings = await get_settings()
-        _market_data_scheduler = MarketDataScheduler(settings)
-    return _market_data_scheduler
+    from .services.market_data_scheduler import MarketDataScheduler
+    return MarketDataScheduler(get_settings())
@@ -2,7 +2,18 @@
 Gemini Function Calling Module
 """
 
-from .function_definitions import TRADING_FUNCTIONS
+from .function_definitions import (
+    TRADING_FUNCTIONS,
+    TRADING_FUNCTIONS_JSON,
+    TRADING_TOOL,
+    get_trading_functions,
+)
 from .function_handlers import FunctionHandler
 
-__all__ = ['TRADING_FUNCTIONS', 'FunctionHandler']
+__all__ = [
+    'TRADING_FUNCTIONS',
+    'TRADING_FUNCTIONS_JSON',
+    'TRADING_TOOL',
+    'get_trading_functions',
+    'FunctionHandler',
+]
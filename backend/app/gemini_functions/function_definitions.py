@@ -3,10 +3,17 @@ Gemini Function Definitions
 8 trading functions for Gemini AI function calling
 """
 
-from typing import List, Dict
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Literal, Mapping, Optional, Tuple
+
+import orjson
+from pydantic import TypeAdapter, create_model
+from google.generativeai.types import FunctionDeclaration, Tool
 
 # Function schemas for Gemini function calling
-TRADING_FUNCTIONS: List[Dict] = [
+_TRADING_FUNCTION_DEFS: List[Dict] = [
     {
         "name": "check_balance",
         "description": "Get current account balance including cash and total asset value",
@@ -122,16 +129,108 @@ TRADING_FUNCTIONS: List[Dict] = [
     },
     {
         "name": "get_trading_history",
-        "description": "Get recent trading history to understand past decisions and performance",
+        "description": "Get recent trading history to understand past decisions and performance. Trades come newest first, one page per call; total_trades counts the whole days_back window and next_cursor fetches the next page",
         "parameters": {
             "type": "object",
             "properties": {
                 "days_back": {
                     "type": "integer",
                     "description": "Number of days to look back for trading history (default: 7)"
+                },
+                "cursor": {
+                    "type": "string",
+                    "description": "next_cursor from a previous call to fetch the next (older) page"
+                },
+                "page_size": {
+                    "type": "integer",
+                    "description": "Maximum number of trades to return (default: 100, max: 500)"
                 }
             },
             "required": []
         }
     }
 ]
+
+# Intern function names so dispatch-table lookups can match by identity
+for _func_def in _TRADING_FUNCTION_DEFS:
+    _func_def["name"] = sys.intern(_func_def["name"])
+
+# Frozen, shareable view of the schemas (built once at import).
+# Nested "parameters" stay plain dicts because the Gemini SDK expects dicts there.
+TRADING_FUNCTIONS: Tuple[Mapping, ...] = tuple(
+    MappingProxyType(func_def) for func_def in _TRADING_FUNCTION_DEFS
+)
+
+FUNCTION_NAMES: Tuple[str, ...] = tuple(func_def["name"] for func_def in TRADING_FUNCTIONS)
+
+_FUNCTIONS_BY_NAME: Dict[str, Mapping] = {
+    func_def["name"]: func_def for func_def in TRADING_FUNCTIONS
+}
+
+
+@lru_cache(maxsize=8)
+def get_trading_functions(allowed: FrozenSet[str]) -> Tuple[Mapping, ...]:
+    """
+    Get the subset of function schemas whose names are in ``allowed``
+
+    Results are cached per name set and keep the definition order.
+
+    Args:
+        allowed: Function names to expose (e.g. without execute_trade for read-only mode)
+
+    Returns:
+        Tuple of frozen function schemas
+    """
+    return tuple(f for name, f in _FUNCTIONS_BY_NAME.items() if name in allowed)
+
+
+# JSON-schema type -> Python type for argument validation
+_JSON_SCHEMA_TYPES = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+}
+
+
+def _build_arg_validator(func_def: Mapping) -> TypeAdapter:
+    """
+    Build a pydantic validator for a function's "parameters" schema
+
+    Args:
+        func_def: Function schema
+
+    Returns:
+        TypeAdapter validating the argument dict into a model
+    """
+    parameters = func_def["parameters"]
+    required = set(parameters.get("required", []))
+    fields = {}
+
+    for arg_name, prop in parameters["properties"].items():
+        if "enum" in prop:
+            arg_type = Literal[tuple(prop["enum"])]
+        else:
+            arg_type = _JSON_SCHEMA_TYPES[prop["type"]]
+
+        if arg_name in required:
+            fields[arg_name] = (arg_type, ...)
+        else:
+            fields[arg_name] = (Optional[arg_type], None)
+
+    return TypeAdapter(create_model(f"{func_def['name']}_args", **fields))
+
+
+# Argument validators built once at import (pydantic-core prebuilt validators)
+ARG_VALIDATORS: Dict[str, TypeAdapter] = {
+    func_def["name"]: _build_arg_validator(func_def) for func_def in TRADING_FUNCTIONS
+}
+
+
+# Pre-serialized schemas for callers that send them over HTTP or log them
+TRADING_FUNCTIONS_JSON: bytes = orjson.dumps(_TRADING_FUNCTION_DEFS)
+
+# Gemini Tool built once so the SDK doesn't re-convert the schemas per model/request
+TRADING_TOOL: Tool = Tool(
+    function_declarations=[FunctionDeclaration(**func_def) for func_def in TRADING_FUNCTIONS]
+)
@@ -3,24 +3,127 @@ Gemini Function Handlers
 Implements the actual logic for each Gemini function call
 """
 
+import asyncio
+import functools
 import logging
-from typing import Dict, Optional, Any
+import time
+from collections import defaultdict, deque
+from typing import ClassVar, Dict, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, desc
+from sqlalchemy import select, and_, desc, func, or_
 
 from ..services.broker_service import BrokerService
 from ..services.portfolio_manager import PortfolioManager
 from ..services.signal_aggregator import SignalAggregator
 from ..services.risk_manager import RiskManager
 from ..models import Trade
+from .function_definitions import ARG_VALIDATORS, FUNCTION_NAMES
 
 logger = logging.getLogger(__name__)
 
+# Page size bounds for get_trading_history (keyset pagination on executed_at, id)
+TRADE_HISTORY_PAGE_SIZE = 100
+TRADE_HISTORY_MAX_PAGE_SIZE = 500
+
+# How long cached win/loss counts are trusted; bounds how far the
+# days_back window (which moves with the clock) and late status
+# updates on existing trades can drift before a recount
+TRADING_STATS_TTL_SECONDS = 60.0
+
+# How long a fetched quote is reused, so a price check followed by a trade
+# within the same decision hits the broker once
+PRICE_CACHE_TTL_SECONDS = 1.0
+
+# USD/KRW rate: how long a fetched rate is reused, and the fallback used
+# when no rate has been fetched successfully yet
+FX_CACHE_TTL_SECONDS = 60.0
+DEFAULT_USD_KRW_RATE = 1300.0
+
+# How long balance / portfolio snapshots are reused within one reasoning turn
+STATE_CACHE_TTL_SECONDS = 2.0
+
+
+def _handler(fn):
+    """Turn an exception raised by a handler into a logged error result"""
+    @functools.wraps(fn)
+    async def wrapper(self, *args, **kwargs):
+        try:
+            return await fn(self, *args, **kwargs)
+        except Exception as e:
+            logger.error("%s failed: %s", fn.__name__, e)
+            return _error(str(e))
+    return wrapper
+
+
+class TradingStats:
+    """
+    In-process cache of win/loss counts per history window
+
+    An entry is reused while no trade row has been added since it was
+    computed (max trade id unchanged) and it is younger than the TTL.
+    """
+
+    def __init__(self, ttl: float = TRADING_STATS_TTL_SECONDS):
+        self.ttl = ttl
+        self.lock = asyncio.Lock()
+        # days_back -> (wins, losses, max trade id, time.monotonic() when computed)
+        self._entries: Dict[int, Tuple[int, int, Optional[int], float]] = {}
+
+    def get(self, days_back: int, last_trade_id: Optional[int]) -> Optional[Tuple[int, int]]:
+        """Return cached (wins, losses) for the window, or None if stale/missing"""
+        entry = self._entries.get(days_back)
+        if entry is None:
+            return None
+        wins, losses, entry_trade_id, computed_at = entry
+        if entry_trade_id != last_trade_id or time.monotonic() - computed_at >= self.ttl:
+            return None
+        return wins, losses
+
+    def put(self, days_back: int, last_trade_id: Optional[int], wins: int, losses: int):
+        """Store freshly computed counts for the window"""
+        self._entries[days_back] = (wins, losses, last_trade_id, time.monotonic())
+
+    def invalidate(self):
+        """Drop all cached counts (e.g. after an order is placed)"""
+        self._entries.clear()
+
+
+# Shared by all FunctionHandler instances in this process
+trading_stats = TradingStats()
+
+
+def _encode_trade_cursor(executed_at: datetime, trade_pk: int) -> str:
+    """Build get_trading_history's next_cursor from the last row of a page"""
+    return f"{executed_at.isoformat()}|{trade_pk}"
+
+
+def _decode_trade_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Split a next_cursor back into (executed_at, id); ValueError if malformed"""
+    executed_at, _, trade_pk = cursor.rpartition("|")
+    return datetime.fromisoformat(executed_at), int(trade_pk)
+
+
+def _success(now: Optional[datetime] = None, **fields: Any) -> Dict:
+    """Build a successful handler result stamped with `now` (default: current time)"""
+    return {
+        "success": True,
+        **fields,
+        "timestamp": (now or datetime.now()).isoformat()
+    }
+
+
+def _error(message: str, **fields: Any) -> Dict:
+    """Build a failed handler result"""
+    return {"success": False, "error": message, **fields}
+
 
 class FunctionHandler:
     """Handler for Gemini function calls"""
 
+    # Function name -> handler method name, shared by all instances
+    _HANDLERS: ClassVar[Dict[str, str]] = {name: name for name in FUNCTION_NAMES}
+
     def __init__(
         self,
         broker: BrokerService,
@@ -45,6 +148,89 @@ class FunctionHandler:
         self.risk_manager = risk_manager
         self.db = db
 
+        # ticker -> (price_usd, time.monotonic() when fetched)
+        self._price_cache: Dict[str, Tuple[float, float]] = {}
+
+        # (usd_krw_rate, time.monotonic() when fetched)
+        self._fx_cache: Optional[Tuple[float, float]] = None
+
+        # "balance" / "state" -> (snapshot, time.monotonic() when fetched)
+        self._snapshot_cache: Dict[str, Tuple[Dict, float]] = {}
+
+    async def _cached_price(self, ticker: str, ttl: float = PRICE_CACHE_TTL_SECONDS) -> Optional[float]:
+        """
+        Get the current price for ticker, reusing a quote fetched within ttl seconds
+
+        Args:
+            ticker: Stock ticker symbol
+            ttl: Maximum age of a cached quote in seconds
+
+        Returns:
+            Price in USD, or None if the broker could not provide one
+        """
+        now = time.monotonic()
+        hit = self._price_cache.get(ticker)
+        if hit is not None and now - hit[1] < ttl:
+            return hit[0]
+
+        price = await self.broker.get_us_stock_price(ticker)
+        if price:
+            self._price_cache[ticker] = (price, now)
+        return price
+
+    async def _usd_krw(self, ttl: float = FX_CACHE_TTL_SECONDS) -> float:
+        """
+        Get the USD/KRW rate, reusing a rate fetched within ttl seconds
+
+        Falls back to the last fetched rate (or DEFAULT_USD_KRW_RATE) if the
+        broker cannot provide one.
+
+        Args:
+            ttl: Maximum age of a cached rate in seconds
+
+        Returns:
+            KRW per 1 USD
+        """
+        now = time.monotonic()
+        if self._fx_cache is not None and now - self._fx_cache[1] < ttl:
+            return self._fx_cache[0]
+
+        rate = await self.broker.get_fx_rate("USD", "KRW")
+        if rate:
+            self._fx_cache = (rate, now)
+            return rate
+        return self._fx_cache[0] if self._fx_cache is not None else DEFAULT_USD_KRW_RATE
+
+    async def _cached_snapshot(self, key: str, fetch) -> Dict:
+        """
+        Return a broker snapshot fetched within STATE_CACHE_TTL_SECONDS, else refetch
+
+        Args:
+            key: Cache slot ("balance" or "state")
+            fetch: Coroutine function producing the snapshot
+
+        Returns:
+            Snapshot dictionary
+        """
+        now = time.monotonic()
+        hit = self._snapshot_cache.get(key)
+        if hit is not None and now - hit[1] < STATE_CACHE_TTL_SECONDS:
+            return hit[0]
+
+        snapshot = await fetch()
+        # Error snapshots are returned but not reused
+        if 'error' not in snapshot:
+            self._snapshot_cache[key] = (snapshot, now)
+        return snapshot
+
+    async def _cached_balance(self) -> Dict:
+        """Account balance, reused for STATE_CACHE_TTL_SECONDS"""
+        return await self._cached_snapshot("balance", self.broker.get_balance)
+
+    async def _cached_state(self) -> Dict:
+        """Portfolio state, reused for STATE_CACHE_TTL_SECONDS"""
+        return await self._cached_snapshot("state", self.portfolio_manager.get_current_state)
+
     async def handle_function_call(self, function_name: str, arguments: Dict) -> Dict:
         """
         Route function call to appropriate handler
@@ -57,90 +243,67 @@ class FunctionHandler:
             Function result dictionary
         """
         try:
-            logger.info(f"Handling function call: {function_name} with args: {arguments}")
-
-            handlers = {
-                "check_balance": self.check_balance,
-                "get_current_price": self.get_current_price,
-                "get_portfolio_status": self.get_portfolio_status,
-                "execute_trade": self.execute_trade,
-                "analyze_signals": self.analyze_signals,
-                "calculate_position_size": self.calculate_position_size,
-                "check_stop_loss_triggers": self.check_stop_loss_triggers,
-                "get_trading_history": self.get_trading_history
-            }
-
-            if function_name not in handlers:
+            logger.info("Handling function call: %s with args: %s", function_name, arguments)
+
+            method_name = self._HANDLERS.get(function_name)
+            if method_name is None:
                 return {"error": f"Unknown function: {function_name}"}
 
-            handler = handlers[function_name]
-            result = await handler(**arguments)
+            # Validate/coerce arguments against the function schema; omitted
+            # optional args are left out so handler defaults still apply
+            validated = ARG_VALIDATORS[function_name].validate_python(arguments)
+            result = await getattr(self, method_name)(**validated.model_dump(exclude_unset=True))
 
-            logger.info(f"Function {function_name} completed successfully")
+            logger.info("Function %s completed successfully", function_name)
             return result
 
         except Exception as e:
-            logger.error(f"Error handling function {function_name}: {e}")
+            logger.error("Error handling function %s: %s", function_name, e)
             return {"error": str(e)}
 
+    @_handler
     async def check_balance(self) -> Dict:
         """Get current account balance"""
-        try:
-            balance = await self.broker.get_balance()
-            return {
-                "success": True,
-                "cash_balance_krw": balance['cash_balance'],
-                "total_value_krw": balance['total_value'],
-                "timestamp": datetime.now().isoformat()
-            }
-        except Exception as e:
-            logger.error(f"Failed to check balance: {e}")
-            return {"success": False, "error": str(e)}
+        balance = await self._cached_balance()
+        return _success(
+            cash_balance_krw=balance['cash_balance'],
+            total_value_krw=balance['total_value']
+        )
 
+    @_handler
     async def get_current_price(self, ticker: str) -> Dict:
         """Get current price for ticker"""
-        try:
-            price = await self.broker.get_us_stock_price(ticker)
-            if price:
-                return {
-                    "success": True,
-                    "ticker": ticker,
-                    "price_usd": price,
-                    "timestamp": datetime.now().isoformat()
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": f"Could not fetch price for {ticker}"
-                }
-        except Exception as e:
-            logger.error(f"Failed to get price for {ticker}: {e}")
-            return {"success": False, "error": str(e)}
+        price = await self._cached_price(ticker)
+        if price:
+            return _success(
+                ticker=ticker,
+                price_usd=price
+            )
+        else:
+            return _error(f"Could not fetch price for {ticker}")
 
+    @_handler
     async def get_portfolio_status(self) -> Dict:
         """Get comprehensive portfolio status"""
-        try:
-            state = await self.portfolio_manager.get_current_state()
-            exposure = await self.portfolio_manager.calculate_position_exposure()
-
-            return {
-                "success": True,
-                "cash_balance_krw": state['cash_balance'],
-                "holdings_value_krw": state['holdings_value'],
-                "total_value_krw": state['total_value'],
-                "positions": state['positions'],
-                "position_count": state['position_count'],
-                "daily_pnl_krw": state['daily_pnl'],
-                "daily_pnl_pct": state['daily_pnl_pct'],
-                "total_pnl_krw": state['total_pnl'],
-                "total_pnl_pct": state['total_pnl_pct'],
-                "exposure_by_ticker": exposure,
-                "timestamp": datetime.now().isoformat()
-            }
-        except Exception as e:
-            logger.error(f"Failed to get portfolio status: {e}")
-            return {"success": False, "error": str(e)}
-
+        state = await self._cached_state()
+        # Exposure is derived from the same snapshot; fetching it separately
+        # would repeat the broker and DB round-trips on the shared session
+        exposure = await self.portfolio_manager.calculate_position_exposure(state)
+
+        return _success(
+            cash_balance_krw=state['cash_balance'],
+            holdings_value_krw=state['holdings_value'],
+            total_value_krw=state['total_value'],
+            positions=state['positions'],
+            position_count=state['position_count'],
+            daily_pnl_krw=state['daily_pnl'],
+            daily_pnl_pct=state['daily_pnl_pct'],
+            total_pnl_krw=state['total_pnl'],
+            total_pnl_pct=state['total_pnl_pct'],
+            exposure_by_ticker=exposure
+        )
+
+    @_handler
     async def execute_trade(
         self,
         ticker: str,
@@ -150,96 +313,90 @@ class FunctionHandler:
         limit_price: Optional[float] = None
     ) -> Dict:
         """Execute a trade"""
-        try:
-            # Get current price for validation
-            current_price = await self.broker.get_us_stock_price(ticker)
-            if not current_price:
-                return {
-                    "success": False,
-                    "error": f"Could not fetch current price for {ticker}"
-                }
-
-            # Calculate trade value
+        # The price fetch and the daily-loss check are independent, so
+        # overlap them; the position-size check needs the price
+        price_task = asyncio.create_task(self._cached_price(ticker))
+        loss_task = (
+            asyncio.create_task(self.risk_manager.check_daily_loss_limit())
+            if action == "BUY" else None
+        )
+
+        if loss_task is not None:
+            try:
+                circuit_breaker_triggered, daily_pnl_pct = await loss_task
+            except BaseException:
+                price_task.cancel()
+                raise
+            if circuit_breaker_triggered:
+                price_task.cancel()
+                return _error(
+                    f"Circuit breaker triggered: Daily loss at {daily_pnl_pct:.2f}%",
+                    circuit_breaker=True
+                )
+
+        current_price = await price_task
+        if not current_price:
+            return _error(f"Could not fetch current price for {ticker}")
+
+        # Risk checks before executing
+        if action == "BUY":
+            # Calculate trade value (only the position-size check needs it)
             price_to_use = limit_price if order_type == "LIMIT" and limit_price else current_price
-            trade_value_krw = quantity * price_to_use * 1300  # Approximate USD to KRW
+            trade_value_krw = quantity * price_to_use * await self._usd_krw()
 
-            # Risk checks before executing
-            if action == "BUY":
-                # Check position size limit
-                can_trade, reason = await self.risk_manager.check_position_size_limit(
-                    ticker, trade_value_krw
+            # Check position size limit
+            can_trade, reason = await self.risk_manager.check_position_size_limit(
+                ticker, trade_value_krw
+            )
+            if not can_trade:
+                return _error(
+                    f"Risk check failed: {reason}",
+                    risk_violation=True
                 )
-                if not can_trade:
-                    return {
-                        "success": False,
-                        "error": f"Risk check failed: {reason}",
-                        "risk_violation": True
-                    }
-
-                # Check daily loss limit
-                circuit_breaker_triggered, daily_pnl_pct = await self.risk_manager.check_daily_loss_limit()
-                if circuit_breaker_triggered:
-                    return {
-                        "success": False,
-                        "error": f"Circuit breaker triggered: Daily loss at {daily_pnl_pct:.2f}%",
-                        "circuit_breaker": True
-                    }
-
-            # Execute trade through broker
-            order_result = await self.broker.place_us_order(
+
+        # Execute trade through broker
+        order_result = await self.broker.place_us_order(
+            ticker=ticker,
+            action=action,
+            quantity=quantity,
+            order_type=order_type,
+            limit_price=limit_price
+        )
+
+        if order_result['success']:
+            trading_stats.invalidate()
+            self._snapshot_cache.clear()
+            return _success(
                 ticker=ticker,
                 action=action,
                 quantity=quantity,
                 order_type=order_type,
-                limit_price=limit_price
+                order_id=order_result.get('order_id'),
+                estimated_price=current_price
             )
+        else:
+            return _error(order_result.get('error', 'Unknown error'))
 
-            if order_result['success']:
-                return {
-                    "success": True,
-                    "ticker": ticker,
-                    "action": action,
-                    "quantity": quantity,
-                    "order_type": order_type,
-                    "order_id": order_result.get('order_id'),
-                    "estimated_price": current_price,
-                    "timestamp": datetime.now().isoformat()
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": order_result.get('error', 'Unknown error')
-                }
-
-        except Exception as e:
-            logger.error(f"Failed to execute trade for {ticker}: {e}")
-            return {"success": False, "error": str(e)}
-
+    @_handler
     async def analyze_signals(self, ticker: str, hours_back: int = 24) -> Dict:
         """Analyze market signals for ticker"""
-        try:
-            # Get fresh aggregated signals
-            signals = await self.signal_aggregator.aggregate_signals_for_ticker(ticker)
-
-            # Get recent historical signals from DB
-            recent_signals = await self.signal_aggregator.get_recent_signals(
-                ticker, hours_back=hours_back
-            )
-
-            return {
-                "success": True,
-                "ticker": ticker,
-                "current_signals": signals,
-                "recent_signals": recent_signals,
-                "composite_sentiment": signals.get('composite_sentiment'),
-                "signal_strength": signals.get('signal_strength'),
-                "recommendation": signals.get('recommendation'),
-                "timestamp": datetime.now().isoformat()
-            }
-        except Exception as e:
-            logger.error(f"Failed to analyze signals for {ticker}: {e}")
-            return {"success": False, "error": str(e)}
-
+        # Fresh aggregation (network-bound) and the DB history lookup are
+        # independent; the aggregator serializes their DB access itself
+        signals, recent_signals = await asyncio.gather(
+            self.signal_aggregator.aggregate_signals_for_ticker(ticker),
+            self.signal_aggregator.get_recent_signals(ticker, hours_back=hours_back)
+        )
+
+        return _success(
+            ticker=ticker,
+            current_signals=signals,
+            recent_signals=recent_signals,
+            composite_sentiment=signals.get('composite_sentiment'),
+            signal_strength=signals.get('signal_strength'),
+            recommendation=signals.get('recommendation')
+        )
+
+    @_handler
     async def calculate_position_size(
         self,
         ticker: str,
@@ -247,94 +404,171 @@ class FunctionHandler:
         price: float
     ) -> Dict:
         """Calculate optimal position size"""
-        try:
-            result = await self.risk_manager.calculate_position_size(
-                ticker=ticker,
-                confidence=confidence,
-                price_per_share=price
-            )
-
-            return {
-                "success": True,
-                "ticker": ticker,
-                "confidence": confidence,
-                "price_per_share": price,
-                "recommended_quantity": result['quantity'],
-                "trade_value_krw": result['trade_value_krw'],
-                "position_pct": result['position_pct'],
-                "reasoning": result['reasoning'],
-                "timestamp": datetime.now().isoformat()
-            }
-        except Exception as e:
-            logger.error(f"Failed to calculate position size: {e}")
-            return {"success": False, "error": str(e)}
-
+        result = await self.risk_manager.calculate_position_size(
+            ticker=ticker,
+            confidence=confidence,
+            price_per_share=price
+        )
+
+        return _success(
+            ticker=ticker,
+            confidence=confidence,
+            price_per_share=price,
+            recommended_quantity=result['quantity'],
+            trade_value_krw=result['trade_value_krw'],
+            position_pct=result['position_pct'],
+            reasoning=result['reasoning']
+        )
+
+    @_handler
     async def check_stop_loss_triggers(self) -> Dict:
         """Check if any positions have triggered stop-loss"""
-        try:
-            triggered_positions = await self.risk_manager.check_all_stop_losses()
-
-            return {
-                "success": True,
-                "triggered_positions": triggered_positions,
-                "count": len(triggered_positions),
-                "timestamp": datetime.now().isoformat()
-            }
-        except Exception as e:
-            logger.error(f"Failed to check stop-loss triggers: {e}")
-            return {"success": False, "error": str(e)}
+        triggered_positions = await self.risk_manager.check_all_stop_losses()
 
-    async def get_trading_history(self, days_back: int = 7) -> Dict:
-        """Get recent trading history"""
-        try:
-            cutoff_date = datetime.now() - timedelta(days=days_back)
-
-            stmt = select(Trade).where(
-                Trade.executed_at >= cutoff_date
-            ).order_by(desc(Trade.executed_at))
-
-            result = await self.db.execute(stmt)
-            trades = result.scalars().all()
-
-            trade_list = [
-                {
-                    "trade_id": trade.trade_id,
-                    "ticker": trade.ticker,
-                    "action": trade.action,
-                    "quantity": trade.quantity,
-                    "price": trade.price,
-                    "total_value": trade.total_value,
-                    "status": trade.status,
-                    "executed_at": trade.executed_at.isoformat() if trade.executed_at else None
-                }
-                for trade in trades
-            ]
-
-            # Calculate win rate
-            completed_trades = [t for t in trades if t.status == 'FILLED']
-            buy_trades = {t.ticker: t for t in completed_trades if t.action == 'BUY'}
-            sell_trades = [t for t in completed_trades if t.action == 'SELL']
-
-            wins = 0
-            losses = 0
-            for sell_trade in sell_trades:
-                if sell_trade.ticker in buy_trades:
-                    buy_trade = buy_trades[sell_trade.ticker]
-                    if sell_trade.price > buy_trade.price:
-                        wins += 1
-                    else:
-                        losses += 1
-
-            win_rate = (wins / (wins + losses) * 100) if (wins + losses) > 0 else 0
-
-            return {
-                "success": True,
-                "trades": trade_list,
-                "total_trades": len(trade_list),
-                "days_back": days_back,
-                "win_rate_pct": win_rate,
-                "timestamp": datetime.now().isoformat()
-            }
-        except Exception as e:
-            logger.error(f"Failed to get trading history: {e}")
-            return {"success": False, "error": str(e)}
+        return _success(
+            triggered_positions=triggered_positions,
+            count=len(triggered_positions)
+        )
+
+    async def _count_wins_losses(self, cutoff_date: datetime) -> Tuple[int, int]:
+        """
+        Count winning/losing round trips since cutoff_date
+
+        Filled trades are walked ticker by ticker in execution order; each
+        SELL is paired with the oldest open BUY of the same ticker (FIFO). A SELL above its BUY
+        price is a win, anything else a loss. A SELL with no earlier BUY in
+        the window (position opened before the cutoff) is not counted.
+
+        Args:
+            cutoff_date: Only trades executed at/after this time are paired
+
+        Returns:
+            Tuple of (wins, losses)
+        """
+        # Only the three columns the walk needs, so no ORM instances are built;
+        # (ticker, executed_at) order comes from ix_trades_status_ticker_executed
+        stmt = select(
+            Trade.ticker,
+            Trade.action,
+            Trade.price
+        ).where(
+            Trade.executed_at >= cutoff_date,
+            Trade.status == 'FILLED'
+        ).order_by(Trade.ticker, Trade.executed_at, Trade.id)
+
+        result = await self.db.execute(stmt)
+
+        open_buys = defaultdict(deque)
+        wins = 0
+        losses = 0
+        for ticker, action, price in result:
+            if action == 'BUY':
+                open_buys[ticker].append(price)
+            elif action == 'SELL' and open_buys[ticker]:
+                if price > open_buys[ticker].popleft():
+                    wins += 1
+                else:
+                    losses += 1
+        return wins, losses
+
+    async def _win_loss_stats(self, days_back: int, cutoff_date: datetime) -> Tuple[int, int]:
+        """
+        Get (wins, losses) for the window, recounting only when trading_stats is stale
+
+        Args:
+            days_back: Window length used as the cache key
+            cutoff_date: Start of the window
+
+        Returns:
+            Tuple of (wins, losses)
+        """
+        result = await self.db.execute(select(func.max(Trade.id)))
+        last_trade_id = result.scalar()
+
+        # Held across the recount so concurrent refreshes wait for one query
+        async with trading_stats.lock:
+            cached = trading_stats.get(days_back, last_trade_id)
+            if cached is not None:
+                return cached
+            wins, losses = await self._count_wins_losses(cutoff_date)
+            trading_stats.put(days_back, last_trade_id, wins, losses)
+            return wins, losses
+
+    @_handler
+    async def get_trading_history(
+        self,
+        days_back: int = 7,
+        cursor: Optional[str] = None,
+        page_size: int = TRADE_HISTORY_PAGE_SIZE
+    ) -> Dict:
+        """Get recent trading history (newest first, one page at a time)"""
+        now = datetime.now()
+        cutoff_date = now - timedelta(days=days_back)
+        page_size = max(1, min(page_size, TRADE_HISTORY_MAX_PAGE_SIZE))
+
+        conditions = [Trade.executed_at >= cutoff_date]
+        if cursor:
+            # Keyset on (executed_at, id): rows sharing the boundary timestamp
+            # are split by id instead of being skipped
+            cursor_time, cursor_id = _decode_trade_cursor(cursor)
+            conditions.append(or_(
+                Trade.executed_at < cursor_time,
+                and_(Trade.executed_at == cursor_time, Trade.id < cursor_id)
+            ))
+
+        # Fetch one extra row to know whether another page exists; only the
+        # response columns are selected, so no ORM instances are built
+        stmt = select(
+            Trade.id,
+            Trade.trade_id,
+            Trade.ticker,
+            Trade.action,
+            Trade.quantity,
+            Trade.price,
+            Trade.total_value,
+            Trade.status,
+            Trade.executed_at
+        ).where(*conditions).order_by(
+            desc(Trade.executed_at),
+            desc(Trade.id)
+        ).limit(page_size + 1)
+
+        # The page query and the win/loss lookup share self.db, and an
+        # AsyncSession must not run statements concurrently, so they are
+        # awaited one after another
+        result = await self.db.execute(stmt)
+        rows = result.mappings().all()
+        wins, losses = await self._win_loss_stats(days_back, cutoff_date)
+
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+
+        # Trades in the whole days_back window, not just this page; a lone first
+        # page already holds them all, otherwise count on ix_trades_executed_at_id
+        if cursor or has_more:
+            result = await self.db.execute(
+                select(func.count()).select_from(Trade).where(Trade.executed_at >= cutoff_date)
+            )
+            total_trades = result.scalar()
+        else:
+            total_trades = len(rows)
+        next_cursor = _encode_trade_cursor(rows[-1]["executed_at"], rows[-1]["id"]) if has_more else None
+
+        trade_list = []
+        for row in rows:
+            trade = dict(row)
+            del trade["id"]
+            executed_at = trade["executed_at"]
+            trade["executed_at"] = executed_at.isoformat() if executed_at else None
+            trade_list.append(trade)
+
+        win_rate = (wins / (wins + losses) * 100) if (wins + losses) > 0 else 0
+
+        return _success(
+            now,
+            trades=trade_list,
+            total_trades=total_trades,
+            next_cursor=next_cursor,
+            days_back=days_back,
+            win_rate_pct=win_rate
+        )
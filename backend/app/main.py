@@ -8,9 +8,11 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import logging
 import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
 
 from .config import settings
-from .database import init_db
+from .database import init_db, warm_pool
 from .utils.logging_config import setup_logging
 from .dependencies import init_services, get_broker_service, get_market_data_scheduler
 from .routes import (
@@ -42,69 +44,37 @@ from .routes.portfolio_optimizer import router as portfolio_optimizer_router
 setup_logging(settings.log_level)
 logger = logging.getLogger(__name__)
 
-# Background task for token refresh
-_token_refresh_task = None
+# Refresh the broker token this long before it actually expires
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
 
-# Market data scheduler
-_market_data_scheduler = None
+# Minimum wait between refresh attempts (also used once a token is overdue)
+TOKEN_REFRESH_MIN_SLEEP_SECONDS = 60
 
-# Create FastAPI app
-app = FastAPI(
-    title=settings.app_name,
-    version=settings.app_version,
-    description="Automated US Stock Trading Bot powered by Gemini AI",
-)
-
-# Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins_list,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Include routers
-app.include_router(web_router)  # Web UI routes (HTML templates)
-app.include_router(chat_router)  # Chat API routes
-app.include_router(scheduler_router)
-app.include_router(trading_router)
-app.include_router(portfolio_router)
-app.include_router(signals_router)
-app.include_router(settings_router)
-app.include_router(recommendations_router)  # AI recommendations routes
-app.include_router(api_test_router)  # API test routes
-app.include_router(preferences_router)  # Investment preferences routes
-app.include_router(market_screener_router)  # Market screener routes (Phase 1.1)
-app.include_router(fundamentals_router)  # Fundamental data routes (Phase 1.2)
-app.include_router(news_router)  # News & events routes (Phase 1.3)
-app.include_router(daily_report_router)  # Daily report routes (Phase 1.4)
-app.include_router(websocket_realtime_router)  # WebSocket realtime data (Phase 2.1)
-app.include_router(technical_indicators_router)  # Technical indicators (Phase 3.1)
-app.include_router(strategy_engine_router)  # Strategy engine (Phase 3.2)
-app.include_router(backtesting_router)  # Backtesting system (Phase 3.3)
-app.include_router(signal_generator_router)  # Signal generator (Phase 3.4)
-app.include_router(integrated_scheduler_router)  # Integrated scheduler (Phase 4.1)
-app.include_router(order_management_router)  # Order management (KIS order API)
-app.include_router(portfolio_optimizer_router)  # Portfolio optimization (MPT)
+# Wait before retrying while the broker has no token (KIS limits token issuance per day)
+TOKEN_RETRY_SECONDS = 60 * 60
 
 
 async def token_refresh_loop():
-    """Background task to refresh access token every 22 hours"""
-    global _token_refresh_task
-
+    """Background task to refresh the access token shortly before it expires"""
     while True:
         try:
-            # Wait 22 hours (79200 seconds)
-            await asyncio.sleep(22 * 60 * 60)
-
-            # Get broker service and refresh token
-            broker = await get_broker_service()
-            if broker and broker.needs_token_refresh():
-                logger.info("22 hours elapsed, refreshing access token...")
+            # Schedule against the token's real expiry rather than process start
+            broker = get_broker_service()
+            expires_at = broker.token_expires_at if broker else None
+            if expires_at is not None:
+                delay = (expires_at - TOKEN_REFRESH_MARGIN - datetime.now()).total_seconds()
+                sleep_seconds = max(TOKEN_REFRESH_MIN_SLEEP_SECONDS, delay)
+            else:
+                sleep_seconds = TOKEN_RETRY_SECONDS
+
+            await asyncio.sleep(sleep_seconds)
+
+            broker = get_broker_service()
+            if broker:
+                logger.info("Access token due to expire, refreshing...")
                 success = broker.refresh_token()
                 if success:
-                    logger.info("✓ Access token refreshed successfully")
+                    logger.info("✓ Access token refreshed successfully (expires: %s)", broker.token_expires_at)
                 else:
                     logger.error("✗ Failed to refresh access token")
 
@@ -112,70 +82,110 @@ async def token_refresh_loop():
             logger.info("Token refresh task cancelled")
             break
         except Exception as e:
-            logger.error(f"Error in token refresh loop: {e}")
+            logger.error("Error in token refresh loop: %s", e)
             # Continue loop even on error
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Startup event handler"""
-    global _token_refresh_task, _market_data_scheduler
-
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown; background tasks live in one task group"""
     logger.info("Starting US Stock Trading Bot...")
-    logger.info(f"Environment: {settings.app_name} v{settings.app_version}")
+    logger.info("Environment: %s v%s", settings.app_name, settings.app_version)
 
     # Initialize database
     try:
         await init_db()
         logger.info("Database initialized successfully")
     except Exception as e:
-        logger.error(f"Failed to initialize database: {e}")
+        logger.error("Failed to initialize database: %s", e)
         raise
 
+    # Prime the connection pool (best effort; connections are opened lazily otherwise)
+    try:
+        await warm_pool()
+        logger.info("Database connection pool warmed")
+    except Exception as e:
+        logger.warning("Failed to warm database connection pool: %s", e)
+
     # Initialize services
     try:
         init_services(settings)
         logger.info("Services initialized successfully")
     except Exception as e:
-        logger.error(f"Failed to initialize services: {e}")
+        logger.error("Failed to initialize services: %s", e)
         raise
 
-    # Start token refresh background task
-    _token_refresh_task = asyncio.create_task(token_refresh_loop())
-    logger.info("Started access token refresh task (every 22 hours)")
+    async with asyncio.TaskGroup() as tg:
+        # Start token refresh background task
+        token_refresh_task = tg.create_task(token_refresh_loop())
+        logger.info("Started access token refresh task (5 minutes before expiry)")
 
-    # Start market data scheduler
-    try:
-        _market_data_scheduler = await get_market_data_scheduler()
-        _market_data_scheduler.start()
-        logger.info("Started market data scheduler with AI recommendations")
-    except Exception as e:
-        logger.error(f"Failed to start market data scheduler: {e}")
-        # Continue without market data scheduler
+        # Start market data scheduler
+        market_data_scheduler = None
+        try:
+            market_data_scheduler = get_market_data_scheduler()
+            market_data_scheduler.start()
+            logger.info("Started market data scheduler with AI recommendations")
+        except Exception as e:
+            logger.error("Failed to start market data scheduler: %s", e)
+            # Continue without market data scheduler
 
-    logger.info("Application startup complete")
+        logger.info("Application startup complete")
+        try:
+            yield
+        finally:
+            logger.info("Shutting down US Stock Trading Bot...")
 
+            # Stop market data scheduler
+            if market_data_scheduler:
+                market_data_scheduler.stop()
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Shutdown event handler"""
-    global _token_refresh_task, _market_data_scheduler
+            # Cancel token refresh task (the task group waits for it to finish)
+            token_refresh_task.cancel()
 
-    logger.info("Shutting down US Stock Trading Bot...")
+    logger.info("Application shutdown complete")
 
-    # Cancel token refresh task
-    if _token_refresh_task:
-        _token_refresh_task.cancel()
-        try:
-            await _token_refresh_task
-        except asyncio.CancelledError:
-            pass
 
-    # Stop market data scheduler
-    if _market_data_scheduler:
-        _market_data_scheduler.stop()
+# Create FastAPI app
+app = FastAPI(
+    title=settings.app_name,
+    version=settings.app_version,
+    description="Automated US Stock Trading Bot powered by Gemini AI",
+    lifespan=lifespan,
+)
 
-    logger.info("Application shutdown complete")
+# Configure CORS
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=settings.cors_origins,
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+# Include routers
+app.include_router(web_router)  # Web UI routes (HTML templates)
+app.include_router(chat_router)  # Chat API routes
+app.include_router(scheduler_router)
+app.include_router(trading_router)
+app.include_router(portfolio_router)
+app.include_router(signals_router)
+app.include_router(settings_router)
+app.include_router(recommendations_router)  # AI recommendations routes
+app.include_router(api_test_router)  # API test routes
+app.include_router(preferences_router)  # Investment preferences routes
+app.include_router(market_screener_router)  # Market screener routes (Phase 1.1)
+app.include_router(fundamentals_router)  # Fundamental data routes (Phase 1.2)
+app.include_router(news_router)  # News & events routes (Phase 1.3)
+app.include_router(daily_report_router)  # Daily report routes (Phase 1.4)
+app.include_router(websocket_realtime_router)  # WebSocket realtime data (Phase 2.1)
+app.include_router(technical_indicators_router)  # Technical indicators (Phase 3.1)
+app.include_router(strategy_engine_router)  # Strategy engine (Phase 3.2)
+app.include_router(backtesting_router)  # Backtesting system (Phase 3.3)
+app.include_router(signal_generator_router)  # Signal generator (Phase 3.4)
+app.include_router(integrated_scheduler_router)  # Integrated scheduler (Phase 4.1)
+app.include_router(order_management_router)  # Order management (KIS order API)
+app.include_router(portfolio_optimizer_router)  # Portfolio optimization (MPT)
 
 
 # Root endpoint removed - now handled by web_router
@@ -209,7 +219,7 @@ async def api_info():
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler"""
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
     return JSONResponse(
         status_code=500,
         content={"detail": "Internal server error"}
@@ -218,4 +228,5 @@ async def global_exception_handler(request, exc):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop/httptools ship with uvicorn[standard]
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
@@ -3,7 +3,7 @@ Investment Preferences Model
 Stores user investment preferences extracted from chat conversations
 """
 
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, Text
+from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, Text, JSON
 from sqlalchemy.sql import func
 
 from ..database import Base
@@ -19,13 +19,13 @@ class InvestmentPreference(Base):
     risk_appetite = Column(String, default="moderate", nullable=False)  # conservative, moderate, aggressive
     investment_style = Column(String, default="balanced", nullable=False)  # growth, value, dividend, balanced
 
-    # Sector preferences (JSON-like comma-separated list)
-    preferred_sectors = Column(Text, default="", nullable=True)  # e.g., "technology,healthcare,finance"
-    avoided_sectors = Column(Text, default="", nullable=True)  # e.g., "energy,utilities"
+    # Sector preferences (JSON list, read back as a Python list)
+    preferred_sectors = Column(JSON, default=list, nullable=True)  # e.g., ["technology", "healthcare", "finance"]
+    avoided_sectors = Column(JSON, default=list, nullable=True)  # e.g., ["energy", "utilities"]
 
     # Stock preferences
-    preferred_tickers = Column(Text, default="", nullable=True)  # e.g., "AAPL,GOOGL,MSFT"
-    avoided_tickers = Column(Text, default="", nullable=True)  # e.g., "TSLA,GME"
+    preferred_tickers = Column(JSON, default=list, nullable=True)  # e.g., ["AAPL", "GOOGL", "MSFT"]
+    avoided_tickers = Column(JSON, default=list, nullable=True)  # e.g., ["TSLA", "GME"]
 
     # Investment strategy
     max_single_position_pct = Column(Float, default=20.0, nullable=False)
@@ -2,7 +2,7 @@
 LLM Decisions Model
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime
+from sqlalchemy import Column, Integer, String, Float, DateTime, JSON
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from ..database import Base
@@ -19,9 +19,9 @@ class LLMDecision(Base):
     response = Column(String, nullable=False)
     reasoning = Column(String)  # Extracted reasoning from LLM
     confidence_score = Column(Float)  # 0-1 confidence score
-    function_calls = Column(String)  # JSON array of function calls made
-    signals_used = Column(String)  # JSON of signals that influenced decision
-    portfolio_state = Column(String)  # JSON snapshot of portfolio at decision time
+    function_calls = Column(JSON)  # Function calls made (list)
+    signals_used = Column(JSON)  # Signals that influenced decision (list)
+    portfolio_state = Column(JSON)  # Snapshot of portfolio at decision time (dict)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     execution_time_ms = Column(Integer)
 
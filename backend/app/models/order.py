@@ -4,10 +4,16 @@ Order Model - 주문 관리
 한국투자증권 주문 상태 추적 및 관리
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, BigInteger, Boolean
+from sqlalchemy import (
+    Column, Integer, String, Float, DateTime, BigInteger, Boolean, JSON, Computed, Index, bindparam
+)
 from sqlalchemy.sql import func
 from ..database import Base
 
+# 활성 주문 상태 (체결 가능한 상태) / 완료 상태
+ACTIVE_ORDER_STATUSES = ("SUBMITTED", "PENDING", "PARTIAL_FILLED")
+COMPLETED_ORDER_STATUSES = ("FILLED", "CANCELLED", "REJECTED")
+
 
 class Order(Base):
     """주문 모델 (Order Tracking)"""
@@ -37,6 +43,12 @@ class Order(Base):
     avg_filled_price = Column(Float)  # 평균체결가
     filled_amount = Column(Float)  # 체결금액
     commission = Column(Float, default=0.0)  # 수수료
+    # 체결률 (0.0 ~ 1.0): DB가 계산해 저장하는 generated column
+    fill_rate = Column(Float, Computed(
+        "CASE WHEN order_quantity = 0 THEN 0.0 "
+        "ELSE CAST(COALESCE(filled_quantity, 0) AS FLOAT) / order_quantity END",
+        persisted=True,
+    ))
 
     # 주문 상태
     status = Column(String, default="SUBMITTED", index=True)
@@ -59,7 +71,7 @@ class Order(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     # API 응답
-    broker_response = Column(String)  # KIS API 응답 (JSON)
+    broker_response = Column(JSON)  # KIS API 응답
     error_message = Column(String)  # 오류 메시지
 
     # 리스크 관리
@@ -68,19 +80,37 @@ class Order(Base):
     stop_loss_price = Column(Float)  # 손절가
     take_profit_price = Column(Float)  # 익절가
 
+    # 활성 주문만 담는 부분 인덱스 (전체 주문 중 극소수 → 활성 주문 조회가 작은 인덱스 스캔)
+    __table_args__ = (
+        Index(
+            'ix_orders_active', submitted_at.desc(),
+            sqlite_where=status.in_(ACTIVE_ORDER_STATUSES),
+            postgresql_where=status.in_(ACTIVE_ORDER_STATUSES),
+        ),
+    )
+
+    # INSERT/UPDATE 직후 fill_rate를 RETURNING으로 함께 받아옴 (async에서 lazy load 방지)
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self):
         return f"<Order(order_number='{self.order_number}', ticker='{self.ticker}', type='{self.order_type}', status='{self.status}')>"
 
     def is_active(self) -> bool:
         """활성 주문 여부 (체결 가능한 상태)"""
-        return self.status in ["SUBMITTED", "PENDING", "PARTIAL_FILLED"]
+        return self.status in ACTIVE_ORDER_STATUSES
 
     def is_completed(self) -> bool:
         """완료된 주문 여부"""
-        return self.status in ["FILLED", "CANCELLED", "REJECTED"]
-
-    def fill_rate(self) -> float:
-        """체결률 (0.0 ~ 1.0)"""
-        if self.order_quantity == 0:
-            return 0.0
-        return self.filled_quantity / self.order_quantity
+        return self.status in COMPLETED_ORDER_STATUSES
+
+    @classmethod
+    def active_filter(cls):
+        """
+        활성 주문 WHERE 조건
+
+        상태 목록을 바인드 파라미터가 아닌 리터럴로 렌더링해야
+        플래너가 부분 인덱스 ix_orders_active 조건과 일치시킴
+        """
+        return cls.status.in_(
+            bindparam('active_order_statuses', list(ACTIVE_ORDER_STATUSES), literal_execute=True)
+        )
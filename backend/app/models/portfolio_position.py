@@ -4,10 +4,16 @@ Portfolio Position Model - 포트폴리오 포지션
 실시간 포지션 추적 및 관리
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean
+from typing import Dict, List
+
+import numpy as np
+from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, select, update
 from sqlalchemy.sql import func
 from ..database import Base
 
+# 금액 고정소수점 스케일 (1e-4 달러 단위)
+MONEY_SCALE = 10_000
+
 
 class PortfolioPosition(Base):
     """포트폴리오 포지션 모델"""
@@ -83,6 +89,92 @@ class PortfolioPosition(Base):
         if self.trailing_stop_pct and self.max_price_achieved:
             self.stop_loss_price = self.max_price_achieved * (1 - self.trailing_stop_pct / 100)
 
+    @classmethod
+    async def recalc_all(cls, session, prices: Dict[str, float]) -> List[Dict]:
+        """
+        보유 포지션 메트릭 일괄 계산 (calculate_metrics의 벡터화 버전)
+
+        필요한 컬럼만 한 번에 조회해 NumPy 배열로 계산한 뒤,
+        기본키 기준 bulk UPDATE 한 번으로 저장한다.
+
+        Args:
+            session: AsyncSession
+            prices: 종목코드 -> 현재가 (가격이 없는 종목은 건너뜀)
+
+        Returns:
+            갱신된 포지션 리스트 (ticker, quantity, current_price,
+            stop_loss_price, take_profit_price, stop_loss_hit, take_profit_hit)
+        """
+        result = await session.execute(
+            select(
+                cls.id, cls.ticker, cls.quantity, cls.total_invested,
+                cls.unrealized_pnl_pct, cls.max_price_achieved, cls.trailing_stop_pct,
+                cls.stop_loss_price, cls.take_profit_price,
+            ).where(cls.quantity > 0, cls.ticker.in_(list(prices)))
+        )
+        rows = result.all()
+        if not rows:
+            return []
+
+        # None -> NaN (dtype=float)
+        cols = np.array([row[2:] for row in rows], dtype=float).T
+        quantity, invested, pnl_pct, max_price, trailing, stop_loss, take_profit = cols
+        price = np.array([prices[row.ticker] for row in rows], dtype=float)
+
+        # 평가금액/손익은 1e-4 단위 고정소수점(int64)으로 계산 → 부동소수점 오차 없이 정확한 합/차
+        price_units = np.rint(price * MONEY_SCALE).astype(np.int64)
+        invested_units = np.rint(invested * MONEY_SCALE).astype(np.int64)
+        value_units = price_units * quantity.astype(np.int64)
+        current_value = value_units / MONEY_SCALE
+        unrealized_pnl = (value_units - invested_units) / MONEY_SCALE
+
+        # 투자금액이 0이면 수익률은 기존 값 유지
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pnl_pct = np.where(invested > 0, unrealized_pnl / invested * 100, pnl_pct)
+
+        # 최고가 업데이트 (fmax: 기존 값이 NaN이면 현재가)
+        max_price = np.fmax(max_price, price)
+
+        # 트레일링 스탑이 설정된 포지션만 손절가 갱신
+        has_trailing = np.nan_to_num(trailing) != 0
+        stop_loss = np.where(has_trailing, max_price * (1 - trailing / 100), stop_loss)
+
+        # should_stop_loss / should_take_profit 과 같은 조건 (NaN 비교는 False)
+        stop_hit = (stop_loss > 0) & (price > 0) & (price <= stop_loss)
+        take_hit = (take_profit > 0) & (price > 0) & (price >= take_profit)
+
+        def to_list(values):
+            return [None if np.isnan(v) else float(v) for v in values]
+
+        pnl_pct, max_price, stop_loss, take_profit = (
+            to_list(pnl_pct), to_list(max_price), to_list(stop_loss), to_list(take_profit)
+        )
+        await session.execute(update(cls), [
+            {
+                'id': row.id,
+                'current_price': float(price[i]),
+                'current_value': float(current_value[i]),
+                'unrealized_pnl': float(unrealized_pnl[i]),
+                'unrealized_pnl_pct': pnl_pct[i],
+                'max_price_achieved': max_price[i],
+                'stop_loss_price': stop_loss[i],
+            }
+            for i, row in enumerate(rows)
+        ])
+
+        return [
+            {
+                'ticker': row.ticker,
+                'quantity': row.quantity,
+                'current_price': float(price[i]),
+                'stop_loss_price': stop_loss[i],
+                'take_profit_price': take_profit[i],
+                'stop_loss_hit': bool(stop_hit[i]),
+                'take_profit_hit': bool(take_hit[i]),
+            }
+            for i, row in enumerate(rows)
+        ]
+
     def needs_rebalancing(self, tolerance: float = 5.0) -> bool:
         """리밸런싱 필요 여부 (기본 tolerance: 5%)"""
         if not self.target_weight or not self.portfolio_weight:
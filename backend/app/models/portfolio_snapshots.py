@@ -2,7 +2,7 @@
 Portfolio Snapshots Model
 """
 
-from sqlalchemy import Column, Integer, Float, Date, String, DateTime
+from sqlalchemy import Column, Integer, Float, Date, String, DateTime, JSON
 from sqlalchemy.sql import func
 from ..database import Base
 
@@ -21,7 +21,7 @@ class PortfolioSnapshot(Base):
     daily_pnl_pct = Column(Float)
     total_pnl = Column(Float)
     total_pnl_pct = Column(Float)
-    holdings_json = Column(String, nullable=False)  # JSON of all positions
+    holdings_json = Column(JSON, nullable=False)  # All positions (list)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     def __repr__(self):
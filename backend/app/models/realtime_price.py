@@ -7,7 +7,7 @@ Real-time Price Data Model
 - OHLCV (분봉, 일봉)
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, BigInteger
+from sqlalchemy import Column, Integer, String, Float, DateTime, BigInteger, JSON
 from sqlalchemy.sql import func
 from ..database import Base
 
@@ -51,51 +51,13 @@ class OrderBook(Base):
     __tablename__ = "order_books"
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    ticker = Column(String, nullable=False, index=True)
+    ticker = Column(String, nullable=False, unique=True, index=True)  # 종목당 최신 호가 1행 (upsert 키)
 
-    # Ask (매도) - 10호가
-    ask_price_1 = Column(Float, nullable=True)
-    ask_volume_1 = Column(BigInteger, nullable=True)
-    ask_price_2 = Column(Float, nullable=True)
-    ask_volume_2 = Column(BigInteger, nullable=True)
-    ask_price_3 = Column(Float, nullable=True)
-    ask_volume_3 = Column(BigInteger, nullable=True)
-    ask_price_4 = Column(Float, nullable=True)
-    ask_volume_4 = Column(BigInteger, nullable=True)
-    ask_price_5 = Column(Float, nullable=True)
-    ask_volume_5 = Column(BigInteger, nullable=True)
-    ask_price_6 = Column(Float, nullable=True)
-    ask_volume_6 = Column(BigInteger, nullable=True)
-    ask_price_7 = Column(Float, nullable=True)
-    ask_volume_7 = Column(BigInteger, nullable=True)
-    ask_price_8 = Column(Float, nullable=True)
-    ask_volume_8 = Column(BigInteger, nullable=True)
-    ask_price_9 = Column(Float, nullable=True)
-    ask_volume_9 = Column(BigInteger, nullable=True)
-    ask_price_10 = Column(Float, nullable=True)
-    ask_volume_10 = Column(BigInteger, nullable=True)
-
-    # Bid (매수) - 10호가
-    bid_price_1 = Column(Float, nullable=True)
-    bid_volume_1 = Column(BigInteger, nullable=True)
-    bid_price_2 = Column(Float, nullable=True)
-    bid_volume_2 = Column(BigInteger, nullable=True)
-    bid_price_3 = Column(Float, nullable=True)
-    bid_volume_3 = Column(BigInteger, nullable=True)
-    bid_price_4 = Column(Float, nullable=True)
-    bid_volume_4 = Column(BigInteger, nullable=True)
-    bid_price_5 = Column(Float, nullable=True)
-    bid_volume_5 = Column(BigInteger, nullable=True)
-    bid_price_6 = Column(Float, nullable=True)
-    bid_volume_6 = Column(BigInteger, nullable=True)
-    bid_price_7 = Column(Float, nullable=True)
-    bid_volume_7 = Column(BigInteger, nullable=True)
-    bid_price_8 = Column(Float, nullable=True)
-    bid_volume_8 = Column(BigInteger, nullable=True)
-    bid_price_9 = Column(Float, nullable=True)
-    bid_volume_9 = Column(BigInteger, nullable=True)
-    bid_price_10 = Column(Float, nullable=True)
-    bid_volume_10 = Column(BigInteger, nullable=True)
+    # 10호가 (index 0 = 1호가): 호가별 컬럼 40개 대신 배열 4개
+    ask_prices = Column(JSON, nullable=True)  # 매도호가 [10]
+    ask_volumes = Column(JSON, nullable=True)  # 매도잔량 [10]
+    bid_prices = Column(JSON, nullable=True)  # 매수호가 [10]
+    bid_volumes = Column(JSON, nullable=True)  # 매수잔량 [10]
 
     # Total Ask/Bid
     total_ask_volume = Column(BigInteger, nullable=True)  # 총 매도 잔량
@@ -104,8 +66,18 @@ class OrderBook(Base):
     # Timestamp
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), index=True)
 
+    @property
+    def best_ask(self):
+        """최우선 매도호가 (1호가)"""
+        return self.ask_prices[0] if self.ask_prices else None
+
+    @property
+    def best_bid(self):
+        """최우선 매수호가 (1호가)"""
+        return self.bid_prices[0] if self.bid_prices else None
+
     def __repr__(self):
-        return f"<OrderBook(ticker={self.ticker}, best_ask={self.ask_price_1}, best_bid={self.bid_price_1})>"
+        return f"<OrderBook(ticker={self.ticker}, best_ask={self.best_ask}, best_bid={self.best_bid})>"
 
 
 class OHLCV(Base):
@@ -113,11 +85,13 @@ class OHLCV(Base):
 
     __tablename__ = "ohlcv"
 
-    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    ticker = Column(String, nullable=False, index=True)
+    # 기본키 (ticker, timeframe, timestamp): 조회는 항상 (ticker, timeframe) + timestamp 정렬/범위
+    # SQLite는 WITHOUT ROWID로 기본키 순서대로 저장 → "최근 N개 캔들"이 연속 페이지만 읽음
+    # Postgres + TimescaleDB에서는 init_db가 timestamp 기준 hypertable(일 단위 chunk)로 변환
+    ticker = Column(String, primary_key=True)
 
     # Timeframe: '1m', '5m', '15m', '30m', '1h', '4h', '1d'
-    timeframe = Column(String, nullable=False, index=True)
+    timeframe = Column(String, primary_key=True)
 
     # OHLCV
     open = Column(Float, nullable=False)
@@ -131,8 +105,12 @@ class OHLCV(Base):
     vwap = Column(Float, nullable=True)  # Volume Weighted Average Price
 
     # Timestamp
-    timestamp = Column(DateTime(timezone=True), nullable=False, index=True)  # 캔들 시작 시간
+    timestamp = Column(DateTime(timezone=True), primary_key=True)  # 캔들 시작 시간
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        {'sqlite_with_rowid': False},
+    )
+
     def __repr__(self):
         return f"<OHLCV(ticker={self.ticker}, tf={self.timeframe}, close={self.close}, time={self.timestamp})>"
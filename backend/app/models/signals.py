@@ -2,7 +2,7 @@
 Signals Model
 """
 
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, JSON
 from sqlalchemy.sql import func
 from ..database import Base
 
@@ -16,7 +16,7 @@ class Signal(Base):
     ticker = Column(String, nullable=False, index=True)
     source = Column(String, nullable=False, index=True)  # WSB/YAHOO/TIPRANKS
     signal_type = Column(String, nullable=False)  # SENTIMENT/NEWS/ANALYST_RATING/PRICE_ALERT
-    signal_data = Column(String, nullable=False)  # JSON data specific to signal type
+    signal_data = Column(JSON, nullable=False)  # Data specific to signal type (dict)
     sentiment_score = Column(Float)  # -1 to 1
     strength = Column(Float)  # 0 to 1
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
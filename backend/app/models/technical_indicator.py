@@ -17,8 +17,8 @@ class TechnicalIndicator(Base):
     __tablename__ = "technical_indicators"
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    ticker = Column(String, nullable=False, index=True)
-    timeframe = Column(String, nullable=False, index=True)  # 1m, 5m, 15m, 30m, 1h, 4h, 1d
+    ticker = Column(String, nullable=False)
+    timeframe = Column(String, nullable=False)  # 1m, 5m, 15m, 30m, 1h, 4h, 1d
 
     # Moving Averages
     sma_10 = Column(Float, nullable=True)
@@ -72,10 +72,11 @@ class TechnicalIndicator(Base):
     volume = Column(Integer, nullable=True)
 
     # Timestamp
-    timestamp = Column(DateTime(timezone=True), nullable=False, index=True)
+    timestamp = Column(DateTime(timezone=True), nullable=False)
     calculated_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Unique constraint: one indicator set per ticker/timeframe/timestamp
+    # (its index also serves the (ticker, timeframe) + timestamp lookups)
     __table_args__ = (
         UniqueConstraint('ticker', 'timeframe', 'timestamp', name='uix_ticker_timeframe_timestamp'),
     )
@@ -2,7 +2,7 @@
 Trades Model
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Index, JSON
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from ..database import Base
@@ -24,11 +24,18 @@ class Trade(Base):
     status = Column(String, default='PENDING', index=True)  # PENDING/FILLED/CANCELLED/FAILED
     executed_at = Column(DateTime(timezone=True))
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
-    broker_response = Column(String)  # JSON response from broker
+    broker_response = Column(JSON)  # Response from broker
     llm_decision_id = Column(Integer, ForeignKey('llm_decisions.id'))
 
     # Relationship to LLM decision
     llm_decision = relationship("LLMDecision", back_populates="trades")
 
+    __table_args__ = (
+        # Trade history pages are keyed on (executed_at, id), newest first
+        Index('ix_trades_executed_at_id', executed_at.desc(), id.desc()),
+        # Win/loss recount: FILLED rows already in per-ticker execution order
+        Index('ix_trades_status_ticker_executed', status, ticker, executed_at),
+    )
+
     def __repr__(self):
         return f"<Trade(ticker='{self.ticker}', action='{self.action}', quantity={self.quantity}, status='{self.status}')>"
@@ -6,7 +6,7 @@ Backtesting API Routes
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional
+from typing import Literal, Optional
 from datetime import datetime
 from pydantic import BaseModel
 
@@ -16,13 +16,25 @@ from ..services.strategies import MACrossStrategy, RSIStrategy, BollingerStrateg
 
 router = APIRouter(prefix="/api/backtest", tags=["backtesting"])
 
+# 전략 이름 -> 전략 클래스 (요청마다 선택된 전략 하나만 생성; params는 인스턴스별로 가변)
+STRATEGY_FACTORIES = {
+    "MA_CROSS": MACrossStrategy,
+    "RSI": RSIStrategy,
+    "BOLLINGER": BollingerStrategy,
+    "MACD": MACDStrategy,
+    "VWAP": VWAPStrategy,
+}
+
+# 허용 전략 이름 (잘못된 이름은 요청 파싱 단계에서 422로 거부)
+StrategyName = Literal[tuple(STRATEGY_FACTORIES)]
+
 
 class BacktestRequest(BaseModel):
     ticker: str
-    strategy_name: str
+    strategy_name: StrategyName
     timeframe: str = "1h"
-    start_date: Optional[str] = None
-    end_date: Optional[str] = None
+    start_date: Optional[datetime] = None  # ISO 8601 (날짜만 주면 자정)
+    end_date: Optional[datetime] = None
     initial_capital: float = 10000.0
     commission: float = 0.001
 
@@ -41,32 +53,18 @@ async def run_backtest(
     Returns:
         백테스트 결과
     """
-    service = BacktestingService(db)
+    # 선택한 전략만 생성
+    strategy = STRATEGY_FACTORIES[request.strategy_name]()
 
-    # 전략 인스턴스 생성
-    strategy_map = {
-        "MA_CROSS": MACrossStrategy(),
-        "RSI": RSIStrategy(),
-        "BOLLINGER": BollingerStrategy(),
-        "MACD": MACDStrategy(),
-        "VWAP": VWAPStrategy(),
-    }
-
-    strategy = strategy_map.get(request.strategy_name)
-    if not strategy:
-        raise HTTPException(status_code=400, detail=f"Unknown strategy: {request.strategy_name}")
-
-    # 날짜 파싱
-    start_date = datetime.fromisoformat(request.start_date) if request.start_date else None
-    end_date = datetime.fromisoformat(request.end_date) if request.end_date else None
+    service = BacktestingService(db)
 
     # 백테스트 실행
     result = await service.run_backtest(
         ticker=request.ticker,
         strategy=strategy,
         timeframe=request.timeframe,
-        start_date=start_date,
-        end_date=end_date,
+        start_date=request.start_date,
+        end_date=request.end_date,
         initial_capital=request.initial_capital,
         commission=request.commission
     )
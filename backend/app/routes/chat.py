@@ -2,128 +2,229 @@
 Chat API Routes for AI Investment Analysis
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
+from sqlalchemy import func, select
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
+import json
 import logging
-import google.generativeai as genai
+import random
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from types import SimpleNamespace
 from typing import Optional
 
-from ..database import get_db
-from ..services.portfolio_manager import PortfolioManager
+from ..cache import cached_market_summary, cached_portfolio_state, get_investment_preferences, prefs_cache
+from ..database import get_db, AsyncSessionLocal
+from ..dependencies import get_broker_service, get_market_data_service
+from ..models import InvestmentPreference
 from ..services.broker_service import BrokerService
 from ..services.market_data_service import MarketDataService
-from ..config import Settings
+from ..services.portfolio_manager import PortfolioManager
+from ..config import Settings, get_settings
+from ..utils.rate_limit import TokenBucketLimiter
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api")
 
 
+# Longest message prefix the preference extractor looks at
+PREFERENCE_SCAN_MAX_CHARS = 2048
+
+# Preference extraction patterns, built once at import rather than per chat turn
+TICKER_RE = re.compile(r'\b([A-Z]{1,5})\b')
+PRICE_MENTION_RE = re.compile(r'\$?\s*(\d+(?:\.\d+)?)\s*(?:달러|불|dollar|usd)')
+PERCENT_RE = re.compile(r'(\d+)\s*%')
+
+RISK_CONSERVATIVE_KEYWORDS = frozenset({'안전', '보수적', '위험 회피', 'conservative', 'safe', '안정', '리스크 낮', '손실 최소'})
+RISK_AGGRESSIVE_KEYWORDS = frozenset({'공격적', '고위험', 'aggressive', 'high risk', '리스크 높', '고수익', '적극'})
+RISK_MODERATE_KEYWORDS = frozenset({'중립', '보통', 'moderate', 'balanced', '균형', '중간'})
+STYLE_GROWTH_KEYWORDS = frozenset({'성장주', 'growth', '그로스', '성장', '미래', '혁신', '신기술'})
+STYLE_VALUE_KEYWORDS = frozenset({'가치주', 'value', '밸류', '저평가', '가치', '저가'})
+STYLE_DIVIDEND_KEYWORDS = frozenset({'배당주', 'dividend', '배당', '배당금', '안정수익', '배당수익'})
+SECTOR_NEGATIVE_KEYWORDS = frozenset({'싫어', '피하', 'avoid', '제외', '안좋', '투자안'})
+SECTOR_POSITIVE_KEYWORDS = frozenset({'좋아', '관심', 'prefer', 'like', '투자', '매수', '추천', '원해', '원함'})
+TICKER_NEGATIVE_KEYWORDS = frozenset({'싫어', '피하', 'avoid', '제외', '안좋', '투자안', '손실', '매도'})
+TICKER_POSITIVE_KEYWORDS = frozenset({'좋아', '추천', 'buy', 'prefer', '매수', '투자', '사고싶', '관심', '원해', '원함'})
+DIVERSIFICATION_KEYWORDS = frozenset({'분산', 'diversif', '여러', '다양', '골고루'})
+DIP_KEYWORDS = frozenset({'하락', '떨어지', '하락장', '저점', 'dip'})
+DIP_BUY_KEYWORDS = frozenset({'매수', 'buy', '사', '기회'})
+MOMENTUM_KEYWORDS = frozenset({'모멘텀', 'momentum', '추세', '상승', '급등', '강세'})
+STRATEGY_NOTE_KEYWORDS = frozenset({'조건', '전략', 'strategy', '방식', '원칙', '기준', '선호', '스타일'})
+DAY_TRADING_KEYWORDS = frozenset({'단타', '데이', 'day trading', '당일', '하루'})
+SWING_TRADING_KEYWORDS = frozenset({'스윙', 'swing', '며칠', '단기'})
+LONG_TERM_KEYWORDS = frozenset({'장기', 'long term', '장투', '오래', '보유', '몇년', '몇 년'})
+PRICE_LIMIT_KEYWORDS = frozenset({'이하', '이내', '까지', '범위', '가격대'})
+RETURN_TARGET_KEYWORDS = frozenset({'수익', 'return', '목표', 'target', '기대', '원해'})
+LOSS_KEYWORDS = frozenset({'손실', 'loss', '손해', '잃', '마이너스'})
+INVESTMENT_TOPIC_KEYWORDS = frozenset({'투자', 'invest', '포트폴리오', '매수', '매도', 'buy', 'sell', '종목', 'stock'})
+
+SECTOR_MAP = {
+    '기술주': 'technology', '테크': 'technology', 'tech': 'technology', 'it': 'technology',
+    '소프트웨어': 'technology', '반도체': 'technology', '클라우드': 'technology',
+    '헬스케어': 'healthcare', '의료': 'healthcare', '제약': 'healthcare', '바이오': 'healthcare',
+    '금융': 'finance', 'bank': 'finance', '은행': 'finance', '증권': 'finance',
+    '에너지': 'energy', '석유': 'energy', '가스': 'energy',
+    '소비재': 'consumer', '리테일': 'consumer', '유통': 'consumer', '쇼핑': 'consumer'
+}
+
+GOAL_MAP = {
+    '은퇴': '은퇴 자금',
+    'retirement': '은퇴 자금',
+    '단기 수익': '단기 수익',
+    'short term': '단기 수익',
+    '자산 증식': '자산 증식',
+    'wealth': '자산 증식',
+    '소득': '소득 창출',
+    'income': '소득 창출'
+}
+
+# Every distinct keyword the extractor reacts to; shared words such as '매수' are scanned once
+PREFERENCE_KEYWORDS = frozenset().union(
+    RISK_CONSERVATIVE_KEYWORDS, RISK_AGGRESSIVE_KEYWORDS, RISK_MODERATE_KEYWORDS,
+    STYLE_GROWTH_KEYWORDS, STYLE_VALUE_KEYWORDS, STYLE_DIVIDEND_KEYWORDS,
+    SECTOR_NEGATIVE_KEYWORDS, SECTOR_POSITIVE_KEYWORDS,
+    TICKER_NEGATIVE_KEYWORDS, TICKER_POSITIVE_KEYWORDS,
+    DIVERSIFICATION_KEYWORDS, DIP_KEYWORDS, DIP_BUY_KEYWORDS, MOMENTUM_KEYWORDS,
+    STRATEGY_NOTE_KEYWORDS, DAY_TRADING_KEYWORDS, SWING_TRADING_KEYWORDS, LONG_TERM_KEYWORDS,
+    PRICE_LIMIT_KEYWORDS, RETURN_TARGET_KEYWORDS, LOSS_KEYWORDS, INVESTMENT_TOPIC_KEYWORDS,
+    SECTOR_MAP, GOAL_MAP,
+)
+
+
+def _matched_keywords(text: str) -> frozenset:
+    """
+    Find which preference keywords occur in a message
+
+    One substring scan per distinct keyword (~150 C-level `in` checks), not
+    one per category; callers then test keyword groups with set intersection
+    instead of rescanning the message per group. A single-pass matcher
+    (Aho-Corasick) would need a native dependency for little gain at this
+    vocabulary size and message cap.
+
+    Args:
+        text: Lower-cased user message
+
+    Returns:
+        Set of keywords contained in the text (substring match)
+    """
+    return frozenset(word for word in PREFERENCE_KEYWORDS if word in text)
+
+
+def _merge_unique(existing: Optional[list], additions: list) -> list:
+    """
+    Append the items not already present, keeping first-seen order
+
+    Args:
+        existing: Current JSON list column value (may be None)
+        additions: Items found in the message (may repeat)
+
+    Returns:
+        `existing` itself when nothing is new (so the upsert sees no change),
+        otherwise a new list
+    """
+    existing = existing or []
+    seen = set(existing)
+    new_items = [item for item in dict.fromkeys(additions) if item not in seen]
+    return [*existing, *new_items] if new_items else existing
+
+
 async def _extract_and_save_preferences(user_message: str, ai_response: str, db: AsyncSession):
     """
     Extract investment preferences from chat conversation and save to database
+
+    Only the first PREFERENCE_SCAN_MAX_CHARS characters of the message are
+    scanned (and saved to custom instructions); preference statements are
+    short, and this bounds the work for pasted or spammed text.
+
+    Args:
+        user_message: User's chat message
+        ai_response: Gemini's reply
+        db: Database session for the read and the upsert
     """
     try:
-        from ..models import InvestmentPreference
-        from sqlalchemy import select
-        from datetime import datetime
+        user_message = user_message[:PREFERENCE_SCAN_MAX_CHARS]
 
         # Keywords to detect preference changes
         user_lower = user_message.lower()
-
-        # Get or create preference record
-        stmt = select(InvestmentPreference).limit(1)
-        result = await db.execute(stmt)
-        prefs = result.scalar_one_or_none()
-
-        if not prefs:
-            prefs = InvestmentPreference()
-            db.add(prefs)
+        hits = _matched_keywords(user_lower)
+
+        # Current preferences, read fresh in this transaction (not from the prompt's
+        # snapshot or the prefs cache) so list merges and appended instructions build
+        # on the latest row; all-None when nothing is saved yet. Edits go to a copy
+        # and only the fields that differ are written back
+        columns = InvestmentPreference.__table__.columns
+        result = await db.execute(select(*columns).limit(1).with_for_update())
+        row = result.mappings().first()
+        current = dict(row) if row is not None else {column.key: None for column in columns}
+        prefs = SimpleNamespace(**current)
 
         changed = False
 
         # Extract risk appetite (more aggressive detection)
-        if any(word in user_lower for word in ['안전', '보수적', '위험 회피', 'conservative', 'safe', '안정', '리스크 낮', '손실 최소']):
+        if hits & RISK_CONSERVATIVE_KEYWORDS:
             prefs.risk_appetite = 'conservative'
             changed = True
-        elif any(word in user_lower for word in ['공격적', '고위험', 'aggressive', 'high risk', '리스크 높', '고수익', '적극']):
+        elif hits & RISK_AGGRESSIVE_KEYWORDS:
             prefs.risk_appetite = 'aggressive'
             changed = True
-        elif any(word in user_lower for word in ['중립', '보통', 'moderate', 'balanced', '균형', '중간']):
+        elif hits & RISK_MODERATE_KEYWORDS:
             prefs.risk_appetite = 'moderate'
             changed = True
 
         # Extract investment style (more aggressive detection)
-        if any(word in user_lower for word in ['성장주', 'growth', '그로스', '성장', '미래', '혁신', '신기술']):
+        if hits & STYLE_GROWTH_KEYWORDS:
             prefs.investment_style = 'growth'
             changed = True
-        elif any(word in user_lower for word in ['가치주', 'value', '밸류', '저평가', '가치', '저가']):
+        elif hits & STYLE_VALUE_KEYWORDS:
             prefs.investment_style = 'value'
             changed = True
-        elif any(word in user_lower for word in ['배당주', 'dividend', '배당', '배당금', '안정수익', '배당수익']):
+        elif hits & STYLE_DIVIDEND_KEYWORDS:
             prefs.investment_style = 'dividend'
             changed = True
 
-        # Extract sector preferences (expanded keywords)
-        sector_map = {
-            '기술주': 'technology', '테크': 'technology', 'tech': 'technology', 'it': 'technology',
-            '소프트웨어': 'technology', '반도체': 'technology', '클라우드': 'technology',
-            '헬스케어': 'healthcare', '의료': 'healthcare', '제약': 'healthcare', '바이오': 'healthcare',
-            '금융': 'finance', 'bank': 'finance', '은행': 'finance', '증권': 'finance',
-            '에너지': 'energy', '석유': 'energy', '가스': 'energy',
-            '소비재': 'consumer', '리테일': 'consumer', '유통': 'consumer', '쇼핑': 'consumer'
-        }
-
-        for keyword, sector in sector_map.items():
-            if keyword in user_lower:
-                if any(neg in user_lower for neg in ['싫어', '피하', 'avoid', '제외', '안좋', '투자안']):
-                    # Add to avoided sectors
-                    avoided = set(prefs.avoided_sectors.split(',')) if prefs.avoided_sectors else set()
-                    avoided.add(sector)
-                    prefs.avoided_sectors = ','.join(filter(None, avoided))
-                    changed = True
-                elif any(pos in user_lower for pos in ['좋아', '관심', 'prefer', 'like', '투자', '매수', '추천', '원해', '원함']):
-                    # Add to preferred sectors
-                    preferred = set(prefs.preferred_sectors.split(',')) if prefs.preferred_sectors else set()
-                    preferred.add(sector)
-                    prefs.preferred_sectors = ','.join(filter(None, preferred))
-                    changed = True
+        # Extract sector preferences (expanded keywords); the sentiment applies to
+        # the whole message, so every mentioned sector is merged in one go
+        sectors = [sector for keyword, sector in SECTOR_MAP.items() if keyword in hits]
+        if sectors:
+            if hits & SECTOR_NEGATIVE_KEYWORDS:
+                prefs.avoided_sectors = _merge_unique(prefs.avoided_sectors, sectors)
+                changed = True
+            elif hits & SECTOR_POSITIVE_KEYWORDS:
+                prefs.preferred_sectors = _merge_unique(prefs.preferred_sectors, sectors)
+                changed = True
 
-        # Extract ticker preferences (simple pattern matching)
-        import re
-        ticker_pattern = r'\b([A-Z]{1,5})\b'
-        tickers = re.findall(ticker_pattern, user_message)
-
-        for ticker in tickers:
-            if len(ticker) >= 2 and len(ticker) <= 5:  # Valid ticker length
-                if any(neg in user_lower for neg in ['싫어', '피하', 'avoid', '제외', '안좋', '투자안', '손실', '매도']):
-                    avoided_tickers = set(prefs.avoided_tickers.split(',')) if prefs.avoided_tickers else set()
-                    avoided_tickers.add(ticker)
-                    prefs.avoided_tickers = ','.join(filter(None, avoided_tickers))
-                    changed = True
-                elif any(pos in user_lower for pos in ['좋아', '추천', 'buy', 'prefer', '매수', '투자', '사고싶', '관심', '원해', '원함']):
-                    preferred_tickers = set(prefs.preferred_tickers.split(',')) if prefs.preferred_tickers else set()
-                    preferred_tickers.add(ticker)
-                    prefs.preferred_tickers = ','.join(filter(None, preferred_tickers))
-                    changed = True
+        # Extract ticker preferences (simple pattern matching, valid ticker length)
+        tickers = [ticker for ticker in TICKER_RE.findall(user_message) if 2 <= len(ticker) <= 5]
+        if tickers:
+            if hits & TICKER_NEGATIVE_KEYWORDS:
+                prefs.avoided_tickers = _merge_unique(prefs.avoided_tickers, tickers)
+                changed = True
+            elif hits & TICKER_POSITIVE_KEYWORDS:
+                prefs.preferred_tickers = _merge_unique(prefs.preferred_tickers, tickers)
+                changed = True
 
         # Extract trading strategy preferences (more aggressive)
-        if any(word in user_lower for word in ['분산', 'diversif', '여러', '다양', '골고루']):
+        if hits & DIVERSIFICATION_KEYWORDS:
             prefs.prefer_diversification = True
             changed = True
 
-        if any(word in user_lower for word in ['하락', '떨어지', '하락장', '저점', 'dip']) and \
-           any(word in user_lower for word in ['매수', 'buy', '사', '기회']):
+        if hits & DIP_KEYWORDS and hits & DIP_BUY_KEYWORDS:
             prefs.prefer_dip_buying = True
             changed = True
 
-        if any(word in user_lower for word in ['모멘텀', 'momentum', '추세', '상승', '급등', '강세']):
+        if hits & MOMENTUM_KEYWORDS:
             prefs.prefer_momentum = True
             changed = True
 
         # Save custom instructions (more inclusive)
-        if any(word in user_lower for word in ['조건', '전략', 'strategy', '방식', '원칙', '기준', '선호', '스타일']):
+        if hits & STRATEGY_NOTE_KEYWORDS:
             if prefs.custom_instructions:
                 prefs.custom_instructions += f"\n[{datetime.now().strftime('%Y-%m-%d')}] {user_message}"
             else:
@@ -131,21 +232,21 @@ async def _extract_and_save_preferences(user_message: str, ai_response: str, db:
             changed = True
 
         # Extract trading behavior preferences (NEW)
-        if any(word in user_lower for word in ['단타', '데이', 'day trading', '당일', '하루']):
+        if hits & DAY_TRADING_KEYWORDS:
             prefs.prefer_day_trading = True
             changed = True
 
-        if any(word in user_lower for word in ['스윙', 'swing', '며칠', '단기']):
+        if hits & SWING_TRADING_KEYWORDS:
             prefs.prefer_swing_trading = True
             changed = True
 
-        if any(word in user_lower for word in ['장기', 'long term', '장투', '오래', '보유', '몇년', '몇 년']):
+        if hits & LONG_TERM_KEYWORDS:
             prefs.prefer_long_term = True
             changed = True
 
         # Extract price range preferences (NEW)
-        price_mentions = re.findall(r'\$?\s*(\d+(?:\.\d+)?)\s*(?:달러|불|dollar|usd)', user_lower)
-        if price_mentions and any(word in user_lower for word in ['이하', '이내', '까지', '범위', '가격대']):
+        price_mentions = PRICE_MENTION_RE.findall(user_lower)
+        if price_mentions and hits & PRICE_LIMIT_KEYWORDS:
             try:
                 max_price = float(price_mentions[0])
                 if max_price > 0 and max_price < 10000:  # Reasonable range
@@ -155,25 +256,15 @@ async def _extract_and_save_preferences(user_message: str, ai_response: str, db:
                 pass
 
         # Extract investment goals (NEW)
-        goal_map = {
-            '은퇴': '은퇴 자금',
-            'retirement': '은퇴 자금',
-            '단기 수익': '단기 수익',
-            'short term': '단기 수익',
-            '자산 증식': '자산 증식',
-            'wealth': '자산 증식',
-            '소득': '소득 창출',
-            'income': '소득 창출'
-        }
-        for keyword, goal in goal_map.items():
-            if keyword in user_lower:
+        for keyword, goal in GOAL_MAP.items():
+            if keyword in hits:
                 prefs.investment_goal = goal
                 changed = True
                 break
 
         # Extract target return expectations (NEW)
-        return_mentions = re.findall(r'(\d+)\s*%', user_message)
-        if return_mentions and any(word in user_lower for word in ['수익', 'return', '목표', 'target', '기대', '원해']):
+        return_mentions = PERCENT_RE.findall(user_message)
+        if return_mentions and hits & RETURN_TARGET_KEYWORDS:
             try:
                 target = float(return_mentions[0])
                 if 1 <= target <= 200:  # Reasonable range
@@ -183,8 +274,8 @@ async def _extract_and_save_preferences(user_message: str, ai_response: str, db:
                 pass
 
         # Extract loss tolerance (NEW)
-        if any(word in user_lower for word in ['손실', 'loss', '손해', '잃', '마이너스']):
-            loss_mentions = re.findall(r'(\d+)\s*%', user_message)
+        if hits & LOSS_KEYWORDS:
+            loss_mentions = PERCENT_RE.findall(user_message)
             if loss_mentions:
                 try:
                     max_loss = float(loss_mentions[0])
@@ -195,7 +286,7 @@ async def _extract_and_save_preferences(user_message: str, ai_response: str, db:
                     pass
 
         # Save any investment-related conversation to custom instructions
-        if any(word in user_lower for word in ['투자', 'invest', '포트폴리오', '매수', '매도', 'buy', 'sell', '종목', 'stock']):
+        if hits & INVESTMENT_TOPIC_KEYWORDS:
             if not prefs.custom_instructions or user_message not in prefs.custom_instructions:
                 if prefs.custom_instructions:
                     prefs.custom_instructions += f"\n[{datetime.now().strftime('%Y-%m-%d')}] {user_message}"
@@ -204,12 +295,24 @@ async def _extract_and_save_preferences(user_message: str, ai_response: str, db:
                 changed = True
 
         if changed:
-            prefs.last_updated_by_chat = datetime.now()
+            values = {key: value for key, value in vars(prefs).items() if value != current[key]}
+            values['last_updated_by_chat'] = datetime.now()
+
+            # Single-statement upsert of the singleton row (column defaults fill a new row)
+            stmt = insert(InvestmentPreference).values(id=current['id'] or 1, **values)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['id'],
+                set_={**values, 'updated_at': func.now()}
+            )
+            await db.execute(stmt)
             await db.commit()
-            logger.info(f"[CHAT] 💾 Investment preferences updated from conversation")
+
+            # Core statements skip the ORM events that normally invalidate the cache
+            prefs_cache.clear()
+            logger.info("[CHAT] 💾 Investment preferences updated from conversation")
 
     except Exception as e:
-        logger.error(f"[CHAT] Failed to extract preferences: {e}")
+        logger.error("[CHAT] Failed to extract preferences: %s", e)
         # Don't fail the chat if preference extraction fails
         pass
 
@@ -223,200 +326,60 @@ class ChatResponse(BaseModel):
     error: Optional[str] = None
 
 
-# Dependency: Get services
-async def get_services(db: AsyncSession = Depends(get_db)):
-    """Get initialized services"""
-    settings = Settings()
-    broker = BrokerService(settings)
-    portfolio = PortfolioManager(broker, settings, db)
-    market_data = MarketDataService(settings)
-
-    return {
-        'settings': settings,
-        'broker': broker,
-        'portfolio': portfolio,
-        'market_data': market_data,
-        'db': db
-    }
-
-
-@router.post("/chat", response_model=ChatResponse)
-async def chat_endpoint(
-    request: ChatRequest,
-    services: dict = Depends(get_services)
-):
-    """
-    AI 투자 분석 챗봇 엔드포인트
+@dataclass(slots=True, frozen=True)
+class ChatServices:
+    """Services injected into the chat endpoints"""
+    settings: Settings
+    broker: BrokerService
+    portfolio: PortfolioManager
+    market_data: MarketDataService
+    db: AsyncSession
 
-    사용자의 질문을 받아 포트폴리오 정보와 함께 Gemini AI에 전달하여
-    투자 분석 및 조언을 제공합니다.
-    """
-    try:
-        logger.info(f"[CHAT] 📨 Chat request received: '{request.message[:100]}...'")
-
-        settings = services['settings']
-        portfolio = services['portfolio']
-        market_data = services['market_data']
-
-        # Gemini API 키 확인
-        logger.info("[CHAT] 🔑 Checking Gemini API key...")
-        if not settings.gemini_api_key:
-            logger.warning("[CHAT] ❌ Gemini API key not configured")
-            return ChatResponse(
-                response="",
-                error="Gemini API 키가 설정되지 않았습니다. 설정 페이지에서 API 키를 입력해주세요."
-            )
-        logger.info(f"[CHAT] ✅ Gemini API key found: {settings.gemini_api_key[:8]}...")
-
-        # 포트폴리오 현재 상태 가져오기
-        logger.info("[CHAT] 📊 Fetching portfolio state...")
-        portfolio_state = await portfolio.get_current_state()
-        logger.info(f"[CHAT] ✅ Portfolio state retrieved: ${portfolio_state.get('total_value', 0):.2f} total, {portfolio_state.get('position_count', 0)} positions")
-
-        # 시장 데이터 가져오기
-        logger.info("[CHAT] 🌐 Fetching market data...")
-        market_summary = await market_data.get_market_summary()
-        logger.info(f"[CHAT] ✅ Market data retrieved: {len(market_summary.get('wsb_trending', []))} WSB stocks")
-
-        # 사용자 투자 선호도 가져오기
-        logger.info("[CHAT] 🎯 Loading user investment preferences...")
-        from ..models import InvestmentPreference
-        from sqlalchemy import select
-        stmt = select(InvestmentPreference).limit(1)
-        result = await services['db'].execute(stmt)
-        user_prefs = result.scalar_one_or_none()
-        logger.info(f"[CHAT] ✅ User preferences loaded: {user_prefs is not None}")
-
-        # Gemini 설정 - NEW google-genai SDK with Google Search Grounding
-        logger.info("[CHAT] 🤖 Initializing Gemini API with Google Search...")
-        from google import genai as genai_new
-        from google.genai import types
-
-        # Create client with API key
-        genai_client = genai_new.Client(api_key=settings.gemini_api_key)
-
-        # Configure Google Search tool for real-time market data
-        google_search_tool = types.Tool(
-            google_search=types.GoogleSearch()
-        )
 
-        logger.info("[CHAT] 🎯 Using gemini-3-flash-preview with Google Search Grounding")
+# Dependency: Get services
+async def get_services(db: AsyncSession = Depends(get_db)) -> ChatServices:
+    """Get initialized services (shared singletons; only the portfolio binds the request's db)"""
+    settings = get_settings()
+    broker = get_broker_service()
+    return ChatServices(
+        settings=settings,
+        broker=broker,
+        portfolio=PortfolioManager(broker, settings, db),
+        market_data=get_market_data_service(),
+        db=db
+    )
 
-        # 컨텍스트 구성
-        logger.info("[CHAT] 📝 Building context with portfolio and market data...")
-        cash_balance = portfolio_state.get('cash_balance', 0)
-        total_value = portfolio_state.get('total_value', 0)
 
-        context = f"""
-당신은 20년 경력의 전문 주식 트레이더이자 포트폴리오 매니저입니다.
-사용자의 계좌를 관리하며, 매수/매도 결정, 리스크 관리, 자산 배분에 대한 전문적인 조언을 제공합니다.
+CHAT_MODEL = "gemini-3-flash-preview"
 
-## 현재 계좌 상태:
-- **총 자산**: ${total_value:.2f}
-- **현금 잔고 (매수 가능 자금)**: ${cash_balance:.2f}
-- **일일 손익**: {portfolio_state.get('daily_pnl_pct', 0):.2f}%
-- **총 손익**: {portfolio_state.get('total_pnl_pct', 0):.2f}%
-- **보유 포지션 수**: {portfolio_state.get('position_count', 0)}개
+# Positions listed in the prompt (largest by market value); the rest are only counted
+CHAT_CONTEXT_MAX_POSITIONS = 20
 
-## 보유 종목:
-"""
+# Upper bound on one Gemini answer (whole reply, including grounding searches)
+CHAT_TIMEOUT_SECONDS = 120.0
 
-        # 사용자 투자 선호도 추가
-        if user_prefs:
-            context += "\n\n## 사용자 투자 선호도 (전문 트레이더로서 반드시 고려):\n"
-
-            # Risk and style
-            risk_map = {'conservative': '보수적 (안전 중시)', 'moderate': '중립적 (균형)', 'aggressive': '공격적 (고위험 고수익)'}
-            style_map = {'growth': '성장주', 'value': '가치주', 'dividend': '배당주', 'balanced': '균형'}
-            context += f"- **위험 성향**: {risk_map.get(user_prefs.risk_appetite, user_prefs.risk_appetite)}\n"
-            context += f"- **투자 스타일**: {style_map.get(user_prefs.investment_style, user_prefs.investment_style)}\n"
-
-            # Sectors
-            if user_prefs.preferred_sectors:
-                context += f"- **선호 섹터**: {user_prefs.preferred_sectors}\n"
-            if user_prefs.avoided_sectors:
-                context += f"- **회피 섹터**: {user_prefs.avoided_sectors}\n"
-
-            # Tickers
-            if user_prefs.preferred_tickers:
-                context += f"- **관심 종목**: {user_prefs.preferred_tickers}\n"
-            if user_prefs.avoided_tickers:
-                context += f"- **투자 제외 종목**: {user_prefs.avoided_tickers}\n"
-
-            # Strategy preferences
-            if user_prefs.prefer_diversification:
-                context += "- **전략**: 분산투자 선호\n"
-            if user_prefs.prefer_dip_buying:
-                context += "- **전략**: 하락장 매수 선호 (저점 매수)\n"
-            if user_prefs.prefer_momentum:
-                context += "- **전략**: 모멘텀 투자 선호 (상승 추세)\n"
-
-            # Trading behavior (NEW)
-            if hasattr(user_prefs, 'prefer_day_trading') and user_prefs.prefer_day_trading:
-                context += "- **매매 스타일**: 단타 (당일 매매)\n"
-            if hasattr(user_prefs, 'prefer_swing_trading') and user_prefs.prefer_swing_trading:
-                context += "- **매매 스타일**: 스윙 트레이딩 (수일~수주)\n"
-            if hasattr(user_prefs, 'prefer_long_term') and user_prefs.prefer_long_term:
-                context += "- **매매 스타일**: 장기 투자\n"
-
-            # Price range (NEW)
-            if hasattr(user_prefs, 'max_stock_price') and user_prefs.max_stock_price and user_prefs.max_stock_price > 0:
-                context += f"- **가격대 선호**: ${user_prefs.max_stock_price:.2f} 이하\n"
-
-            # Investment goal (NEW)
-            if hasattr(user_prefs, 'investment_goal') and user_prefs.investment_goal:
-                context += f"- **투자 목표**: {user_prefs.investment_goal}\n"
-
-            # Target return (NEW)
-            if hasattr(user_prefs, 'target_annual_return_pct') and user_prefs.target_annual_return_pct and user_prefs.target_annual_return_pct > 0:
-                context += f"- **목표 수익률**: 연 {user_prefs.target_annual_return_pct:.1f}%\n"
-
-            # Loss tolerance (NEW)
-            if hasattr(user_prefs, 'max_acceptable_loss_pct') and user_prefs.max_acceptable_loss_pct:
-                context += f"- **최대 허용 손실**: {user_prefs.max_acceptable_loss_pct:.1f}%\n"
-
-            # Custom instructions
-            if user_prefs.custom_instructions:
-                context += f"\n**추가 투자 지침**:\n{user_prefs.custom_instructions}\n"
-
-            context += "\n"
-
-        context += """
-"""
+# Gemini 429 (rate limit) retries: attempts, exponential backoff base/cap, and total wait budget
+GEMINI_MAX_ATTEMPTS = 3
+GEMINI_BACKOFF_INITIAL_SECONDS = 1.0
+GEMINI_BACKOFF_MAX_SECONDS = 16.0
+GEMINI_BACKOFF_TOTAL_SECONDS = 30.0
 
-        # 보유 종목 정보 추가
-        positions = portfolio_state.get('positions', [])
-        if positions:
-            logger.info(f"[CHAT] 📈 Adding {len(positions)} positions to context")
-            for pos in positions:
-                ticker = pos.get('ticker')
-                quantity = pos.get('quantity', 0)
-                avg_cost = pos.get('avg_cost', 0)
-                current_price = pos.get('current_price', 0)
-                pnl_pct = pos.get('unrealized_pnl_pct', 0)
-                position_value = quantity * current_price
-
-                context += f"""
-- **{ticker}**: {quantity}주
-  평단가: ${avg_cost:.2f} | 현재가: ${current_price:.2f}
-  포지션 가치: ${position_value:.2f} | 손익률: {pnl_pct:+.2f}%
-"""
-        else:
-            logger.info("[CHAT] 📭 No positions to add")
-            context += "- 현재 보유 종목이 없습니다. 신규 투자 기회를 찾아주세요.\n"
+RATE_LIMIT_ERROR_MESSAGE = "AI 요청 한도를 초과했습니다. 잠시 후 다시 시도해주세요."
 
-        # 시장 데이터 추가
-        context += f"\n\n{market_summary.get('summary_text', '')}\n"
+# Local gate in front of Gemini/broker calls: 10 chat requests per minute per client
+chat_limiter = TokenBucketLimiter(capacity=10, per_seconds=60)
+CHAT_THROTTLED_MESSAGE = "요청이 너무 많습니다. 잠시 후 다시 시도해주세요."
 
-        context += f"""
 
-## 사용자 질문: {request.message}
+# Static parts of the chat prompt (only the account block, preferences, positions,
+# market summary, question and cash balance are filled in per request)
+CHAT_PROMPT_PERSONA = """
+당신은 20년 경력의 전문 주식 트레이더이자 포트폴리오 매니저입니다.
+사용자의 계좌를 관리하며, 매수/매도 결정, 리스크 관리, 자산 배분에 대한 전문적인 조언을 제공합니다.
 
-## 전문 트레이더로서의 대응 방침:
+"""
 
-### 🎯 핵심 원칙:
-1. **현금 잔고 고려**: 매수 추천 시 현재 현금 ${cash_balance:.2f}로 실제 구매 가능한 종목만 제안
-2. **현실적인 가격대**: 고가 종목(주가 $500 이상)은 현금이 충분하지 않으면 제외
+CHAT_PROMPT_GUIDELINES = """2. **현실적인 가격대**: 고가 종목(주가 $500 이상)은 현금이 충분하지 않으면 제외
 3. **매수와 매도 균형**: 보유 종목이 있으면 매도/보유 검토도 함께 제안
 4. **손절/익절 판단**: 보유 종목 중 -10% 이상 손실이나 +20% 이상 수익 달성 시 매도 고려
 5. **리스크 관리**: 한 종목에 과도한 집중 투자 지양, 분산투자 강조
@@ -441,41 +404,358 @@ async def chat_endpoint(
 ### 📝 학습 기능:
 사용자의 메시지에서 투자 선호도, 관심 종목, 투자 스타일 등의 힌트를 파악하여 답변에 반영하고, 이러한 정보는 자동으로 저장됩니다.
 """
-        logger.info(f"[CHAT] ✅ Context built ({len(context)} chars)")
 
-        # Gemini API 호출 with timeout and retry - NEW SDK with Google Search
-        import asyncio
 
-        logger.info("[CHAT] 🚀 Calling Gemini API with Google Search (timeout: 120s)...")
+async def _build_chat_context(message: str, services: ChatServices) -> str:
+    """
+    Build the Gemini prompt for a chat message
+
+    Args:
+        message: User's chat message
+        services: Services from get_services
+
+    Returns:
+        Prompt with account state, investment preferences and market data
+    """
+    portfolio = services.portfolio
+    market_data = services.market_data
+
+    # 포트폴리오 현재 상태 + 시장 데이터 동시 조회 (지연 시간 = 둘 중 긴 쪽)
+    logger.debug("[CHAT] 📊 Fetching portfolio state and market data...")
+    portfolio_state, market_summary = await asyncio.gather(
+        cached_portfolio_state(portfolio),
+        cached_market_summary(market_data),
+        return_exceptions=True
+    )
+
+    # 한쪽이 실패해도 나머지 정보로 답변
+    if isinstance(portfolio_state, Exception):
+        logger.error("[CHAT] ❌ Failed to fetch portfolio state: %s", portfolio_state)
+        portfolio_state = {'error': str(portfolio_state)}
+    else:
+        logger.debug("[CHAT] ✅ Portfolio state retrieved: $%.2f total, %s positions",
+                     portfolio_state.get('total_value', 0), portfolio_state.get('position_count', 0))
+
+    if isinstance(market_summary, Exception):
+        logger.error("[CHAT] ❌ Failed to fetch market data: %s", market_summary)
+        market_summary = {}
+    else:
+        logger.debug("[CHAT] ✅ Market data retrieved: %d WSB stocks", len(market_summary.get('wsb_trending', [])))
+
+    # 사용자 투자 선호도 가져오기
+    logger.debug("[CHAT] 🎯 Loading user investment preferences...")
+    user_prefs = await get_investment_preferences(services.db)
+    logger.debug("[CHAT] ✅ User preferences loaded: %s", user_prefs is not None)
+
+    context = build_context(portfolio_state, market_summary, user_prefs, message)
+    logger.debug("[CHAT] ✅ Context built (%d chars)", len(context))
+
+    return context
+
+
+def build_context(portfolio_state: dict, market_summary: dict, user_prefs, user_message: str) -> str:
+    """
+    Assemble the Gemini chat prompt (pure, no I/O)
+
+    Args:
+        portfolio_state: Result of PortfolioManager.get_portfolio_state (or {'error': ...})
+        market_summary: Result of MarketDataService.get_market_summary (or {})
+        user_prefs: Preferences snapshot from get_investment_preferences (every column set), or None
+        user_message: User's chat message
+
+    Returns:
+        Prompt text
+    """
+    cash_balance = portfolio_state.get('cash_balance', 0)
+    total_value = portfolio_state.get('total_value', 0)
+
+    parts = [CHAT_PROMPT_PERSONA, f"""## 현재 계좌 상태:
+- **총 자산**: ${total_value:.2f}
+- **현금 잔고 (매수 가능 자금)**: ${cash_balance:.2f}
+- **일일 손익**: {portfolio_state.get('daily_pnl_pct', 0):.2f}%
+- **총 손익**: {portfolio_state.get('total_pnl_pct', 0):.2f}%
+- **보유 포지션 수**: {portfolio_state.get('position_count', 0)}개
+
+## 보유 종목:
+"""]
+
+    # 사용자 투자 선호도 추가
+    if user_prefs:
+        parts.append("\n\n## 사용자 투자 선호도 (전문 트레이더로서 반드시 고려):\n")
+
+        # Risk and style
+        risk_map = {'conservative': '보수적 (안전 중시)', 'moderate': '중립적 (균형)', 'aggressive': '공격적 (고위험 고수익)'}
+        style_map = {'growth': '성장주', 'value': '가치주', 'dividend': '배당주', 'balanced': '균형'}
+        parts.append(f"- **위험 성향**: {risk_map.get(user_prefs.risk_appetite, user_prefs.risk_appetite)}\n")
+        parts.append(f"- **투자 스타일**: {style_map.get(user_prefs.investment_style, user_prefs.investment_style)}\n")
+
+        # Sectors
+        if user_prefs.preferred_sectors:
+            parts.append(f"- **선호 섹터**: {', '.join(user_prefs.preferred_sectors)}\n")
+        if user_prefs.avoided_sectors:
+            parts.append(f"- **회피 섹터**: {', '.join(user_prefs.avoided_sectors)}\n")
+
+        # Tickers
+        if user_prefs.preferred_tickers:
+            parts.append(f"- **관심 종목**: {', '.join(user_prefs.preferred_tickers)}\n")
+        if user_prefs.avoided_tickers:
+            parts.append(f"- **투자 제외 종목**: {', '.join(user_prefs.avoided_tickers)}\n")
+
+        # Strategy preferences
+        if user_prefs.prefer_diversification:
+            parts.append("- **전략**: 분산투자 선호\n")
+        if user_prefs.prefer_dip_buying:
+            parts.append("- **전략**: 하락장 매수 선호 (저점 매수)\n")
+        if user_prefs.prefer_momentum:
+            parts.append("- **전략**: 모멘텀 투자 선호 (상승 추세)\n")
+
+        # Trading behavior (NEW)
+        if user_prefs.prefer_day_trading:
+            parts.append("- **매매 스타일**: 단타 (당일 매매)\n")
+        if user_prefs.prefer_swing_trading:
+            parts.append("- **매매 스타일**: 스윙 트레이딩 (수일~수주)\n")
+        if user_prefs.prefer_long_term:
+            parts.append("- **매매 스타일**: 장기 투자\n")
+
+        # Price range (NEW)
+        if user_prefs.max_stock_price and user_prefs.max_stock_price > 0:
+            parts.append(f"- **가격대 선호**: ${user_prefs.max_stock_price:.2f} 이하\n")
+
+        # Investment goal (NEW)
+        if user_prefs.investment_goal:
+            parts.append(f"- **투자 목표**: {user_prefs.investment_goal}\n")
+
+        # Target return (NEW)
+        if user_prefs.target_annual_return_pct and user_prefs.target_annual_return_pct > 0:
+            parts.append(f"- **목표 수익률**: 연 {user_prefs.target_annual_return_pct:.1f}%\n")
+
+        # Loss tolerance (NEW)
+        if user_prefs.max_acceptable_loss_pct:
+            parts.append(f"- **최대 허용 손실**: {user_prefs.max_acceptable_loss_pct:.1f}%\n")
+
+        # Custom instructions
+        if user_prefs.custom_instructions:
+            parts.append(f"\n**추가 투자 지침**:\n{user_prefs.custom_instructions}\n")
+
+        parts.append("\n")
+
+    parts.append("""
+""")
+
+    # 보유 종목 정보 추가
+    positions = portfolio_state.get('positions', [])
+    if positions:
+        logger.debug("[CHAT] 📈 Adding %d positions to context", len(positions))
+        # 평가금액 상위 종목만 한 줄 CSV로 (프롬프트 토큰 절약)
+        ranked = sorted(positions, key=lambda pos: pos['quantity'] * pos['current_price'], reverse=True)
+        parts.append("\nticker,qty,avg_cost,price,value,pnl%\n")
+        parts.extend(
+            f"{pos['ticker']},{pos['quantity']},{pos['avg_cost']:.2f},{pos['current_price']:.2f},"
+            f"{pos['quantity'] * pos['current_price']:.2f},{pos['unrealized_pnl_pct']:+.2f}%\n"
+            for pos in ranked[:CHAT_CONTEXT_MAX_POSITIONS]
+        )
+        if len(ranked) > CHAT_CONTEXT_MAX_POSITIONS:
+            parts.append(f"... 외 {len(ranked) - CHAT_CONTEXT_MAX_POSITIONS}개 종목\n")
+    else:
+        logger.debug("[CHAT] 📭 No positions to add")
+        parts.append("- 현재 보유 종목이 없습니다. 신규 투자 기회를 찾아주세요.\n")
+
+    # 시장 데이터 추가
+    parts.append(f"\n\n{market_summary.get('summary_text', '')}\n")
+
+    parts.extend([f"""
+
+## 사용자 질문: {user_message}
+
+## 전문 트레이더로서의 대응 방침:
+
+### 🎯 핵심 원칙:
+1. **현금 잔고 고려**: 매수 추천 시 현재 현금 ${cash_balance:.2f}로 실제 구매 가능한 종목만 제안
+""", CHAT_PROMPT_GUIDELINES])
+    return "".join(parts)
+
+
+@lru_cache(maxsize=1)
+def _gemini_chat_client(api_key: str):
+    """
+    Get the Gemini client and generation config used for chat
+
+    Built once and reused across requests; a different API key (changed in
+    settings) replaces the cached client.
+
+    Args:
+        api_key: Gemini API key
+
+    Returns:
+        Tuple of (genai client, GenerateContentConfig with Google Search grounding)
+    """
+    # NEW google-genai SDK with Google Search Grounding
+    from google import genai as genai_new
+    from google.genai import types
+
+    client = genai_new.Client(api_key=api_key)
+
+    # Configure Google Search tool for real-time market data
+    google_search_tool = types.Tool(
+        google_search=types.GoogleSearch()
+    )
+    config = types.GenerateContentConfig(
+        tools=[google_search_tool],
+        response_modalities=["TEXT"],
+        temperature=0.3
+    )
+    return client, config
+
+
+def _client_key(http_request: Request) -> str:
+    """Identify the caller for chat rate limiting (client IP)"""
+    return http_request.client.host if http_request.client else "unknown"
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """Whether a Gemini call failed with HTTP 429 (RESOURCE_EXHAUSTED)"""
+    from google.genai import errors
+    return isinstance(error, errors.APIError) and error.code == 429
+
+
+def _rate_limit_delay(error: Exception, attempt: int, waited: float) -> Optional[float]:
+    """
+    Decide whether to retry a failed Gemini call and how long to wait first
+
+    Args:
+        error: Exception raised by the call
+        attempt: Zero-based index of the attempt that failed
+        waited: Seconds already spent backing off for this request
+
+    Returns:
+        Seconds to sleep before retrying, or None to give up (not a 429,
+        out of attempts, or the wait budget would be exceeded)
+    """
+    if not _is_rate_limited(error) or attempt >= GEMINI_MAX_ATTEMPTS - 1:
+        return None
+
+    # Honor Retry-After (seconds) when the server sends it, else jittered exponential backoff
+    headers = getattr(getattr(error, 'response', None), 'headers', None) or {}
+    try:
+        delay = float(headers.get('retry-after'))
+    except (TypeError, ValueError):
+        delay = GEMINI_BACKOFF_INITIAL_SECONDS * 2 ** attempt + random.uniform(0, 1)
+    delay = min(delay, GEMINI_BACKOFF_MAX_SECONDS)
+
+    if waited + delay > GEMINI_BACKOFF_TOTAL_SECONDS:
+        return None
+    return delay
+
+
+async def _call_gemini_with_backoff(genai_client, chat_config, context: str):
+    """
+    Call Gemini (120s timeout per attempt), retrying rate-limited calls
+
+    Args:
+        genai_client: google-genai client
+        chat_config: GenerateContentConfig for the request
+        context: Prompt text
+
+    Returns:
+        GenerateContentResponse
+
+    Raises:
+        asyncio.TimeoutError: An attempt exceeded CHAT_TIMEOUT_SECONDS
+        Exception: Non-429 errors immediately, 429 once retries are exhausted
+    """
+    waited = 0.0
+    for attempt in range(GEMINI_MAX_ATTEMPTS):
         try:
-            # Run with 120 second timeout using NEW SDK
-            response = await asyncio.wait_for(
+            return await asyncio.wait_for(
                 asyncio.to_thread(
                     genai_client.models.generate_content,
-                    model="gemini-3-flash-preview",
+                    model=CHAT_MODEL,
                     contents=context,
-                    config=types.GenerateContentConfig(
-                        tools=[google_search_tool],
-                        response_modalities=["TEXT"],
-                        temperature=0.3
-                    )
+                    config=chat_config
                 ),
-                timeout=120.0
+                timeout=CHAT_TIMEOUT_SECONDS
             )
-            logger.info("[CHAT] ✅ Gemini API responded successfully with Google Search")
+        except Exception as e:
+            delay = _rate_limit_delay(e, attempt, waited)
+            if delay is None:
+                raise
+            logger.warning("[CHAT] 🚦 Gemini rate limited, retrying in %.1fs (attempt %d)", delay, attempt + 1)
+            await asyncio.sleep(delay)
+            waited += delay
+
+
+async def _save_preferences_in_background(user_message: str, ai_response: str):
+    """Extract preferences after the reply is sent (the request's db session is already closed)"""
+    async with AsyncSessionLocal() as db:
+        await _extract_and_save_preferences(user_message, ai_response, db)
+
+
+@router.post("/chat", response_model=ChatResponse, response_class=ORJSONResponse)
+async def chat_endpoint(
+    request: ChatRequest,
+    http_request: Request,
+    background_tasks: BackgroundTasks,
+    services: ChatServices = Depends(get_services)
+):
+    """
+    AI 투자 분석 챗봇 엔드포인트
+
+    사용자의 질문을 받아 포트폴리오 정보와 함께 Gemini AI에 전달하여
+    투자 분석 및 조언을 제공합니다.
+    """
+    try:
+        logger.info("[CHAT] 📨 Chat request received: '%s...'", request.message[:100])
+
+        # 요청 한도 확인 (Gemini/브로커 호출 전에 차단)
+        client_key = _client_key(http_request)
+        if not chat_limiter.allow(client_key):
+            logger.warning("[CHAT] 🚦 Chat request throttled for %s", client_key)
+            return ChatResponse(response="", error=CHAT_THROTTLED_MESSAGE)
+
+        settings = services.settings
+
+        # Gemini API 키 확인
+        logger.debug("[CHAT] 🔑 Checking Gemini API key...")
+        if not settings.gemini_api_key:
+            logger.warning("[CHAT] ❌ Gemini API key not configured")
+            return ChatResponse(
+                response="",
+                error="Gemini API 키가 설정되지 않았습니다. 설정 페이지에서 API 키를 입력해주세요."
+            )
+        logger.debug("[CHAT] ✅ Gemini API key found: %s...", settings.gemini_api_key[:8])
+
+        context = await _build_chat_context(request.message, services)
+
+        logger.debug("[CHAT] 🤖 Using %s with Google Search Grounding", CHAT_MODEL)
+        genai_client, chat_config = _gemini_chat_client(settings.gemini_api_key)
+
+        # Gemini API 호출 with timeout and retry - NEW SDK with Google Search
+        logger.debug("[CHAT] 🚀 Calling Gemini API with Google Search (timeout: %.0fs)...", CHAT_TIMEOUT_SECONDS)
+        try:
+            # Run with 120 second timeout using NEW SDK (429s are retried with backoff)
+            response = await _call_gemini_with_backoff(genai_client, chat_config, context)
+            logger.debug("[CHAT] ✅ Gemini API responded successfully with Google Search")
 
             # Log grounding metadata if available
             if response.candidates and len(response.candidates) > 0:
                 grounding = response.candidates[0].grounding_metadata
                 if grounding and hasattr(grounding, 'search_entry_point') and grounding.search_entry_point:
-                    logger.info("[CHAT] 🔍 Google Search was used for this response")
+                    logger.debug("[CHAT] 🔍 Google Search was used for this response")
 
         except asyncio.TimeoutError:
-            logger.error("[CHAT] ⏱️ Gemini API timeout after 120 seconds")
+            logger.error("[CHAT] ⏱️ Gemini API timeout after %.0f seconds", CHAT_TIMEOUT_SECONDS)
             return ChatResponse(
                 response="",
                 error="AI 응답 시간이 초과되었습니다. 잠시 후 다시 시도해주세요."
             )
+        except Exception as e:
+            if not _is_rate_limited(e):
+                raise
+            logger.error("[CHAT] 🚦 Gemini rate limit persisted after retries: %s", e)
+            return ChatResponse(
+                response="",
+                error=RATE_LIMIT_ERROR_MESSAGE
+            )
 
         if not response or not response.text:
             logger.error("[CHAT] ❌ Empty response from Gemini API")
@@ -484,35 +764,172 @@ async def chat_endpoint(
                 error="AI 응답을 생성하지 못했습니다. 다시 시도해주세요."
             )
 
-        response_length = len(response.text)
-        logger.info(f"[CHAT] 📤 Response generated ({response_length} chars)")
+        logger.debug("[CHAT] 📤 Response generated (%d chars)", len(response.text))
 
-        # Extract and save investment preferences from conversation
-        db = services['db']
-        await _extract_and_save_preferences(request.message, response.text, db)
+        # Extract and save investment preferences after the reply is sent
+        background_tasks.add_task(_save_preferences_in_background, request.message, response.text)
 
-        logger.info(f"[CHAT] ✅ Chat request completed successfully")
+        logger.info("[CHAT] ✅ Chat request completed successfully")
 
         return ChatResponse(response=response.text)
 
     except Exception as e:
         error_msg = f"오류가 발생했습니다: {str(e)}"
-        logger.error(f"[CHAT] 💥 Exception caught: {type(e).__name__}")
-        logger.error(f"[CHAT] 💥 Error message: {str(e)}", exc_info=True)
+        logger.error("[CHAT] 💥 Exception caught: %s", type(e).__name__)
+        logger.error("[CHAT] 💥 Error message: %s", e, exc_info=True)
 
         # Return proper JSON even on error
         try:
-            logger.info("[CHAT] 🔄 Returning error response as ChatResponse")
+            logger.debug("[CHAT] 🔄 Returning error response as ChatResponse")
             return ChatResponse(
                 response="",
                 error=error_msg
             )
         except Exception as json_error:
-            logger.error(f"[CHAT] 💥 Failed to create ChatResponse: {json_error}")
+            logger.error("[CHAT] 💥 Failed to create ChatResponse: %s", json_error)
             # Fallback to manual JSON
-            from fastapi.responses import JSONResponse
-            logger.info("[CHAT] 🔄 Falling back to manual JSONResponse")
+            logger.debug("[CHAT] 🔄 Falling back to manual JSONResponse")
             return JSONResponse(
                 status_code=500,
                 content={"response": "", "error": error_msg}
             )
+
+
+def _sse(payload: dict, event: Optional[str] = None) -> str:
+    """Format one Server-Sent Events frame (JSON data keeps newlines in the text intact)"""
+    frame = f"event: {event}\n" if event else ""
+    return frame + f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+
+async def _pump_gemini_stream(genai_client, chat_config, context: str, queue: asyncio.Queue):
+    """
+    Forward Gemini stream chunks into a queue
+
+    Runs as its own task so the response timeout never fires while the
+    client side of the stream is waiting on a slow reader.
+
+    Args:
+        genai_client: google-genai client
+        chat_config: GenerateContentConfig for the request
+        context: Prompt text
+        queue: Receives text chunks, then an Exception on failure, then None
+    """
+    try:
+        async with asyncio.timeout(CHAT_TIMEOUT_SECONDS):
+            sent = False
+            waited = 0.0
+            for attempt in range(GEMINI_MAX_ATTEMPTS):
+                try:
+                    stream = await genai_client.aio.models.generate_content_stream(
+                        model=CHAT_MODEL,
+                        contents=context,
+                        config=chat_config
+                    )
+                    async for chunk in stream:
+                        if chunk.text:
+                            await queue.put(chunk.text)
+                            sent = True
+                    break
+                except Exception as e:
+                    # Only retry before any text went out; a partial answer can't be restarted
+                    delay = None if sent else _rate_limit_delay(e, attempt, waited)
+                    if delay is None:
+                        raise
+                    logger.warning("[CHAT] 🚦 Gemini rate limited, retrying in %.1fs (attempt %d)", delay, attempt + 1)
+                    await asyncio.sleep(delay)
+                    waited += delay
+    except Exception as e:
+        await queue.put(e)
+    finally:
+        await queue.put(None)
+
+
+@router.post("/chat/stream")
+async def chat_stream_endpoint(
+    request: ChatRequest,
+    http_request: Request,
+    background_tasks: BackgroundTasks,
+    services: ChatServices = Depends(get_services)
+):
+    """
+    AI 투자 분석 챗봇 스트리밍 엔드포인트 (Server-Sent Events)
+
+    /api/chat과 같은 컨텍스트로 Gemini 응답을 생성하되, 생성되는 대로
+    `data: {"text": ...}` 프레임으로 전달합니다. 완료 시 `event: done`,
+    실패 시 `event: error` (`data: {"error": ...}`) 프레임을 보냅니다.
+    """
+    logger.info("[CHAT] 📨 Streaming chat request received: '%s...'", request.message[:100])
+    settings = services.settings
+
+    async def error_stream(message: str):
+        yield _sse({'error': message}, event='error')
+
+    client_key = _client_key(http_request)
+    if not chat_limiter.allow(client_key):
+        logger.warning("[CHAT] 🚦 Chat request throttled for %s", client_key)
+        return StreamingResponse(error_stream(CHAT_THROTTLED_MESSAGE), media_type="text/event-stream")
+
+    if not settings.gemini_api_key:
+        logger.warning("[CHAT] ❌ Gemini API key not configured")
+        return StreamingResponse(
+            error_stream("Gemini API 키가 설정되지 않았습니다. 설정 페이지에서 API 키를 입력해주세요."),
+            media_type="text/event-stream"
+        )
+
+    try:
+        context = await _build_chat_context(request.message, services)
+        genai_client, chat_config = _gemini_chat_client(settings.gemini_api_key)
+    except Exception as e:
+        logger.error("[CHAT] 💥 Failed to prepare streaming chat: %s", e, exc_info=True)
+        return StreamingResponse(
+            error_stream(f"오류가 발생했습니다: {str(e)}"),
+            media_type="text/event-stream"
+        )
+
+    # Full reply text, set once the stream finishes without error
+    completed = []
+
+    async def event_stream():
+        queue: asyncio.Queue = asyncio.Queue()
+        pump = asyncio.create_task(_pump_gemini_stream(genai_client, chat_config, context, queue))
+        chunks = []
+        try:
+            while (item := await queue.get()) is not None:
+                if isinstance(item, Exception):
+                    if isinstance(item, TimeoutError):
+                        logger.error("[CHAT] ⏱️ Gemini API stream timeout after %.0f seconds", CHAT_TIMEOUT_SECONDS)
+                        message = "AI 응답 시간이 초과되었습니다. 잠시 후 다시 시도해주세요."
+                    elif _is_rate_limited(item):
+                        logger.error("[CHAT] 🚦 Gemini rate limit persisted after retries: %s", item)
+                        message = RATE_LIMIT_ERROR_MESSAGE
+                    else:
+                        logger.error("[CHAT] 💥 Gemini stream failed: %s", item)
+                        message = f"오류가 발생했습니다: {str(item)}"
+                    yield _sse({'error': message}, event='error')
+                    return
+                chunks.append(item)
+                yield _sse({'text': item})
+        finally:
+            # Client disconnected (or stream finished): stop pulling from Gemini
+            pump.cancel()
+
+        if not chunks:
+            logger.error("[CHAT] ❌ Empty response from Gemini API")
+            yield _sse({'error': "AI 응답을 생성하지 못했습니다. 다시 시도해주세요."}, event='error')
+            return
+
+        completed.append("".join(chunks))
+        logger.info("[CHAT] 📤 Streamed response complete (%d chars)", len(completed[0]))
+        yield _sse({}, event='done')
+
+    async def save_preferences():
+        # Runs after the stream is fully sent; skipped when it ended in an error
+        if completed:
+            await _save_preferences_in_background(request.message, completed[0])
+
+    background_tasks.add_task(save_preferences)
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
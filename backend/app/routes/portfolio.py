@@ -26,7 +26,7 @@ async def get_portfolio_status(
     """
     try:
         state = await portfolio.get_current_state()
-        exposure = await portfolio.calculate_position_exposure()
+        exposure = await portfolio.calculate_position_exposure(state)
 
         return {
             'success': True,
@@ -34,10 +34,10 @@ async def get_investment_preferences(db: AsyncSession = Depends(get_db)):
             "preferences": {
                 "risk_appetite": prefs.risk_appetite,
                 "investment_style": prefs.investment_style,
-                "preferred_sectors": prefs.preferred_sectors.split(',') if prefs.preferred_sectors else [],
-                "avoided_sectors": prefs.avoided_sectors.split(',') if prefs.avoided_sectors else [],
-                "preferred_tickers": prefs.preferred_tickers.split(',') if prefs.preferred_tickers else [],
-                "avoided_tickers": prefs.avoided_tickers.split(',') if prefs.avoided_tickers else [],
+                "preferred_sectors": prefs.preferred_sectors or [],
+                "avoided_sectors": prefs.avoided_sectors or [],
+                "preferred_tickers": prefs.preferred_tickers or [],
+                "avoided_tickers": prefs.avoided_tickers or [],
                 "prefer_diversification": prefs.prefer_diversification,
                 "prefer_dip_buying": prefs.prefer_dip_buying,
                 "prefer_momentum": prefs.prefer_momentum,
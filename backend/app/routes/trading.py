@@ -141,11 +141,10 @@ async def get_decision_detail(
         Detailed decision information
     """
     try:
-        from sqlalchemy import select
+        from sqlalchemy import select, lambda_stmt
         from ..models import LLMDecision
-        import json
 
-        stmt = select(LLMDecision).where(LLMDecision.id == decision_id)
+        stmt = lambda_stmt(lambda: select(LLMDecision).where(LLMDecision.id == decision_id))
         result = await engine.db.execute(stmt)
         decision = result.scalar_one_or_none()
 
@@ -161,9 +160,9 @@ async def get_decision_detail(
                 'response': decision.response,
                 'reasoning': decision.reasoning,
                 'confidence_score': decision.confidence_score,
-                'function_calls': json.loads(decision.function_calls) if decision.function_calls else [],
-                'signals_used': json.loads(decision.signals_used) if decision.signals_used else [],
-                'portfolio_state': json.loads(decision.portfolio_state) if decision.portfolio_state else {},
+                'function_calls': decision.function_calls or [],
+                'signals_used': decision.signals_used or [],
+                'portfolio_state': decision.portfolio_state or {},
                 'created_at': decision.created_at.isoformat() if decision.created_at else None
             }
         }
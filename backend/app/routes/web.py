@@ -11,10 +11,9 @@ from pathlib import Path
 import logging
 
 from ..database import get_db
+from ..dependencies import get_broker_service, get_encryption_service
 from ..services.portfolio_manager import PortfolioManager
-from ..services.broker_service import BrokerService
-from ..services.encryption_service import EncryptionService
-from ..config import Settings
+from ..config import get_settings, reload_settings
 
 logger = logging.getLogger(__name__)
 
@@ -27,11 +26,11 @@ router = APIRouter()
 
 # Dependency: Get services
 async def get_services(db: AsyncSession = Depends(get_db)):
-    """Get initialized services"""
-    settings = Settings()
-    broker = BrokerService(settings)
+    """Get initialized services (shared singletons; only the portfolio binds the request's db)"""
+    settings = get_settings()
+    broker = get_broker_service()
     portfolio = PortfolioManager(broker, settings, db)
-    encryption = EncryptionService()  # Uses default key file path
+    encryption = get_encryption_service()  # Uses default key file path
 
     return {
         'settings': settings,
@@ -282,6 +281,9 @@ async def save_api_keys(
         with open(env_path, 'w') as f:
             f.writelines(lines)
 
+        # Shared settings are cached; pick up the new keys without a restart
+        reload_settings()
+
         # Save auto trading preference
         stmt = select(UserPreference).where(UserPreference.key == 'auto_trading_enabled')
         result = await db.execute(stmt)
@@ -391,6 +393,8 @@ async def save_risk_params(
         with open(env_path, 'w') as f:
             f.writelines(lines)
 
+        reload_settings()
+
         return RedirectResponse(url="/settings?success=리스크 파라미터가 저장되었습니다", status_code=303)
 
     except Exception as e:
@@ -169,15 +169,19 @@ async def get_latest_price(
         최근 체결가 리스트
     """
     try:
+        # ORM 객체 대신 필요한 컬럼만 Row(튜플)로 조회
         stmt = (
-            select(RealtimePrice)
+            select(
+                RealtimePrice.current_price, RealtimePrice.change_price, RealtimePrice.change_rate,
+                RealtimePrice.volume, RealtimePrice.trade_time,
+            )
             .where(RealtimePrice.ticker == ticker)
             .order_by(desc(RealtimePrice.trade_time))
             .limit(limit)
         )
 
         result = await db.execute(stmt)
-        prices = result.scalars().all()
+        prices = result.all()
 
         return {
             "ticker": ticker,
@@ -228,14 +232,14 @@ async def get_latest_orderbook(
 
         # Ask 10호가
         asks = [
-            {"price": getattr(orderbook, f"ask_price_{i}"), "volume": getattr(orderbook, f"ask_volume_{i}")}
-            for i in range(1, 11)
+            {"price": price, "volume": volume}
+            for price, volume in zip(orderbook.ask_prices or [], orderbook.ask_volumes or [])
         ]
 
         # Bid 10호가
         bids = [
-            {"price": getattr(orderbook, f"bid_price_{i}"), "volume": getattr(orderbook, f"bid_volume_{i}")}
-            for i in range(1, 11)
+            {"price": price, "volume": volume}
+            for price, volume in zip(orderbook.bid_prices or [], orderbook.bid_volumes or [])
         ]
 
         return {
@@ -272,8 +276,9 @@ async def get_ohlcv(
         OHLCV 데이터
     """
     try:
+        # ORM 객체 대신 필요한 컬럼만 Row(튜플)로 조회
         stmt = (
-            select(OHLCV)
+            select(OHLCV.open, OHLCV.high, OHLCV.low, OHLCV.close, OHLCV.volume, OHLCV.vwap, OHLCV.timestamp)
             .where(OHLCV.ticker == ticker)
             .where(OHLCV.timeframe == timeframe)
             .order_by(desc(OHLCV.timestamp))
@@ -281,7 +286,7 @@ async def get_ohlcv(
         )
 
         result = await db.execute(stmt)
-        candles = result.scalars().all()
+        candles = result.all()
 
         return {
             "ticker": ticker,
@@ -7,12 +7,14 @@ Backtesting Service
 """
 
 import logging
-from typing import Dict, List, Optional
+import time
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc
+from sqlalchemy.orm import load_only
 
 from ..models.backtest_result import BacktestResult
 from ..models.realtime_price import OHLCV
@@ -21,6 +23,25 @@ from .strategies import BaseStrategy
 
 logger = logging.getLogger(__name__)
 
+# 기간 조회 시 한 번에 가져오는 행 수
+STREAM_BATCH_SIZE = 1000
+
+# 백테스트에 필요한 컬럼만 조회 (ORM 객체 대신 튜플 → DataFrame, 나머지 지표 컬럼은 읽지 않음)
+PRICE_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+INDICATOR_COLUMNS = [
+    'timestamp',
+    'sma_10', 'sma_20', 'sma_50', 'ema_10', 'ema_20', 'ema_50',
+    'rsi_14', 'macd', 'macd_signal', 'macd_histogram',
+    'bb_upper', 'bb_middle', 'bb_lower', 'bb_percent',
+    'vwap',
+]
+
+# 결과 목록 캐시 (UI 폴링 흡수): (ticker, strategy_name, limit) -> (time.monotonic(), 결과)
+# 새 백테스트가 저장되면 전체 무효화
+BACKTEST_RESULTS_TTL_SECONDS = 10.0
+BACKTEST_RESULTS_CACHE_SIZE = 128
+_results_cache: Dict[Tuple[Optional[str], Optional[str], int], Tuple[float, List[Dict]]] = {}
+
 
 class BacktestingService:
     """백테스팅 서비스"""
@@ -305,6 +326,22 @@ class BacktestingService:
             'final_capital': round(final_capital, 2),
         }
 
+    async def _stream_frame(self, stmt, columns: List[str]) -> pd.DataFrame:
+        """
+        조회 결과를 STREAM_BATCH_SIZE 행 단위로 받아 DataFrame 생성
+
+        서버 사이드 커서로 읽어 전체 Row 리스트를 메모리에 쌓지 않음
+        (메모리: DataFrame + 배치 1개)
+        """
+        result = await self.db.stream(stmt.execution_options(yield_per=STREAM_BATCH_SIZE))
+        frames = [
+            pd.DataFrame.from_records(rows, columns=columns)
+            async for rows in result.partitions()
+        ]
+        if not frames:
+            return pd.DataFrame(columns=columns)
+        return pd.concat(frames, ignore_index=True)
+
     async def _fetch_price_data(
         self,
         ticker: str,
@@ -314,7 +351,7 @@ class BacktestingService:
     ) -> pd.DataFrame:
         """OHLCV 데이터 가져오기"""
         stmt = (
-            select(OHLCV)
+            select(*(getattr(OHLCV, col) for col in PRICE_COLUMNS))
             .where(OHLCV.ticker == ticker)
             .where(OHLCV.timeframe == timeframe)
             .where(OHLCV.timestamp >= start_date)
@@ -322,25 +359,7 @@ class BacktestingService:
             .order_by(OHLCV.timestamp)
         )
 
-        result = await self.db.execute(stmt)
-        candles = result.scalars().all()
-
-        if not candles:
-            return pd.DataFrame()
-
-        df = pd.DataFrame([
-            {
-                'timestamp': c.timestamp,
-                'open': c.open,
-                'high': c.high,
-                'low': c.low,
-                'close': c.close,
-                'volume': c.volume,
-            }
-            for c in candles
-        ])
-
-        return df
+        return await self._stream_frame(stmt, PRICE_COLUMNS)
 
     async def _fetch_indicators_data(
         self,
@@ -351,7 +370,7 @@ class BacktestingService:
     ) -> pd.DataFrame:
         """기술적 지표 데이터 가져오기"""
         stmt = (
-            select(TechnicalIndicator)
+            select(*(getattr(TechnicalIndicator, col) for col in INDICATOR_COLUMNS))
             .where(TechnicalIndicator.ticker == ticker)
             .where(TechnicalIndicator.timeframe == timeframe)
             .where(TechnicalIndicator.timestamp >= start_date)
@@ -359,35 +378,7 @@ class BacktestingService:
             .order_by(TechnicalIndicator.timestamp)
         )
 
-        result = await self.db.execute(stmt)
-        indicators = result.scalars().all()
-
-        if not indicators:
-            return pd.DataFrame()
-
-        df = pd.DataFrame([
-            {
-                'timestamp': i.timestamp,
-                'sma_10': i.sma_10,
-                'sma_20': i.sma_20,
-                'sma_50': i.sma_50,
-                'ema_10': i.ema_10,
-                'ema_20': i.ema_20,
-                'ema_50': i.ema_50,
-                'rsi_14': i.rsi_14,
-                'macd': i.macd,
-                'macd_signal': i.macd_signal,
-                'macd_histogram': i.macd_histogram,
-                'bb_upper': i.bb_upper,
-                'bb_middle': i.bb_middle,
-                'bb_lower': i.bb_lower,
-                'bb_percent': i.bb_percent,
-                'vwap': i.vwap,
-            }
-            for i in indicators
-        ])
-
-        return df
+        return await self._stream_frame(stmt, INDICATOR_COLUMNS)
 
     async def _save_backtest_result(
         self,
@@ -428,6 +419,9 @@ class BacktestingService:
             await self.db.commit()
             await self.db.refresh(backtest)
 
+            # 캐시된 결과 목록에 새 백테스트가 빠지지 않도록
+            _results_cache.clear()
+
             return backtest.id
 
         except Exception as e:
@@ -441,9 +435,29 @@ class BacktestingService:
         strategy_name: Optional[str] = None,
         limit: int = 10
     ) -> List[Dict]:
-        """백테스트 결과 조회"""
+        """백테스트 결과 조회 (같은 조건은 BACKTEST_RESULTS_TTL_SECONDS 동안 캐시 재사용)"""
+        key = (ticker, strategy_name, limit)
+        cached = _results_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < BACKTEST_RESULTS_TTL_SECONDS:
+            return cached[1]
+
         try:
-            stmt = select(BacktestResult).order_by(desc(BacktestResult.created_at)).limit(limit)
+            # 요약에 쓰는 컬럼만 로드 (trade_log / strategy_params JSON 역직렬화 생략)
+            stmt = select(BacktestResult).options(load_only(
+                BacktestResult.id,
+                BacktestResult.ticker,
+                BacktestResult.strategy_name,
+                BacktestResult.timeframe,
+                BacktestResult.start_date,
+                BacktestResult.end_date,
+                BacktestResult.total_return,
+                BacktestResult.sharpe_ratio,
+                BacktestResult.max_drawdown,
+                BacktestResult.win_rate,
+                BacktestResult.profit_factor,
+                BacktestResult.total_trades,
+                BacktestResult.created_at,
+            )).order_by(desc(BacktestResult.created_at)).limit(limit)
 
             if ticker:
                 stmt = stmt.where(BacktestResult.ticker == ticker)
@@ -453,7 +467,7 @@ class BacktestingService:
             result = await self.db.execute(stmt)
             backtests = result.scalars().all()
 
-            return [
+            results = [
                 {
                     "id": b.id,
                     "ticker": b.ticker,
@@ -476,6 +490,12 @@ class BacktestingService:
                 for b in backtests
             ]
 
+            # 가득 차면 가장 오래 저장된 항목부터 제거
+            if key not in _results_cache and len(_results_cache) >= BACKTEST_RESULTS_CACHE_SIZE:
+                del _results_cache[next(iter(_results_cache))]
+            _results_cache[key] = (time.monotonic(), results)
+            return results
+
         except Exception as e:
             logger.error(f"Failed to get backtest results: {e}")
             return []
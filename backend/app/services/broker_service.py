@@ -71,7 +71,7 @@ class BrokerService:
             self.token_created_at = None
 
     def refresh_token(self):
-        """Refresh access token (call every 22 hours)"""
+        """Refresh access token (shortly before it expires)"""
         if not self.api_key or not self.api_secret or not self.account_number:
             logger.warning("Cannot refresh token: API credentials not configured")
             return False
@@ -80,6 +80,13 @@ class BrokerService:
         self._initialize_broker()
         return self.broker is not None
 
+    @property
+    def token_expires_at(self) -> Optional[datetime]:
+        """Expiry of the current access token (None if the broker has no token)"""
+        if not self.broker:
+            return None
+        return self.broker.token_expired_at
+
     def needs_token_refresh(self) -> bool:
         """Check if token needs refresh (older than 22 hours)"""
         if not self.token_created_at:
@@ -165,6 +172,36 @@ class BrokerService:
             logger.error(f"Failed to fetch price for {ticker}: {e}")
             return None
 
+    async def get_fx_rate(self, base: str = "USD", quote: str = "KRW") -> Optional[float]:
+        """
+        Get the current exchange rate (units of quote per 1 base)
+
+        KIS has no standalone FX quote endpoint, so the Yahoo Finance
+        currency pair (e.g. USDKRW=X) is used.
+
+        Args:
+            base: Base currency code
+            quote: Quote currency code
+
+        Returns:
+            Exchange rate or None if failed
+        """
+        try:
+            import yfinance as yf
+
+            pair = f"{base}{quote}=X"
+            rate = await asyncio.to_thread(lambda: yf.Ticker(pair).fast_info["last_price"])
+
+            if rate and rate > 0:
+                logger.debug(f"FX rate {base}/{quote}: {rate}")
+                return float(rate)
+            logger.warning(f"Invalid FX rate for {base}/{quote}")
+            return None
+
+        except Exception as e:
+            logger.error(f"Failed to fetch FX rate {base}/{quote}: {e}")
+            return None
+
     async def place_us_order(
         self,
         ticker: str,
@@ -226,6 +263,8 @@ class BrokerService:
 
             if order_info['success']:
                 logger.info(f"Order placed successfully: {order_info['order_id']}")
+                from ..cache import invalidate_portfolio_state
+                invalidate_portfolio_state()
             else:
                 logger.error(f"Order failed: {order_info['message']}")
 
@@ -239,10 +278,14 @@ class BrokerService:
                 'timestamp': datetime.now().isoformat()
             }
 
-    async def get_us_positions(self) -> List[Dict]:
+    async def get_us_positions(self, balance_data: Optional[Dict] = None) -> List[Dict]:
         """
         Get all US stock positions
 
+        Args:
+            balance_data: Result of get_balance() to parse instead of querying
+                the broker again (it already carries every holding's quote)
+
         Returns:
             List of position dictionaries
         """
@@ -251,8 +294,9 @@ class BrokerService:
             return []
 
         try:
-            # Use new REST API implementation
-            balance_data = await self.broker.get_us_balance()
+            if balance_data is None:
+                # Use new REST API implementation
+                balance_data = await self.broker.get_us_balance()
 
             positions = []
             output = balance_data.get('positions', [])
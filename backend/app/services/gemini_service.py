@@ -8,10 +8,10 @@ import json
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 import google.generativeai as genai
-from google.generativeai.types import FunctionDeclaration, Tool, GenerateContentResponse
+from google.generativeai.types import Tool, GenerateContentResponse
 
 from ..config import Settings
-from ..gemini_functions import TRADING_FUNCTIONS, FunctionHandler
+from ..gemini_functions import TRADING_FUNCTIONS, TRADING_TOOL, FunctionHandler
 
 logger = logging.getLogger(__name__)
 
@@ -56,26 +56,13 @@ class GeminiService:
 
     def _create_tools(self) -> List[Tool]:
         """
-        Convert function definitions to Gemini Tool format
+        Get Gemini Tool objects for the trading functions
 
         Returns:
             List of Gemini Tool objects
         """
-        function_declarations = []
-
-        for func_def in TRADING_FUNCTIONS:
-            # Convert to Gemini FunctionDeclaration
-            declaration = FunctionDeclaration(
-                name=func_def["name"],
-                description=func_def["description"],
-                parameters=func_def["parameters"]
-            )
-            function_declarations.append(declaration)
-
-        tool = Tool(function_declarations=function_declarations)
-        logger.debug(f"Created {len(function_declarations)} function declarations for Gemini")
-
-        return [tool]
+        logger.debug(f"Using {len(TRADING_FUNCTIONS)} prebuilt function declarations for Gemini")
+        return [TRADING_TOOL]
 
     async def make_trading_decision(
         self,
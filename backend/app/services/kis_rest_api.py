@@ -9,6 +9,7 @@ import logging
 import hashlib
 import hmac
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import os
 from pathlib import Path
@@ -26,6 +27,10 @@ class KISRestAPI:
     REAL_BASE_URL = "https://openapi.koreainvestment.com:9443"  # 실전투자
     PAPER_BASE_URL = "https://openapivts.koreainvestment.com:29443"  # 모의투자
 
+    # Max REST calls in flight; bursts (e.g. market open) queue here instead of
+    # piling up executor threads and fresh TLS connections
+    MAX_CONCURRENT_REQUESTS = 10
+
     def __init__(self, app_key: str, app_secret: str, account_number: str, account_password: str = "", password_padding: bool = False, is_paper: bool = False):
         """
         Initialize KIS REST API client
@@ -69,6 +74,11 @@ class KISRestAPI:
             self.account_prefix = ""
             self.account_suffix = ""
 
+        # Shared keep-alive HTTP session and burst limiter for REST calls
+        self._http = requests.Session()
+        self._http.mount("https://", HTTPAdapter(pool_maxsize=self.MAX_CONCURRENT_REQUESTS))
+        self._request_slots = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+
         # Access token
         self.access_token = None
         self.token_expired_at = None
@@ -83,6 +93,28 @@ class KISRestAPI:
         logger.info(f"KIS API initialized (paper_mode={is_paper})")
         logger.info(f"Account: {self.account_prefix}-{self.account_suffix}")
 
+    async def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Run a blocking REST call in the default executor
+
+        At most MAX_CONCURRENT_REQUESTS calls run at once; the rest wait for
+        a slot. Connections are reused through the shared session.
+
+        Args:
+            method: HTTP method (GET, POST)
+            url: Request URL
+            **kwargs: Passed through to requests (headers, params, json)
+
+        Returns:
+            HTTP response
+        """
+        async with self._request_slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None,
+                lambda: self._http.request(method, url, **kwargs)
+            )
+
     def _get_headers(self, tr_id: str, content_type: str = "application/json; charset=utf-8") -> Dict:
         """
         Get request headers
@@ -252,11 +284,7 @@ class KISRestAPI:
         }
 
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: requests.get(url, headers=headers, params=params)
-            )
+            response = await self._request("GET", url, headers=headers, params=params)
             response.raise_for_status()
 
             result = response.json()
@@ -356,11 +384,7 @@ class KISRestAPI:
         }
 
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: requests.get(url, headers=headers, params=params)
-            )
+            response = await self._request("GET", url, headers=headers, params=params)
             response.raise_for_status()
 
             result = response.json()
@@ -507,11 +531,7 @@ class KISRestAPI:
         }
 
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: requests.get(url, headers=headers, params=params)
-            )
+            response = await self._request("GET", url, headers=headers, params=params)
             response.raise_for_status()
 
             result = response.json()
@@ -559,11 +579,7 @@ class KISRestAPI:
         }
 
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: requests.get(url, headers=headers, params=params)
-            )
+            response = await self._request("GET", url, headers=headers, params=params)
             response.raise_for_status()
 
             result = response.json()
@@ -647,11 +663,7 @@ class KISRestAPI:
         }
 
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: requests.post(url, headers=headers, json=data)
-            )
+            response = await self._request("POST", url, headers=headers, json=data)
             response.raise_for_status()
 
             result = response.json()
@@ -715,11 +727,7 @@ class KISRestAPI:
         }
 
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: requests.post(url, headers=headers, json=data)
-            )
+            response = await self._request("POST", url, headers=headers, json=data)
             response.raise_for_status()
 
             result = response.json()
@@ -22,6 +22,10 @@ from ..config import settings
 
 logger = logging.getLogger(__name__)
 
+# 실시간 체결가는 버퍼에 모아 배치 INSERT (크기 도달 또는 주기마다 flush)
+PRICE_FLUSH_SIZE = 5000
+PRICE_FLUSH_INTERVAL_SECONDS = 1.0
+
 
 class KISWebSocketService:
     """한국투자증권 WebSocket 서비스"""
@@ -33,6 +37,11 @@ class KISWebSocketService:
         self.subscriptions: Dict[str, List[str]] = {}  # {ticker: [tr_type1, tr_type2, ...]}
         self.callbacks: Dict[str, Callable] = {}  # {tr_type: callback_function}
 
+        # 체결가 배치 저장 버퍼 / flush 태스크, self.db 동시 사용 방지 락
+        self._price_buffer: List[Dict] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._db_lock = asyncio.Lock()
+
         # KIS WebSocket 설정
         self.ws_url = "ws://ops.koreainvestment.com:21000"  # 실제 URL은 KIS API 문서 참조
         self.app_key = getattr(settings, 'kis_websocket_app_key', None)
@@ -67,6 +76,9 @@ class KISWebSocketService:
             # 메시지 수신 루프 시작
             asyncio.create_task(self._receive_loop())
 
+            # 체결가 버퍼 주기적 flush
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
             return True
 
         except Exception as e:
@@ -75,6 +87,11 @@ class KISWebSocketService:
 
     async def disconnect(self):
         """WebSocket 연결 종료"""
+        if self._flush_task:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self.flush_prices()
+
         if self.ws:
             await self.ws.close()
             self.is_connected = False
@@ -297,25 +314,55 @@ class KISWebSocketService:
             volume = int(output.get('tvol', 0))  # 누적 거래량
             trade_volume = int(output.get('tamt_1', 0))  # 체결량
 
-            # DB 저장
-            price_data = RealtimePrice(
-                ticker=ticker,
-                current_price=current_price,
-                change_price=change_price,
-                change_rate=change_rate,
-                volume=volume,
-                trade_volume=trade_volume,
-                trade_time=datetime.now(),
-            )
-
-            self.db.add(price_data)
-            await self.db.commit()
+            # 버퍼에 추가 (DB 저장은 flush_prices에서 배치로)
+            self._price_buffer.append({
+                "ticker": ticker,
+                "current_price": current_price,
+                "change_price": change_price,
+                "change_rate": change_rate,
+                "volume": volume,
+                "trade_volume": trade_volume,
+                "trade_time": datetime.now(),
+            })
 
-            logger.debug(f"✓ Saved realtime price: {ticker} ${current_price}")
+            if len(self._price_buffer) >= PRICE_FLUSH_SIZE:
+                await self.flush_prices()
 
         except Exception as e:
             logger.error(f"Failed to handle realtime price: {e}")
-            await self.db.rollback()
+
+    async def flush_prices(self) -> int:
+        """
+        버퍼에 쌓인 체결가를 한 번의 INSERT로 저장
+
+        Returns:
+            저장된 행 수
+        """
+        if not self._price_buffer:
+            return 0
+
+        rows, self._price_buffer = self._price_buffer, []
+
+        async with self._db_lock:
+            try:
+                await self.db.execute(RealtimePrice.__table__.insert(), rows)
+                await self.db.commit()
+            except Exception as e:
+                logger.error(f"Failed to flush {len(rows)} realtime prices: {e}")
+                await self.db.rollback()
+                return 0
+
+        logger.debug(f"✓ Saved {len(rows)} realtime prices")
+        return len(rows)
+
+    async def _flush_loop(self):
+        """체결가 버퍼 주기적 flush 루프"""
+        try:
+            while True:
+                await asyncio.sleep(PRICE_FLUSH_INTERVAL_SECONDS)
+                await self.flush_prices()
+        except asyncio.CancelledError:
+            pass
 
     async def _handle_orderbook(self, data: Dict):
         """
@@ -330,23 +377,18 @@ class KISWebSocketService:
 
             ticker = output.get('rsym')
 
-            # 10호가 데이터 파싱
+            # 10호가 데이터 파싱 (index 0 = 1호가)
+            levels = range(1, 11)
             orderbook_data = {
                 "ticker": ticker,
+                "ask_prices": [float(output.get(f'askp{i}', 0)) for i in levels],
+                "ask_volumes": [int(output.get(f'askp_rsqn{i}', 0)) for i in levels],
+                "bid_prices": [float(output.get(f'bidp{i}', 0)) for i in levels],
+                "bid_volumes": [int(output.get(f'bidp_rsqn{i}', 0)) for i in levels],
                 "total_ask_volume": int(output.get('total_askp_rsqn', 0)),
                 "total_bid_volume": int(output.get('total_bidp_rsqn', 0)),
             }
 
-            # Ask (매도) 10호가
-            for i in range(1, 11):
-                orderbook_data[f"ask_price_{i}"] = float(output.get(f'askp{i}', 0))
-                orderbook_data[f"ask_volume_{i}"] = int(output.get(f'askp_rsqn{i}', 0))
-
-            # Bid (매수) 10호가
-            for i in range(1, 11):
-                orderbook_data[f"bid_price_{i}"] = float(output.get(f'bidp{i}', 0))
-                orderbook_data[f"bid_volume_{i}"] = int(output.get(f'bidp_rsqn{i}', 0))
-
             # Upsert (최신 데이터로 업데이트)
             stmt = insert(OrderBook).values(**orderbook_data)
             stmt = stmt.on_conflict_do_update(
@@ -354,14 +396,18 @@ class KISWebSocketService:
                 set_=orderbook_data
             )
 
-            await self.db.execute(stmt)
-            await self.db.commit()
+            async with self._db_lock:
+                try:
+                    await self.db.execute(stmt)
+                    await self.db.commit()
+                except Exception:
+                    await self.db.rollback()
+                    raise
 
             logger.debug(f"✓ Saved orderbook: {ticker}")
 
         except Exception as e:
             logger.error(f"Failed to handle orderbook: {e}")
-            await self.db.rollback()
 
     async def get_active_subscriptions(self) -> Dict[str, List[str]]:
         """
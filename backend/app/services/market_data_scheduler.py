@@ -155,7 +155,7 @@ class MarketDataScheduler:
             # Get portfolio state
             from ..dependencies import get_portfolio_manager
             try:
-                portfolio_manager = await get_portfolio_manager()
+                portfolio_manager = get_portfolio_manager()
                 portfolio_state = await portfolio_manager.get_current_state()
             except Exception as e:
                 logger.warning(f"[SCHEDULER] ⚠️ Could not get portfolio state: {e}")
@@ -17,7 +17,7 @@ import requests
 from bs4 import BeautifulSoup
 import yfinance as yf
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc
+from sqlalchemy import select, desc, insert
 import asyncio
 
 from ..models.news_event import NewsEvent
@@ -169,30 +169,32 @@ class NewsEventService:
         try:
             news_list = await self.get_recent_news_all_sources(ticker, hours=48)
 
-            stored_count = 0
-            for news in news_list:
-                # 중복 체크 (같은 제목, 같은 날짜)
-                existing = await self.db.execute(
-                    select(NewsEvent)
-                    .where(NewsEvent.ticker == ticker)
-                    .where(NewsEvent.title == news['title'])
-                )
-                if existing.scalar_one_or_none():
-                    continue
+            # 중복 체크 (같은 제목): 건별 SELECT 대신 한 번에 조회
+            existing = await self.db.execute(
+                select(NewsEvent.title)
+                .where(NewsEvent.ticker == ticker)
+                .where(NewsEvent.title.in_([news['title'] for news in news_list]))
+            )
+            existing_titles = set(existing.scalars().all())
 
-                # 저장
-                news_event = NewsEvent(
-                    ticker=ticker,
-                    event_type='news',
-                    title=news['title'],
-                    summary=news.get('summary'),
-                    url=news.get('url'),
-                    source=news.get('source'),
-                    published_at=news['published_at'],
-                )
+            rows = [
+                {
+                    'ticker': ticker,
+                    'event_type': 'news',
+                    'title': news['title'],
+                    'summary': news.get('summary'),
+                    'url': news.get('url'),
+                    'source': news.get('source'),
+                    'published_at': news['published_at'],
+                }
+                for news in news_list
+                if news['title'] not in existing_titles
+            ]
 
-                self.db.add(news_event)
-                stored_count += 1
+            # 저장 (executemany 한 번)
+            if rows:
+                await self.db.execute(insert(NewsEvent), rows)
+            stored_count = len(rows)
 
             await self.db.commit()
             logger.info(f"✓ Stored {stored_count} news items for {ticker}")
@@ -217,31 +219,34 @@ class NewsEventService:
             loop = asyncio.get_event_loop()
             filings = await loop.run_in_executor(None, self._fetch_sec_filings, ticker)
 
-            stored_count = 0
+            # 중복 체크 (같은 서류 종류 + 제출일): 한 번에 조회
+            existing = await self.db.execute(
+                select(NewsEvent.filing_type, NewsEvent.filing_date)
+                .where(NewsEvent.ticker == ticker)
+                .where(NewsEvent.filing_date.in_({filing['filing_date'] for filing in filings}))
+            )
+            seen = set(existing.tuples().all())
+
+            rows = []
             for filing in filings:
-                # 중복 체크
-                existing = await self.db.execute(
-                    select(NewsEvent)
-                    .where(NewsEvent.ticker == ticker)
-                    .where(NewsEvent.filing_type == filing['filing_type'])
-                    .where(NewsEvent.filing_date == filing['filing_date'])
-                )
-                if existing.scalar_one_or_none():
+                key = (filing['filing_type'], filing['filing_date'])
+                if key in seen:
                     continue
+                seen.add(key)
+                rows.append({
+                    'ticker': ticker,
+                    'event_type': 'sec_filing',
+                    'filing_type': filing['filing_type'],
+                    'title': filing['title'],
+                    'url': filing['url'],
+                    'filing_date': filing['filing_date'],
+                    'published_at': filing['filing_date'],
+                })
 
-                # 저장
-                news_event = NewsEvent(
-                    ticker=ticker,
-                    event_type='sec_filing',
-                    filing_type=filing['filing_type'],
-                    title=filing['title'],
-                    url=filing['url'],
-                    filing_date=filing['filing_date'],
-                    published_at=filing['filing_date'],
-                )
-
-                self.db.add(news_event)
-                stored_count += 1
+            # 저장 (executemany 한 번)
+            if rows:
+                await self.db.execute(insert(NewsEvent), rows)
+            stored_count = len(rows)
 
             await self.db.commit()
             logger.info(f"✓ Stored {stored_count} SEC filings for {ticker}")
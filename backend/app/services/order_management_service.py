@@ -8,12 +8,13 @@ Order Management Service
 """
 
 import logging
-import json
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
-from sqlalchemy import select, and_, or_
+from sqlalchemy import select, and_, or_, lambda_stmt
+from sqlalchemy.orm import load_only
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..cache import invalidate_portfolio_state
 from ..models.order import Order
 from ..models.portfolio_position import PortfolioPosition
 from .kis_rest_api import KISRestAPI
@@ -21,6 +22,13 @@ from .kis_rest_api import KISRestAPI
 logger = logging.getLogger(__name__)
 
 
+def _select_order_by_number(order_number: str):
+    """주문번호로 Order 조회 (lambda_stmt: 문장 구성/캐시 키 생성 생략, order_number는 바인드 파라미터)"""
+    stmt = lambda_stmt(lambda: select(Order))
+    stmt += lambda s: s.where(Order.order_number == order_number)
+    return stmt
+
+
 class OrderManagementService:
     """주문 관리 서비스"""
 
@@ -101,7 +109,7 @@ class OrderManagementService:
                 strategy_name=strategy_name,
                 signal_id=signal_id,
                 reason=reason,
-                broker_response=json.dumps(result),
+                broker_response=result,
                 risk_checked=True
             )
 
@@ -117,6 +125,7 @@ class OrderManagementService:
             await self.db.refresh(order)
 
             logger.info(f"✓ Order created: {order.order_number}")
+            invalidate_portfolio_state()
 
             return {
                 "success": True,
@@ -206,7 +215,7 @@ class OrderManagementService:
                 status="SUBMITTED",
                 strategy_name=strategy_name,
                 reason=reason,
-                broker_response=json.dumps(result),
+                broker_response=result,
                 risk_checked=True
             )
 
@@ -215,6 +224,7 @@ class OrderManagementService:
             await self.db.refresh(order)
 
             logger.info(f"✓ Order created: {order.order_number}")
+            invalidate_portfolio_state()
 
             return {
                 "success": True,
@@ -242,9 +252,7 @@ class OrderManagementService:
             주문 상태 정보
         """
         try:
-            result = await self.db.execute(
-                select(Order).where(Order.order_number == order_number)
-            )
+            result = await self.db.execute(_select_order_by_number(order_number))
             order = result.scalar_one_or_none()
 
             if not order:
@@ -262,7 +270,7 @@ class OrderManagementService:
                 "submitted_at": order.submitted_at.isoformat() if order.submitted_at else None,
                 "filled_at": order.filled_at.isoformat() if order.filled_at else None,
                 "is_active": order.is_active(),
-                "fill_rate": order.fill_rate()
+                "fill_rate": order.fill_rate
             }
 
         except Exception as e:
@@ -280,9 +288,7 @@ class OrderManagementService:
             활성 주문 리스트
         """
         try:
-            query = select(Order).where(
-                Order.status.in_(["SUBMITTED", "PENDING", "PARTIAL_FILLED"])
-            )
+            query = select(Order).where(Order.active_filter())
 
             if ticker:
                 query = query.where(Order.ticker == ticker)
@@ -326,7 +332,21 @@ class OrderManagementService:
             주문 히스토리
         """
         try:
-            query = select(Order)
+            # 히스토리 응답에 쓰는 컬럼만 로드 (broker_response 등 생략)
+            query = select(Order).options(load_only(
+                Order.id,
+                Order.order_number,
+                Order.ticker,
+                Order.order_type,
+                Order.order_quantity,
+                Order.filled_quantity,
+                Order.avg_filled_price,
+                Order.status,
+                Order.strategy_name,
+                Order.reason,
+                Order.submitted_at,
+                Order.filled_at,
+            ))
 
             if ticker:
                 query = query.where(Order.ticker == ticker)
@@ -380,9 +400,7 @@ class OrderManagementService:
             성공 여부
         """
         try:
-            result = await self.db.execute(
-                select(Order).where(Order.order_number == order_number)
-            )
+            result = await self.db.execute(_select_order_by_number(order_number))
             order = result.scalar_one_or_none()
 
             if not order:
@@ -482,54 +500,56 @@ class OrderManagementService:
             생성된 주문 리스트
         """
         try:
-            # 모든 포지션 조회
+            # 보유 종목 현재가 조회
             result = await self.db.execute(
-                select(PortfolioPosition).where(PortfolioPosition.quantity > 0)
+                select(PortfolioPosition.ticker).where(PortfolioPosition.quantity > 0)
             )
-            positions = result.scalars().all()
+            prices = {}
+            for ticker in result.scalars().all():
+                current_price = await self.kis_api.get_us_stock_price(ticker)
+                if current_price:
+                    prices[ticker] = current_price
+
+            # 메트릭 일괄 계산 및 저장
+            positions = await PortfolioPosition.recalc_all(self.db, prices)
 
             triggered_orders = []
 
             for position in positions:
-                # 현재가 업데이트
-                current_price = await self.kis_api.get_us_stock_price(position.ticker)
-                if not current_price:
-                    continue
-
-                position.calculate_metrics(current_price)
+                current_price = position['current_price']
 
                 # 손절 체크
-                if position.should_stop_loss():
-                    logger.warning(f"🚨 Stop loss triggered for {position.ticker}: ${current_price} <= ${position.stop_loss_price}")
+                if position['stop_loss_hit']:
+                    logger.warning(f"🚨 Stop loss triggered for {position['ticker']}: ${current_price} <= ${position['stop_loss_price']}")
 
                     order_result = await self.create_sell_order(
-                        ticker=position.ticker,
-                        quantity=position.quantity,
+                        ticker=position['ticker'],
+                        quantity=position['quantity'],
                         order_method="MARKET",
                         reason=f"Stop loss triggered at ${current_price}"
                     )
 
                     if order_result.get("success"):
                         triggered_orders.append({
-                            "ticker": position.ticker,
+                            "ticker": position['ticker'],
                             "type": "STOP_LOSS",
                             "order_number": order_result.get("order_number")
                         })
 
                 # 익절 체크
-                elif position.should_take_profit():
-                    logger.info(f"🎯 Take profit triggered for {position.ticker}: ${current_price} >= ${position.take_profit_price}")
+                elif position['take_profit_hit']:
+                    logger.info(f"🎯 Take profit triggered for {position['ticker']}: ${current_price} >= ${position['take_profit_price']}")
 
                     order_result = await self.create_sell_order(
-                        ticker=position.ticker,
-                        quantity=position.quantity,
+                        ticker=position['ticker'],
+                        quantity=position['quantity'],
                         order_method="MARKET",
                         reason=f"Take profit triggered at ${current_price}"
                     )
 
                     if order_result.get("success"):
                         triggered_orders.append({
-                            "ticker": position.ticker,
+                            "ticker": position['ticker'],
                             "type": "TAKE_PROFIT",
                             "order_number": order_result.get("order_number")
                         })
@@ -8,9 +8,9 @@ from typing import Dict, List, Optional
 from datetime import datetime, date
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc
-import json
+from sqlalchemy.dialects.sqlite import insert
 
-from ..models import PortfolioSnapshot
+from ..models import PortfolioSnapshot, PortfolioPosition
 from .broker_service import BrokerService
 from ..config import Settings
 
@@ -45,12 +45,9 @@ class PortfolioManager:
         # Load initial capital from database if available
         if self.db:
             try:
-                from ..models import RiskParameter
-                from sqlalchemy import select
+                from ..cache import get_risk_parameters
 
-                stmt = select(RiskParameter).limit(1)
-                result = await self.db.execute(stmt)
-                risk_param = result.scalar_one_or_none()
+                risk_param = await get_risk_parameters(self.db)
 
                 if risk_param and hasattr(risk_param, 'initial_capital_usd'):
                     self.initial_capital = risk_param.initial_capital_usd
@@ -95,8 +92,9 @@ class PortfolioManager:
                     'error': balance['error']
                 }
 
-            # Fetch positions
-            positions = await self.broker.get_us_positions()
+            # Positions (with current prices) come from the same balance
+            # inquiry, so parse them instead of a second broker round-trip
+            positions = await self.broker.get_us_positions(balance)
 
             # Calculate totals
             cash_balance = balance.get('cash_balance', 0)
@@ -240,39 +238,33 @@ class PortfolioManager:
             state = await self.get_current_state()
             today = date.today()
 
-            # Check if snapshot for today already exists
-            stmt = select(PortfolioSnapshot).where(PortfolioSnapshot.snapshot_date == today)
-            result = await self.db.execute(stmt)
-            existing = result.scalar_one_or_none()
-
-            holdings_json = json.dumps(state['positions'])
-
-            if existing:
-                # Update existing snapshot
-                existing.cash_balance = state['cash_balance']
-                existing.total_holdings_value = state['holdings_value']
-                existing.total_value = state['total_value']
-                existing.daily_pnl = state['daily_pnl']
-                existing.daily_pnl_pct = state['daily_pnl_pct']
-                existing.total_pnl = state['total_pnl']
-                existing.total_pnl_pct = state['total_pnl_pct']
-                existing.holdings_json = holdings_json
-                logger.info(f"Updated portfolio snapshot for {today}")
-            else:
-                # Create new snapshot
-                snapshot = PortfolioSnapshot(
-                    snapshot_date=today,
-                    cash_balance=state['cash_balance'],
-                    total_holdings_value=state['holdings_value'],
-                    total_value=state['total_value'],
-                    daily_pnl=state['daily_pnl'],
-                    daily_pnl_pct=state['daily_pnl_pct'],
-                    total_pnl=state['total_pnl'],
-                    total_pnl_pct=state['total_pnl_pct'],
-                    holdings_json=holdings_json
-                )
-                self.db.add(snapshot)
-                logger.info(f"Created portfolio snapshot for {today}")
+            # Refresh tracked position metrics with the same prices (one bulk UPDATE)
+            prices = {
+                pos['ticker']: pos['current_price']
+                for pos in state['positions'] if pos.get('current_price')
+            }
+            if prices:
+                await PortfolioPosition.recalc_all(self.db, prices)
+
+            # Upsert today's snapshot in one statement
+            snapshot = {
+                'snapshot_date': today,
+                'cash_balance': state['cash_balance'],
+                'total_holdings_value': state['holdings_value'],
+                'total_value': state['total_value'],
+                'daily_pnl': state['daily_pnl'],
+                'daily_pnl_pct': state['daily_pnl_pct'],
+                'total_pnl': state['total_pnl'],
+                'total_pnl_pct': state['total_pnl_pct'],
+                'holdings_json': state['positions'],
+            }
+            stmt = insert(PortfolioSnapshot).values(**snapshot)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['snapshot_date'],
+                set_=snapshot
+            )
+            await self.db.execute(stmt)
+            logger.info(f"Saved portfolio snapshot for {today}")
 
             await self.db.commit()
             return True
@@ -310,7 +302,7 @@ class PortfolioManager:
                     'daily_pnl_pct': snap.daily_pnl_pct,
                     'total_pnl': snap.total_pnl,
                     'total_pnl_pct': snap.total_pnl_pct,
-                    'holdings': json.loads(snap.holdings_json)
+                    'holdings': snap.holdings_json
                 }
                 for snap in snapshots
             ]
@@ -350,15 +342,19 @@ class PortfolioManager:
             logger.error(f"Failed to get start of day value: {e}")
             return None
 
-    async def calculate_position_exposure(self) -> Dict[str, float]:
+    async def calculate_position_exposure(self, state: Optional[Dict] = None) -> Dict[str, float]:
         """
         Calculate exposure percentage for each position
 
+        Args:
+            state: Result of get_current_state() if the caller already has it
+
         Returns:
             Dictionary mapping ticker to exposure percentage
         """
         try:
-            state = await self.get_current_state()
+            if state is None:
+                state = await self.get_current_state()
             total_value = state['total_value']
 
             if total_value == 0:
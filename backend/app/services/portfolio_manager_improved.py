@@ -9,7 +9,6 @@ from typing import Dict, List, Optional
 from datetime import datetime, date
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc
-import json
 
 from ..models import PortfolioSnapshot
 from .broker_service import BrokerService
@@ -265,7 +264,7 @@ class PortfolioManager:
                 daily_pnl_pct=state.get('daily_pnl_pct'),
                 total_pnl=state.get('total_pnl'),
                 total_pnl_pct=state.get('total_pnl_pct'),
-                holdings_json=json.dumps(state['positions'])
+                holdings_json=state['positions']
             )
 
             self.db.add(snapshot)
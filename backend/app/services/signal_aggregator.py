@@ -8,8 +8,7 @@ import asyncio
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
-import json
+from sqlalchemy import select, and_, lambda_stmt
 
 from ..models import Signal
 from .wsb_scraper import WSBScraper
@@ -39,6 +38,8 @@ class SignalAggregator:
             tipranks_service: TipRanks service instance
         """
         self.db = db
+        # Serializes I/O on self.db so DB work can be awaited alongside scraping
+        self._db_lock = asyncio.Lock()
         self.wsb_scraper = wsb_scraper or WSBScraper()
         self.yahoo_service = yahoo_service or YahooFinanceService()
         self.tipranks_service = tipranks_service or TipRanksService()
@@ -324,7 +325,7 @@ class SignalAggregator:
                     ticker=ticker,
                     source='WSB',
                     signal_type='SENTIMENT',
-                    signal_data=json.dumps(wsb),
+                    signal_data=wsb,
                     sentiment_score=wsb.get('sentiment', 0),
                     strength=wsb.get('popularity', 0),
                     expires_at=expires_at,
@@ -338,7 +339,7 @@ class SignalAggregator:
                     ticker=ticker,
                     source='YAHOO',
                     signal_type='TECHNICAL',
-                    signal_data=json.dumps(yahoo),
+                    signal_data=yahoo,
                     sentiment_score=(yahoo.get('technical_sentiment', 0) + yahoo.get('news_sentiment', 0)) / 2,
                     strength=yahoo.get('volume_surge', 1.0) / 2,
                     expires_at=expires_at,
@@ -352,7 +353,7 @@ class SignalAggregator:
                     ticker=ticker,
                     source='TIPRANKS',
                     signal_type='ANALYST_RATING',
-                    signal_data=json.dumps(tipranks),
+                    signal_data=tipranks,
                     sentiment_score=tipranks.get('consensus_score', 0),
                     strength=abs(tipranks.get('consensus_score', 0)),
                     expires_at=expires_at,
@@ -360,12 +361,14 @@ class SignalAggregator:
                 )
                 self.db.add(signal)
 
-            await self.db.commit()
+            async with self._db_lock:
+                await self.db.commit()
             logger.debug(f"Saved signals for {ticker}")
 
         except Exception as e:
             logger.error(f"Failed to save signals: {e}")
-            await self.db.rollback()
+            async with self._db_lock:
+                await self.db.rollback()
 
     async def get_recent_signals(self, ticker: str, hours_back: int = 24) -> List[Dict]:
         """
@@ -381,16 +384,18 @@ class SignalAggregator:
         try:
             cutoff_time = datetime.now() - timedelta(hours=hours_back)
 
-            stmt = select(Signal).where(
+            # lambda_stmt caches the built statement; ticker/cutoff_time become bound parameters
+            stmt = lambda_stmt(lambda: select(Signal).where(
                 and_(
                     Signal.ticker == ticker,
                     Signal.created_at >= cutoff_time,
                     Signal.is_active == True
                 )
-            ).order_by(Signal.created_at.desc())
+            ).order_by(Signal.created_at.desc()))
 
-            result = await self.db.execute(stmt)
-            signals = result.scalars().all()
+            async with self._db_lock:
+                result = await self.db.execute(stmt)
+                signals = result.scalars().all()
 
             return [
                 {
@@ -398,7 +403,7 @@ class SignalAggregator:
                     'ticker': sig.ticker,
                     'source': sig.source,
                     'type': sig.signal_type,
-                    'data': json.loads(sig.signal_data),
+                    'data': sig.signal_data,
                     'sentiment_score': sig.sentiment_score,
                     'strength': sig.strength,
                     'created_at': sig.created_at.isoformat()
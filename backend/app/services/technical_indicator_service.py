@@ -198,8 +198,9 @@ class TechnicalIndicatorService:
             OHLCV DataFrame
         """
         try:
+            # ORM 객체 대신 필요한 컬럼만 Row(튜플)로 조회
             stmt = (
-                select(OHLCV)
+                select(OHLCV.timestamp, OHLCV.open, OHLCV.high, OHLCV.low, OHLCV.close, OHLCV.volume)
                 .where(OHLCV.ticker == ticker)
                 .where(OHLCV.timeframe == timeframe)
                 .order_by(desc(OHLCV.timestamp))
@@ -207,7 +208,7 @@ class TechnicalIndicatorService:
             )
 
             result = await self.db.execute(stmt)
-            candles = result.scalars().all()
+            candles = result.all()
 
             if not candles:
                 return pd.DataFrame()
@@ -199,8 +199,8 @@ class TradingEngine:
                 response=response,
                 reasoning=decision_result.get('reasoning', ''),
                 confidence_score=decision_result.get('confidence_score', 0),
-                function_calls=json.dumps(decision_result.get('function_calls', [])),
-                signals_used=json.dumps([
+                function_calls=decision_result.get('function_calls', []),
+                signals_used=[
                     {
                         'ticker': s.get('ticker'),
                         'sentiment': s.get('composite_sentiment'),
@@ -208,13 +208,13 @@ class TradingEngine:
                         'recommendation': s.get('recommendation')
                     }
                     for s in signals
-                ]),
-                portfolio_state=json.dumps({
+                ],
+                portfolio_state={
                     'total_value': portfolio_state['total_value'],
                     'cash_balance': portfolio_state['cash_balance'],
                     'position_count': portfolio_state['position_count'],
                     'daily_pnl_pct': portfolio_state['daily_pnl_pct']
-                })
+                }
             )
 
             self.db.add(decision)
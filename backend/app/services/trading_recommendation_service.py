@@ -117,12 +117,9 @@ class TradingRecommendationService:
             if not db:
                 return None
 
-            from ..models import InvestmentPreference
-            from sqlalchemy import select
+            from ..cache import get_investment_preferences
 
-            stmt = select(InvestmentPreference).limit(1)
-            result = await db.execute(stmt)
-            prefs = result.scalar_one_or_none()
+            prefs = await get_investment_preferences(db)
 
             if prefs:
                 logger.info(f"[RECOMMEND] 💾 Loaded user preferences: {prefs.risk_appetite}, {prefs.investment_style}")
@@ -209,23 +206,19 @@ class TradingRecommendationService:
 
             # Preferred sectors
             if user_prefs.preferred_sectors:
-                sectors = user_prefs.preferred_sectors.split(',')
-                context += f"- 선호 섹터: {', '.join(filter(None, sectors))}\n"
+                context += f"- 선호 섹터: {', '.join(user_prefs.preferred_sectors)}\n"
 
             # Avoided sectors
             if user_prefs.avoided_sectors:
-                sectors = user_prefs.avoided_sectors.split(',')
-                context += f"- 회피 섹터: {', '.join(filter(None, sectors))}\n"
+                context += f"- 회피 섹터: {', '.join(user_prefs.avoided_sectors)}\n"
 
             # Preferred tickers
             if user_prefs.preferred_tickers:
-                tickers = user_prefs.preferred_tickers.split(',')
-                context += f"- 선호 종목: {', '.join(filter(None, tickers))}\n"
+                context += f"- 선호 종목: {', '.join(user_prefs.preferred_tickers)}\n"
 
             # Avoided tickers
             if user_prefs.avoided_tickers:
-                tickers = user_prefs.avoided_tickers.split(',')
-                context += f"- 회피 종목: {', '.join(filter(None, tickers))}\n"
+                context += f"- 회피 종목: {', '.join(user_prefs.avoided_tickers)}\n"
 
             # Strategy preferences
             if user_prefs.prefer_diversification:
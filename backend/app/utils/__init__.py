@@ -3,5 +3,6 @@ Utilities
 """
 
 from .logging_config import setup_logging, get_logger
+from .rate_limit import TokenBucketLimiter
 
-__all__ = ["setup_logging", "get_logger"]
+__all__ = ["setup_logging", "get_logger", "TokenBucketLimiter"]
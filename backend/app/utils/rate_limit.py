@@ -0,0 +1,58 @@
+"""
+Rate Limiting
+In-process token buckets for gating expensive endpoints (Gemini, broker)
+"""
+
+import time
+from typing import Dict, Tuple
+
+# Buckets kept before idle (fully refilled) ones are pruned
+MAX_TRACKED_KEYS = 1024
+
+
+class TokenBucketLimiter:
+    """
+    Token bucket per key (e.g. client IP)
+
+    Each key may burst up to `capacity` requests, then gets one more every
+    `per_seconds / capacity` seconds. State is per process, so with several
+    workers each enforces its own budget.
+    """
+
+    def __init__(self, capacity: int, per_seconds: float):
+        self.capacity = float(capacity)
+        self.refill_rate = capacity / per_seconds  # tokens per second
+        # key -> (tokens left, time.monotonic() of last update)
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+
+    def allow(self, key: str) -> bool:
+        """
+        Take one token for `key` if available
+
+        Args:
+            key: Caller identity (client IP, API key)
+
+        Returns:
+            True if the request may proceed, False if it should be rejected
+        """
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(key, (self.capacity, now))
+        tokens = min(self.capacity, tokens + (now - updated) * self.refill_rate)
+
+        allowed = tokens >= 1.0
+        if allowed:
+            tokens -= 1.0
+        self._buckets[key] = (tokens, now)
+
+        if len(self._buckets) > MAX_TRACKED_KEYS:
+            self._prune(now)
+        return allowed
+
+    def _prune(self, now: float):
+        """Forget buckets that have refilled completely (same as never seen)"""
+        full_after = self.capacity / self.refill_rate
+        self._buckets = {
+            key: (tokens, updated)
+            for key, (tokens, updated) in self._buckets.items()
+            if now - updated < full_after
+        }
@@ -0,0 +1,100 @@
+"""
+Database migration script to add query indexes to existing tables
+and drop single-column indexes made redundant by composite ones
+Run this script once to update the database schema
+(new databases get these indexes from the models via create_all)
+"""
+
+import asyncio
+import sqlite3
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.config import get_settings
+
+
+# index name -> CREATE INDEX statement
+INDEXES = {
+    'ix_trades_executed_at_id': (
+        'CREATE INDEX IF NOT EXISTS ix_trades_executed_at_id '
+        'ON trades (executed_at DESC, id DESC)'
+    ),
+    'ix_trades_status_ticker_executed': (
+        'CREATE INDEX IF NOT EXISTS ix_trades_status_ticker_executed '
+        'ON trades (status, ticker, executed_at)'
+    ),
+}
+
+# Indexes covered by a composite index, primary key or UNIQUE constraint;
+# both create_all (ix_*) and migrate_phase2/3 (idx_*) names are listed
+# (ohlcv is keyed by (ticker, timeframe, timestamp), see migrate_ohlcv_pk.py)
+REDUNDANT_INDEXES = [
+    'ix_ohlcv_ticker', 'ix_ohlcv_timeframe', 'ix_ohlcv_timestamp', 'ix_ohlcv_ticker_tf_ts',
+    'idx_ohlcv_ticker', 'idx_ohlcv_timeframe', 'idx_ohlcv_timestamp', 'idx_ohlcv_composite',
+    'ix_technical_indicators_ticker', 'ix_technical_indicators_timeframe',
+    'ix_technical_indicators_timestamp',
+    'idx_tech_ticker', 'idx_tech_timeframe', 'idx_tech_timestamp', 'idx_tech_composite',
+    # Replaced by ix_trades_status_ticker_executed when win/loss pairing moved back to a FIFO walk
+    'ix_trades_status_action_ticker_executed',
+    # Replaced by ix_trades_executed_at_id when history paging added id as a tie-breaker
+    'ix_trades_executed_at',
+]
+
+
+async def migrate_indexes():
+    """Create missing indexes and drop redundant ones"""
+
+    # Path to database
+    # 앱이 여는 DB 파일 (DATABASE_URL 기준); 다른 파일은 첫 번째 인자로 지정
+    db_path = Path(sys.argv[1]) if len(sys.argv) > 1 else get_settings().sqlite_db_path
+
+    if db_path is None:
+        print(f"❌ DATABASE_URL is not a SQLite file: {get_settings().database_url}")
+        return
+
+    if not db_path.exists():
+        print(f"❌ Database not found at {db_path}")
+        return
+
+    print(f"📂 Connecting to database: {db_path}")
+    conn = sqlite3.connect(str(db_path))
+    cursor = conn.cursor()
+
+    # Get existing indexes
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='index'")
+    existing_indexes = {row[0] for row in cursor.fetchall()}
+
+    created_count = 0
+    for index_name, sql in INDEXES.items():
+        if index_name in existing_indexes:
+            print(f"✓ Index {index_name} already exists")
+            continue
+        try:
+            print(f"➕ Creating index: {index_name}")
+            cursor.execute(sql)
+            created_count += 1
+        except sqlite3.OperationalError as e:
+            print(f"⚠️  Warning creating {index_name}: {e}")
+
+    dropped_count = 0
+    for index_name in REDUNDANT_INDEXES:
+        if index_name not in existing_indexes:
+            continue
+        print(f"➖ Dropping redundant index: {index_name}")
+        cursor.execute(f"DROP INDEX IF EXISTS {index_name}")
+        dropped_count += 1
+
+    conn.commit()
+    conn.close()
+
+    if created_count > 0 or dropped_count > 0:
+        print(f"\n✅ Successfully created {created_count} and dropped {dropped_count} indexes")
+    else:
+        print("\n✅ All indexes already exist, no changes needed")
+
+
+if __name__ == "__main__":
+    asyncio.run(migrate_indexes())
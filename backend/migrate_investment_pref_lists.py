@@ -0,0 +1,89 @@
+"""
+Investment Preference List Migration
+
+investment_preferences 의 섹터/종목 컬럼 저장 형식 변경:
+- preferred_sectors / avoided_sectors / preferred_tickers / avoided_tickers
+  쉼표 구분 문자열 ("AAPL,MSFT") → JSON 배열 (["AAPL", "MSFT"])
+"""
+
+import asyncio
+import json
+import sqlite3
+import sys
+from pathlib import Path
+import logging
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.config import get_settings
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+LIST_COLUMNS = ["preferred_sectors", "avoided_sectors", "preferred_tickers", "avoided_tickers"]
+
+
+def _to_json_list(value):
+    """쉼표 구분 문자열을 JSON 배열 문자열로 변환 (이미 JSON 배열이면 None)"""
+    if value is None:
+        return json.dumps([])
+    try:
+        if isinstance(json.loads(value), list):
+            return None
+    except ValueError:
+        pass
+    return json.dumps([item.strip() for item in value.split(",") if item.strip()])
+
+
+async def migrate():
+    """투자 선호도 리스트 컬럼 마이그레이션 실행"""
+
+    # 앱이 여는 DB 파일 (DATABASE_URL 기준); 다른 파일은 첫 번째 인자로 지정
+    db_path = Path(sys.argv[1]) if len(sys.argv) > 1 else get_settings().sqlite_db_path
+
+    if db_path is None:
+        logger.error(f"❌ DATABASE_URL is not a SQLite file: {get_settings().database_url}")
+        return
+
+    if not db_path.exists():
+        logger.error(f"❌ Database not found at {db_path}")
+        return
+
+    logger.info(f"🔧 투자 선호도 리스트 마이그레이션 시작: {db_path}")
+
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("PRAGMA table_info(investment_preferences)")
+        if not cursor.fetchall():
+            logger.info("✓ investment_preferences table does not exist, nothing to migrate")
+            return
+
+        cursor.execute(f"SELECT id, {', '.join(LIST_COLUMNS)} FROM investment_preferences")
+        converted = 0
+        for row in cursor.fetchall():
+            for column in LIST_COLUMNS:
+                value = _to_json_list(row[column])
+                if value is not None:
+                    conn.execute(
+                        f"UPDATE investment_preferences SET {column} = ? WHERE id = ?",
+                        (value, row["id"])
+                    )
+                    converted += 1
+
+        conn.commit()
+        logger.info(f"✅ 투자 선호도 리스트 마이그레이션 완료! ({converted} values converted)")
+
+    except Exception as e:
+        logger.error(f"❌ Migration failed: {e}")
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(migrate())
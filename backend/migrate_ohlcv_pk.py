@@ -0,0 +1,99 @@
+"""
+OHLCV Primary Key Migration
+
+ohlcv 테이블 구조 변경:
+- 대리키 id 제거 → 기본키 (ticker, timeframe, timestamp)
+- WITHOUT ROWID: 행이 기본키 순서대로 저장되어 종목/타임프레임별 최근 캔들 조회가
+  연속 페이지만 읽음 (ix_ohlcv_ticker_tf_ts 인덱스 불필요)
+"""
+
+import asyncio
+import sqlite3
+import sys
+from pathlib import Path
+import logging
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.config import get_settings
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+COLUMNS = "ticker, timeframe, open, high, low, close, volume, trade_count, vwap, timestamp, created_at"
+
+
+async def migrate():
+    """OHLCV 기본키 마이그레이션 실행"""
+
+    # 앱이 여는 DB 파일 (DATABASE_URL 기준); 다른 파일은 첫 번째 인자로 지정
+    db_path = Path(sys.argv[1]) if len(sys.argv) > 1 else get_settings().sqlite_db_path
+
+    if db_path is None:
+        logger.error(f"❌ DATABASE_URL is not a SQLite file: {get_settings().database_url}")
+        return
+
+    if not db_path.exists():
+        logger.error(f"❌ Database not found at {db_path}")
+        return
+
+    logger.info(f"🔧 OHLCV 기본키 마이그레이션 시작: {db_path}")
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("PRAGMA table_info(ohlcv)")
+        columns = {row[1] for row in cursor.fetchall()}
+
+        if not columns:
+            logger.info("✓ ohlcv table does not exist, nothing to migrate")
+            return
+        if "id" not in columns:
+            logger.info("✓ ohlcv already keyed by (ticker, timeframe, timestamp)")
+            return
+
+        logger.info("📊 Creating new ohlcv table...")
+        cursor.execute("""
+            CREATE TABLE ohlcv_new (
+                ticker VARCHAR NOT NULL,
+                timeframe VARCHAR NOT NULL,
+                open FLOAT NOT NULL,
+                high FLOAT NOT NULL,
+                low FLOAT NOT NULL,
+                close FLOAT NOT NULL,
+                volume BIGINT NOT NULL,
+                trade_count INTEGER,
+                vwap FLOAT,
+                timestamp TIMESTAMP NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (ticker, timeframe, timestamp)
+            ) WITHOUT ROWID
+        """)
+
+        # 같은 캔들이 중복 저장된 경우 나중에 저장된 행(id가 큰 행)을 유지
+        logger.info("📦 Copying candles...")
+        cursor.execute(f"""
+            INSERT OR REPLACE INTO ohlcv_new ({COLUMNS})
+            SELECT {COLUMNS} FROM ohlcv ORDER BY id
+        """)
+        logger.info(f"✓ {cursor.rowcount} rows copied")
+
+        # 기존 테이블의 인덱스도 함께 삭제됨
+        cursor.execute("DROP TABLE ohlcv")
+        cursor.execute("ALTER TABLE ohlcv_new RENAME TO ohlcv")
+
+        conn.commit()
+        logger.info("✅ OHLCV 기본키 마이그레이션 완료!")
+
+    except Exception as e:
+        logger.error(f"❌ Migration failed: {e}")
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(migrate())
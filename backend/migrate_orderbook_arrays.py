@@ -0,0 +1,129 @@
+"""
+OrderBook Array Migration
+
+order_books 테이블 구조 변경:
+- ask_price_1..10 / ask_volume_1..10 / bid_price_1..10 / bid_volume_1..10 (40개 컬럼)
+  → ask_prices / ask_volumes / bid_prices / bid_volumes (JSON 배열 4개)
+- ticker UNIQUE (종목당 최신 호가 1행, upsert 키)
+"""
+
+import asyncio
+import json
+import sqlite3
+import sys
+from pathlib import Path
+import logging
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.config import get_settings
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+LEVELS = range(1, 11)
+
+
+async def migrate():
+    """OrderBook 배열 마이그레이션 실행"""
+
+    # 앱이 여는 DB 파일 (DATABASE_URL 기준); 다른 파일은 첫 번째 인자로 지정
+    db_path = Path(sys.argv[1]) if len(sys.argv) > 1 else get_settings().sqlite_db_path
+
+    if db_path is None:
+        logger.error(f"❌ DATABASE_URL is not a SQLite file: {get_settings().database_url}")
+        return
+
+    if not db_path.exists():
+        logger.error(f"❌ Database not found at {db_path}")
+        return
+
+    logger.info(f"🔧 OrderBook 배열 마이그레이션 시작: {db_path}")
+
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("PRAGMA table_info(order_books)")
+        columns = {row["name"] for row in cursor.fetchall()}
+
+        if not columns:
+            logger.info("✓ order_books table does not exist, nothing to migrate")
+            return
+        if "ask_prices" in columns:
+            logger.info("✓ order_books already uses array columns")
+            return
+
+        logger.info("📊 Creating new order_books table...")
+        cursor.execute("""
+            CREATE TABLE order_books_new (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                ticker VARCHAR NOT NULL UNIQUE,
+                ask_prices JSON,
+                ask_volumes JSON,
+                bid_prices JSON,
+                bid_volumes JSON,
+                total_ask_volume BIGINT,
+                total_bid_volume BIGINT,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+        # 종목별 최신 행만 유지 (ticker UNIQUE)
+        cursor.execute("""
+            SELECT * FROM order_books
+            WHERE id IN (
+                SELECT id FROM order_books AS o
+                WHERE o.updated_at = (
+                    SELECT MAX(updated_at) FROM order_books WHERE ticker = o.ticker
+                )
+            )
+            ORDER BY updated_at
+        """)
+        rows = cursor.fetchall()
+
+        logger.info(f"📦 Packing {len(rows)} order book rows...")
+        cursor.executemany(
+            """
+            INSERT OR REPLACE INTO order_books_new
+                (ticker, ask_prices, ask_volumes, bid_prices, bid_volumes,
+                 total_ask_volume, total_bid_volume, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    row["ticker"],
+                    json.dumps([row[f"ask_price_{i}"] for i in LEVELS]),
+                    json.dumps([row[f"ask_volume_{i}"] for i in LEVELS]),
+                    json.dumps([row[f"bid_price_{i}"] for i in LEVELS]),
+                    json.dumps([row[f"bid_volume_{i}"] for i in LEVELS]),
+                    row["total_ask_volume"],
+                    row["total_bid_volume"],
+                    row["updated_at"],
+                )
+                for row in rows
+            ]
+        )
+
+        cursor.execute("DROP TABLE order_books")
+        cursor.execute("ALTER TABLE order_books_new RENAME TO order_books")
+
+        logger.info("📇 Creating indexes...")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_orderbook_ticker ON order_books(ticker)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_orderbook_updated ON order_books(updated_at DESC)")
+
+        conn.commit()
+        logger.info("✅ OrderBook 배열 마이그레이션 완료!")
+
+    except Exception as e:
+        logger.error(f"❌ Migration failed: {e}")
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(migrate())
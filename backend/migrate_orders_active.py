@@ -0,0 +1,82 @@
+"""
+Orders Active Index Migration
+
+orders 테이블 변경:
+- fill_rate: 체결률 generated column 추가
+- ix_orders_active: 활성 주문(SUBMITTED/PENDING/PARTIAL_FILLED)만 담는 부분 인덱스
+"""
+
+import asyncio
+import sqlite3
+import sys
+from pathlib import Path
+import logging
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.config import get_settings
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def migrate():
+    """orders 활성 인덱스 마이그레이션 실행"""
+
+    # 앱이 여는 DB 파일 (DATABASE_URL 기준); 다른 파일은 첫 번째 인자로 지정
+    db_path = Path(sys.argv[1]) if len(sys.argv) > 1 else get_settings().sqlite_db_path
+
+    if db_path is None:
+        logger.error(f"❌ DATABASE_URL is not a SQLite file: {get_settings().database_url}")
+        return
+
+    if not db_path.exists():
+        logger.error(f"❌ Database not found at {db_path}")
+        return
+
+    logger.info(f"🔧 orders 활성 인덱스 마이그레이션 시작: {db_path}")
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        # generated column은 table_xinfo에만 표시됨
+        cursor.execute("PRAGMA table_xinfo(orders)")
+        columns = {row[1] for row in cursor.fetchall()}
+
+        if not columns:
+            logger.info("✓ orders table does not exist, nothing to migrate")
+            return
+
+        if "fill_rate" in columns:
+            logger.info("✓ Column fill_rate already exists")
+        else:
+            # ALTER TABLE로는 VIRTUAL만 추가 가능 (새 DB는 create_all로 STORED)
+            logger.info("➕ Adding column: fill_rate")
+            cursor.execute("""
+                ALTER TABLE orders ADD COLUMN fill_rate FLOAT GENERATED ALWAYS AS (
+                    CASE WHEN order_quantity = 0 THEN 0.0
+                    ELSE CAST(COALESCE(filled_quantity, 0) AS FLOAT) / order_quantity END
+                ) VIRTUAL
+            """)
+
+        logger.info("📇 Creating index: ix_orders_active")
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS ix_orders_active ON orders (submitted_at DESC)
+            WHERE status IN ('SUBMITTED', 'PENDING', 'PARTIAL_FILLED')
+        """)
+
+        conn.commit()
+        logger.info("✅ orders 활성 인덱스 마이그레이션 완료!")
+
+    except Exception as e:
+        logger.error(f"❌ Migration failed: {e}")
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(migrate())
@@ -54,27 +54,11 @@ async def migrate():
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS order_books (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
-                ticker VARCHAR NOT NULL,
-                ask_price_1 FLOAT, ask_volume_1 BIGINT,
-                ask_price_2 FLOAT, ask_volume_2 BIGINT,
-                ask_price_3 FLOAT, ask_volume_3 BIGINT,
-                ask_price_4 FLOAT, ask_volume_4 BIGINT,
-                ask_price_5 FLOAT, ask_volume_5 BIGINT,
-                ask_price_6 FLOAT, ask_volume_6 BIGINT,
-                ask_price_7 FLOAT, ask_volume_7 BIGINT,
-                ask_price_8 FLOAT, ask_volume_8 BIGINT,
-                ask_price_9 FLOAT, ask_volume_9 BIGINT,
-                ask_price_10 FLOAT, ask_volume_10 BIGINT,
-                bid_price_1 FLOAT, bid_volume_1 BIGINT,
-                bid_price_2 FLOAT, bid_volume_2 BIGINT,
-                bid_price_3 FLOAT, bid_volume_3 BIGINT,
-                bid_price_4 FLOAT, bid_volume_4 BIGINT,
-                bid_price_5 FLOAT, bid_volume_5 BIGINT,
-                bid_price_6 FLOAT, bid_volume_6 BIGINT,
-                bid_price_7 FLOAT, bid_volume_7 BIGINT,
-                bid_price_8 FLOAT, bid_volume_8 BIGINT,
-                bid_price_9 FLOAT, bid_volume_9 BIGINT,
-                bid_price_10 FLOAT, bid_volume_10 BIGINT,
+                ticker VARCHAR NOT NULL UNIQUE,
+                ask_prices JSON,
+                ask_volumes JSON,
+                bid_prices JSON,
+                bid_volumes JSON,
                 total_ask_volume BIGINT,
                 total_bid_volume BIGINT,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
@@ -86,7 +70,6 @@ async def migrate():
         logger.info("📈 Creating ohlcv table...")
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS ohlcv (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
                 ticker VARCHAR NOT NULL,
                 timeframe VARCHAR NOT NULL,
                 open FLOAT NOT NULL,
@@ -97,8 +80,9 @@ async def migrate():
                 trade_count INTEGER,
                 vwap FLOAT,
                 timestamp TIMESTAMP NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (ticker, timeframe, timestamp)
+            ) WITHOUT ROWID
         """)
         logger.info("✅ ohlcv table created")
 
@@ -113,11 +97,7 @@ async def migrate():
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_orderbook_ticker ON order_books(ticker)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_orderbook_updated ON order_books(updated_at DESC)")
 
-        # ohlcv indexes
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_ohlcv_ticker ON ohlcv(ticker)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_ohlcv_timeframe ON ohlcv(timeframe)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_ohlcv_timestamp ON ohlcv(timestamp DESC)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_ohlcv_composite ON ohlcv(ticker, timeframe, timestamp DESC)")
+        # ohlcv: 기본키 (ticker, timeframe, timestamp)로 조회, 별도 인덱스 없음
 
         logger.info("✅ Indexes created")
 
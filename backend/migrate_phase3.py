@@ -70,13 +70,7 @@ async def migrate():
         """)
         logger.info("✅ technical_indicators table created")
 
-        # 인덱스 생성
-        logger.info("📇 Creating indexes...")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_tech_ticker ON technical_indicators(ticker)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_tech_timeframe ON technical_indicators(timeframe)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_tech_timestamp ON technical_indicators(timestamp DESC)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_tech_composite ON technical_indicators(ticker, timeframe, timestamp DESC)")
-        logger.info("✅ Indexes created")
+        # 별도 인덱스 없음: (ticker, timeframe, timestamp) 조회는 UNIQUE 제약의 인덱스가 처리
 
         conn.commit()
         logger.info("✅ Phase 3 마이그레이션 완료!")
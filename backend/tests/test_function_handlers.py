@@ -0,0 +1,105 @@
+"""
+Test Gemini Function Handlers
+Trade history queries against an in-memory SQLite database
+"""
+
+import asyncio
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.database import Base
+from app.gemini_functions.function_handlers import FunctionHandler
+from app.models import Trade
+
+
+async def _run_with_trades(trades, check):
+    """Load trades into a fresh database and run check(handler)"""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    try:
+        async with session_factory() as db:
+            db.add_all(trades)
+            await db.commit()
+            handler = FunctionHandler(None, None, None, None, db)
+            return await check(handler)
+    finally:
+        await engine.dispose()
+
+
+def _trade(n, ticker, action, price, executed_at, status='FILLED'):
+    return Trade(
+        trade_id=f"T{n}",
+        ticker=ticker,
+        action=action,
+        quantity=1,
+        price=price,
+        total_value=price,
+        status=status,
+        executed_at=executed_at
+    )
+
+
+def test_count_wins_losses_skips_sell_before_any_buy():
+    """A SELL of a position opened before the window must not shift later pairs"""
+    start = datetime.now() - timedelta(days=1)
+    trades = [
+        _trade(1, 'AAPL', 'SELL', 90.0, start),
+        _trade(2, 'AAPL', 'BUY', 100.0, start + timedelta(minutes=1)),
+        _trade(3, 'AAPL', 'SELL', 120.0, start + timedelta(minutes=2)),
+    ]
+
+    async def check(handler):
+        return await handler._count_wins_losses(start - timedelta(hours=1))
+
+    assert asyncio.run(_run_with_trades(trades, check)) == (1, 0)
+
+
+def test_count_wins_losses_pairs_fifo_per_ticker():
+    """Each SELL closes the oldest open BUY of its own ticker; unfilled trades are ignored"""
+    start = datetime.now() - timedelta(days=1)
+    trades = [
+        _trade(1, 'AAPL', 'BUY', 100.0, start),
+        _trade(2, 'AAPL', 'BUY', 150.0, start + timedelta(minutes=1)),
+        _trade(3, 'TSLA', 'BUY', 200.0, start + timedelta(minutes=2)),
+        _trade(4, 'AAPL', 'SELL', 120.0, start + timedelta(minutes=3)),  # vs 100: win
+        _trade(5, 'TSLA', 'SELL', 180.0, start + timedelta(minutes=4)),  # vs 200: loss
+        _trade(6, 'AAPL', 'SELL', 140.0, start + timedelta(minutes=5), status='CANCELLED'),
+        _trade(7, 'AAPL', 'SELL', 140.0, start + timedelta(minutes=6)),  # vs 150: loss
+    ]
+
+    async def check(handler):
+        return await handler._count_wins_losses(start - timedelta(hours=1))
+
+    assert asyncio.run(_run_with_trades(trades, check)) == (1, 2)
+
+
+def test_trading_history_pages_across_tied_timestamps():
+    """Paging returns every trade once, even when a page ends inside a run of equal timestamps"""
+    start = datetime.now() - timedelta(hours=1)
+    times = [start] * 4 + [start - timedelta(minutes=1)] * 2 + [start - timedelta(minutes=2)]
+    trades = [_trade(n, 'AAPL', 'BUY', 100.0, executed_at) for n, executed_at in enumerate(times)]
+
+    async def check(handler):
+        seen = []
+        cursor = None
+        while True:
+            page = await handler.get_trading_history(days_back=1, cursor=cursor, page_size=2)
+            assert page["success"]
+            assert page["total_trades"] == len(times)
+            seen.extend(trade["trade_id"] for trade in page["trades"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                return seen
+
+    seen = asyncio.run(_run_with_trades(trades, check))
+    assert sorted(seen) == sorted(f"T{n}" for n in range(len(times)))
+    assert len(seen) == len(set(seen))
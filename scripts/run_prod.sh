@@ -40,7 +40,7 @@ cd backend
 source venv/bin/activate
 
 # Run with multiple workers
-uvicorn app.main:app --host 0.0.0.0 --port 8000 --workers 2 &
+uvicorn app.main:app --host 0.0.0.0 --port 8000 --workers 2 --loop uvloop --http httptools &
 SERVER_PID=$!
 
 cd "$PROJECT_ROOT"